@@ -10,7 +10,12 @@ Re-encode mode (default) is frame-accurate and normalizes codec/resolution/fps
 across clips so the concat is always safe; --copy is faster but requires
 keyframe-aligned cut points and identical source parameters.
 
-Usage:   cut-from-edl.py [--execute] [--copy] [-o OUT] [--workdir DIR] [--json] <edl.json>
+--jobs N runs up to N segment cuts at once, each encoder capped at
+cores/N threads so the machine stays near its core count; concat order is the
+EDL order regardless of which cut finishes first, and the first failed cut
+stops the rest (running encodes are terminated, their partial segments removed).
+
+Usage:   cut-from-edl.py [--execute] [--copy] [--jobs N] [-o OUT] [--workdir DIR] [--json] <edl.json>
 Input:   EDL JSON as positional; clip paths resolve relative to the EDL's directory
 Output:  stdout = planned/executed command list (or --json envelope,
          schema claude-mods.ffmpeg-ops.edl/v1)
@@ -22,14 +27,18 @@ Examples:
   cut-from-edl.py edit.json                          # dry-run: show the plan
   cut-from-edl.py edit.json --execute -o final.mp4
   cut-from-edl.py edit.json --execute --copy         # keyframe-aligned EDLs only
+  cut-from-edl.py edit.json --execute --jobs 4       # 4 cuts at a time
   cut-from-edl.py edit.json --json | jq '.data.commands'
 """
 
 import argparse
 import json
+import os
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import NoReturn
 
@@ -93,6 +102,60 @@ def video_props(ffprobe: str, path: Path) -> dict:
     return {}
 
 
+class CutFailed(Exception):
+    """A segment cut exited non-zero: (segment number, last stderr line)."""
+
+
+def run_cuts(commands: list, jobs: int) -> None:
+    """Run the per-segment ffmpeg commands, up to `jobs` at once.
+
+    Threads are enough: each one only waits on its ffmpeg child. The first
+    failure sets `stop` so queued cuts never start, terminates the ones
+    still running and removes their partial segments, then raises CutFailed.
+    """
+    stop = threading.Event()
+    lock = threading.Lock()
+    running = {}  # segment number -> Popen
+
+    def cut(n: int, cmd: list) -> None:
+        with lock:
+            if stop.is_set():
+                return
+            print(f"cutting segment {n}/{len(commands)}...", file=sys.stderr)
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE, text=True)
+            running[n] = proc
+        _, stderr = proc.communicate()
+        with lock:
+            del running[n]
+            first = proc.returncode != 0 and not stop.is_set()
+            if first:
+                stop.set()  # before this worker can pick up the next cut
+        if first:
+            raise CutFailed(n, (stderr.strip().splitlines() or ["?"])[-1])
+
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    futures = [pool.submit(cut, n, cmd) for n, cmd in enumerate(commands, 1)]
+    try:
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for f in done:
+            if f.exception():
+                raise f.exception()
+    except BaseException:  # a failed cut, or Ctrl-C: stop the rest cleanly
+        with lock:
+            stop.set()
+            killed = list(running.items())
+        for _, proc in killed:
+            proc.terminate()
+        for f in futures:
+            f.cancel()
+        pool.shutdown(wait=True)
+        for n, _ in killed:
+            Path(commands[n - 1][-1]).unlink(missing_ok=True)
+        raise
+    pool.shutdown(wait=True)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(
         description="Cut + concat a final video from an EDL JSON (dry-run by default).",
@@ -111,8 +174,13 @@ def main() -> int:
                          "EDL 'output' field resolved against the EDL file, else final.mp4)")
     ap.add_argument("--workdir", default=None,
                     help="directory for cut segments (default: <edl-dir>/edl-cuts)")
+    ap.add_argument("--jobs", type=int, default=1, metavar="N",
+                    help="run up to N segment cuts at once; each encode gets "
+                         "cores/N threads (default: 1, one cut at a time)")
     ap.add_argument("--json", action="store_true", help="emit JSON envelope on stdout")
     args = ap.parse_args()
+    if args.jobs < 1:
+        err(args.json, "USAGE", f"--jobs must be >= 1 (got {args.jobs})", EXIT_USAGE)
 
     edl_path = Path(args.edl)
     if not edl_path.is_file():
@@ -180,6 +248,11 @@ def main() -> int:
             norm_filter = (f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
                            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,fps={fps}")
 
+    # N concurrent encoders each spawning a thread per core would oversubscribe
+    # the machine N-fold; split the cores between them instead.
+    jobs = min(args.jobs, len(clips))
+    threads = max(1, (os.cpu_count() or 1) // jobs) if jobs > 1 and not args.copy else None
+
     commands, concat_lines = [], []
     for n, clip in enumerate(clips, 1):
         seg = workdir / f"seg{n:03d}.mp4"
@@ -193,6 +266,8 @@ def main() -> int:
             cmd += ["-c:v", "libx264", "-crf", "18", "-preset", "fast",
                     "-pix_fmt", "yuv420p", "-c:a", "aac", "-b:a", "192k",
                     "-ar", "48000"]
+            if threads:
+                cmd += ["-threads", str(threads)]
         cmd.append(str(seg))
         commands.append(cmd)
         concat_lines.append(f"file '{seg.as_posix()}'")
@@ -205,6 +280,7 @@ def main() -> int:
         "edl": str(edl_path), "mode": "copy" if args.copy else "reencode",
         "executed": bool(args.execute), "workdir": str(workdir),
         "output": str(output), "segments": len(clips),
+        "jobs": jobs, "threads_per_job": threads,
         "missing_sources": missing,
         "commands": [" ".join(c) for c in commands] + [" ".join(final_cmd)],
     }
@@ -222,13 +298,11 @@ def main() -> int:
         return EXIT_OK
 
     workdir.mkdir(parents=True, exist_ok=True)
-    for n, cmd in enumerate(commands, 1):
-        print(f"cutting segment {n}/{len(commands)}...", file=sys.stderr)
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode != 0:
-            err(args.json, "VALIDATION",
-                f"segment {n} failed: {(proc.stderr.strip().splitlines() or ['?'])[-1]}",
-                EXIT_VALIDATION)
+    try:
+        run_cuts(commands, jobs)
+    except CutFailed as e:
+        n, last = e.args
+        err(args.json, "VALIDATION", f"segment {n} failed: {last}", EXIT_VALIDATION)
     concat_txt.write_text("\n".join(concat_lines) + "\n", encoding="utf-8")
 
     # Atomic final write: concat to a temp name, then rename over the
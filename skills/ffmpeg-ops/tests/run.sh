@@ -89,6 +89,11 @@ out="$("$PYTHON" "$S/cut-from-edl.py" "$SB/edit.json" 2>/dev/null)"; rc=$?
 expect_exit "dry-run with absent sources -> 0" 0 "$rc"
 expect_has  "dry-run prints ffmpeg commands" "ffmpeg" "$out"
 expect_has  "dry-run includes concat step" "concat" "$out"
+printf '{"scenes":[{"scene":1,"clips":[{"file":"takes/a.mp4","start":1,"end":2},{"file":"takes/a.mp4","start":3,"end":4}]}]}' > "$SB/two.json"
+out="$("$PYTHON" "$S/cut-from-edl.py" "$SB/two.json" --jobs 2 --json 2>/dev/null)"
+expect_has  "--jobs 2 splits the cores between encodes" "-threads" "$out"
+expect_has  "--jobs reported in the envelope" '"jobs": 2' "$out"
+"$PYTHON" "$S/cut-from-edl.py" "$SB/two.json" --jobs 0 >/dev/null 2>&1; expect_exit "--jobs 0 -> 2" 2 $?
 
 # ── structural: pure-python LUT generation ───────────────────────────────────
 echo "-- gen-luts --"
@@ -197,6 +202,22 @@ else
   "$PYTHON" -c "import sys; d=float(sys.argv[1]); sys.exit(0 if 1.0 < d < 1.9 else 1)" "${dur:-0}" \
     && ok "EDL output duration ~1.4s (got ${dur}s)" || no "EDL output duration (got ${dur}s)"
 
+  # --jobs: same output from concurrent cuts; one bad clip fails the run
+  "$PYTHON" "$S/cut-from-edl.py" "$SB/cutme.json" --execute --jobs 2 -o "$SB/final-j2.mp4" >/dev/null 2>&1
+  expect_exit "cut-from-edl --execute --jobs 2 -> 0" 0 $?
+  dur2="$(ffprobe -v error -show_entries format=duration -of default=nw=1:nk=1 "$SB/final-j2.mp4" 2>/dev/null)"
+  [[ -n "$dur2" && "$dur2" == "$dur" ]] && ok "--jobs 2 output duration matches serial (${dur2}s)" \
+    || no "--jobs 2 output duration matches serial (got ${dur2}s vs ${dur}s)"
+  grep -c . "$SB/edl-cuts/concat.txt" | grep -qx 2 && \
+    [[ "$(head -1 "$SB/edl-cuts/concat.txt")" == *seg001.mp4* ]] \
+    && ok "concat.txt keeps EDL order" || no "concat.txt keeps EDL order"
+  printf 'not media' > "$SB/broken.mp4"
+  printf '{"scenes":[{"scene":1,"clips":[{"file":"%s","start":0.2,"end":1.0},{"file":"broken.mp4","start":0,"end":1},{"file":"%s","start":1.2,"end":1.8}]}]}' \
+    "$(basename "$FIX")" "$(basename "$FIX")" > "$SB/cutbad.json"
+  "$PYTHON" "$S/cut-from-edl.py" "$SB/cutbad.json" --execute --jobs 2 -o "$SB/bad-out.mp4" >/dev/null 2>&1
+  expect_exit "--jobs 2 with a broken clip -> 4" 4 $?
+  [[ ! -f "$SB/bad-out.mp4" ]] && ok "failed run writes no final output" || no "failed run writes no final output"
+
   # regression (live E2E find): -o resolves against the CWD and the output dir
   # is created BEFORE ffmpeg opens the temp file (was: mkdir after concat ->
   # cryptic "Error opening output files" for any -o into a new directory)
@@ -1,4 +1,5 @@
 @echo off
 REM summon - pull Claude Desktop Code-tab sessions across accounts.
 REM See: %USERPROFILE%\.claude\skills\summon\SKILL.md
-python "%USERPROFILE%\.claude\skills\summon\scripts\summon.py" %*
+REM Imported rather than run as a script so Python reuses the cached bytecode.
+python -c "import sys; sys.argv[0] = 'summon'; sys.path.insert(0, sys.argv.pop(1)); from summon import main; main()" "%USERPROFILE%\.claude\skills\summon\scripts" %*
@@ -2,22 +2,32 @@
 """summon — Claude Desktop session toolbox: cross-account transfer + recover/rebind/doctor.
 
 Usage:   summon [MODE] [ID] [OPTIONS]
-Input:   optional MODE positional (rebind|pick|recover|doctor; omit for transfer),
-         ID = sessionId/cliSessionId prefix for rebind/recover; picker reads stdin
+Input:   optional MODE positional (rebind|pick|recover|search|doctor|stats|
+         timeline|archive|dedupe|widget|serve; omit for transfer), ID =
+         sessionId/cliSessionId prefix for rebind/recover/timeline (a
+         cliSessionId prefix for dedupe), the query words for search;
+         picker reads stdin
 Output:  transfer/pick/doctor render TTY panels; recover/pick emit a paste-ready
          handover on stdout — a Sonnet-distilled brief (Goal / What landed /
          Unfinished / Open decisions / Key context) + transcript pointer, cached
-         at <transcript>.handover.md; falls back to the plain pointer prompt when
+         by content hash (mirrored at <transcript>.handover.md); falls back to
+         the plain pointer prompt when
          the `claude` CLI is unavailable or --no-distill is set. doctor --json
          emits {"data": [...], "meta": {"schema": "claude-mods.summon.doctor/v1"}};
          pick --json emits the session inventory as
          {"data": [...], "meta": {"schema": "claude-mods.summon.pick/v1"}};
+         pick --ndjson streams it one row per line, then {"meta": {...}};
          widget emits FINISHED, self-contained card-picker HTML on stdout (pass
          it straight to show_widget) — the rich inventory pre-trimmed and
          injected into assets/picker-widget.html under a hard byte budget, one
          session object per line; a copy is written to --out (default
          <temp>/claude/summon-widget.html)
 Stderr:  context panels for recover/pick, distillation progress, warnings, errors
+Cache:   ~/.claude/summon-cache/index.sqlite — wrapper index keyed by path,
+         validated by mtime+size, byte-offset checkpoints for incremental
+         transcript scans, and the full-text search table; handover/<sha256>.md
+         holds distilled briefs by content hash; safe to delete,
+         SUMMON_NO_CACHE=1 bypasses it
 Exit:    0 ok (including the non-distilled fallback — worker unavailability is
          advisory, never fatal), 2 usage/ambiguous id, 3 session or path not
          found, 10 doctor found broken sessions
@@ -26,14 +36,22 @@ Examples:
   summon --to mknv74                          # transfer: push sessions to next account
   summon pick                                 # fzf/numbered picker -> distilled handover
   summon pick --json | jq '.data[]'           # machine-readable session inventory
+  summon pick --ndjson --rich --all | jq -c .  # streamed rows, {"meta"} record last
   summon widget --days 30                      # finished in-chat card-picker HTML on stdout
   summon recover 6577b24c                     # distilled handover brief for one session
   summon recover 6577b24c --refresh           # ignore cached brief, re-distill
   summon recover 6577b24c --no-distill        # plain pointer prompt, no LLM call
   summon recover 6577b24c --model haiku       # distill with a different model
+  summon search "fts5 tokenizer"              # which session discussed X? -> handover
+  summon serve &                              # hot inventory: pick --json/widget in ms
   summon rebind 6577b24c --cwd X:\\Maplab\\LCMap\\.claude\\worktrees\\funny-hypatia-5e54f7
+  summon rebind --from-prefix X:\\Roam --to-prefix X:\\Maplab   # a whole moved tree
   summon doctor                               # scan all sessions for broken cwd bindings
   summon doctor --json | jq '.data[]'
+  summon stats --by project,model --days 30  # where did the tokens go?
+  summon archive --older-than 60d --apply    # compress cold transcripts in place
+  summon timeline 6577b24c --json            # per-tool p50/p95/max + Chrome trace file
+  summon dedupe --apply                       # hardlink duplicate transcript copies
 
 Transfer mode (no positional) is documented in SKILL.md: copy by default, --move
 to relocate, destination auto-detected as the most-recently-active account.
@@ -43,27 +61,30 @@ Output rendering follows docs/TERMINAL-DESIGN.md (Terminal Panel Design System).
 Deliberately single-file: skill scripts ship as self-contained portable units
 (docs/SKILL-RESOURCE-PROTOCOL.md) — do not split into a package. Navigate by
 the `# ===` section headers — Sections: DESIGN(term) · Path discovery ·
-Account discovery · Sessions · Grouping · Listing · Picker · Workspace
-selection · Operate · Peek · Transcript/Distill · Modes (transfer / pick /
-recover / rebind / doctor) · Widget (card-picker builder) · CLI entry.
+Account discovery · Sessions · Index (persistent session cache) · Grouping ·
+Listing · Picker · Workspace selection · Operate · Peek · Transcript/Distill ·
+Modes (transfer / pick / recover / rebind / doctor) · Search (full-text
+transcript index) · Widget (card-picker builder) · Stats (token / activity
+rollup) · Timeline (tool latency profile) · Archive (cold transcript
+compression) · Dedupe (duplicate transcript collapse) · Serve (hot inventory
+daemon) · CLI entry.
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
+import itertools
 import json
 import os
 import re
 import shutil
 import sys
-import tempfile
 import time
-import uuid as uuidlib
 from collections import OrderedDict
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
 
 
 # ============================================================
@@ -405,6 +426,12 @@ def cli_jsonl_root() -> Path:
     return Path.home() / ".claude" / "projects"
 
 
+def cache_root() -> Path:
+    """summon's own on-disk cache (the session index). Never part of the live
+    store — deleting it is always safe; it is rebuilt on the next run."""
+    return Path.home() / ".claude" / "summon-cache"
+
+
 def encode_cwd(cwd: str) -> str:
     """Convert cwd to ~/.claude/projects/ subdir name.
 
@@ -422,13 +449,30 @@ def encode_cwd(cwd: str) -> str:
 #  Account discovery
 # ============================================================
 
-@dataclass
 class Account:
-    uuid: str
-    sessions_dir: Path
-    email: str = ""
-    last_activity: float = 0.0
-    session_count: int = 0
+    # A plain class, not a @dataclass: importing dataclasses (and the inspect
+    # module it pulls in) was the largest single cost of summon's start-up.
+    def __init__(self, uuid: str, sessions_dir: Path, email: str = "",
+                 last_activity: float = 0.0, session_count: int = 0):
+        self.uuid = uuid
+        self.sessions_dir = sessions_dir
+        self.email = email
+        self.last_activity = last_activity
+        self.session_count = session_count
+
+    def _fields(self) -> tuple:
+        return (self.uuid, self.sessions_dir, self.email, self.last_activity,
+                self.session_count)
+
+    def __eq__(self, other):
+        return self._fields() == other._fields() if type(other) is Account else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Account(uuid={self.uuid!r}, sessions_dir={self.sessions_dir!r}, "
+                f"email={self.email!r}, last_activity={self.last_activity!r}, "
+                f"session_count={self.session_count!r})")
 
     @property
     def short(self) -> str:
@@ -441,10 +485,15 @@ class Account:
 
 
 def _iter_session_files(account_dir: Path) -> Iterable[Path]:
+    """Every local_*.json wrapper under an account, in path order — sorted so
+    the load order (and thus tie-breaks between equally-recent sessions) is the
+    same whether it comes from the filesystem or from the session index."""
+    files: list[Path] = []
     for ws in account_dir.iterdir():
         if not ws.is_dir():
             continue
-        yield from ws.glob("local_*.json")
+        files.extend(ws.glob("local_*.json"))
+    return sorted(files, key=str)
 
 
 def _find_account_email(agent_root: Path, account_uuid: str) -> str:
@@ -466,25 +515,48 @@ def _find_account_email(agent_root: Path, account_uuid: str) -> str:
 
 
 def discover_accounts(claude_dir: Path) -> list[Account]:
+    """Every account with at least one wrapper, most recently active first.
+
+    Served from the account cache (see _account_stamp) when an account's
+    directories haven't moved: a warm start costs a few stats per account
+    instead of one per wrapper plus the email hunt.
+    """
     sessions_root = claude_dir / "claude-code-sessions"
     if not sessions_root.is_dir():
         return []
     agent_root = claude_dir / "local-agent-mode-sessions"
+    cached = _cached_accounts()
+    upserts = []
     accounts: list[Account] = []
     for acct_dir in sessions_root.iterdir():
         if not acct_dir.is_dir():
             continue
-        sessions = list(_iter_session_files(acct_dir))
-        if not sessions:
+        row = cached.get(acct_dir.name)
+        if row and _account_stamp(acct_dir, row["stamp"]) == row["stamp"]:
+            count, last, email = row["count"], row["last"], row["email"]
+            email_stamp = row["emailStamp"]
+            if not email and (email_stamp is None or _account_stamp(
+                    agent_root / acct_dir.name, email_stamp) != email_stamp):
+                email = _find_account_email(agent_root, acct_dir.name)
+                # only the email is new: the counts keep their original age
+                upserts.append(_account_row(acct_dir, agent_root, count, last, email,
+                                            scanned_at=row["scannedAt"]))
+        else:
+            sessions = list(_iter_session_files(acct_dir))
+            count = len(sessions)
+            last = max((s.stat().st_mtime for s in sessions), default=0.0)
+            email = _find_account_email(agent_root, acct_dir.name) if sessions else ""
+            upserts.append(_account_row(acct_dir, agent_root, count, last, email))
+        if not count:
             continue
-        last = max((s.stat().st_mtime for s in sessions), default=0.0)
         accounts.append(Account(
             uuid=acct_dir.name,
             sessions_dir=acct_dir,
-            email=_find_account_email(agent_root, acct_dir.name),
+            email=email,
             last_activity=last,
-            session_count=len(sessions),
+            session_count=count,
         ))
+    _store_accounts(upserts)
     return sorted(accounts, key=lambda a: -a.last_activity)
 
 
@@ -510,35 +582,58 @@ def resolve_account(query: str, accounts: list[Account]) -> Account | None:
 #  Sessions
 # ============================================================
 
-@dataclass
-class Session:
-    path: Path
-    data: dict
-    account: Account
-
-    @property
-    def sid(self) -> str:
-        return self.data.get("sessionId", "")
-
-    @property
-    def cli_id(self) -> str:
-        return self.data.get("cliSessionId", "")
+def _int_field(data: dict, key: str) -> int:
+    try:
+        return int(data.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0
 
-    @property
-    def cwd(self) -> str:
-        return self.data.get("cwd", "")
 
-    @property
-    def title(self) -> str:
-        return self.data.get("title", "(untitled)")
+class Session:
+    """One wrapper, as the listing/filter/inventory paths see it.
 
-    @property
-    def turns(self) -> int:
-        return int(self.data.get("completedTurns", 0))
+    Only the fields those paths read are kept, in slots; the parsed wrapper
+    dict is dropped at load time (with tens of thousands of wrappers the dicts
+    were most of the resident set). ``data`` re-reads the full wrapper from
+    disk on each access — only a rewrite (rebind) needs it.
+    """
+    __slots__ = ("path", "account", "sid", "cli_id", "cwd", "title", "turns",
+                 "last_activity_ms", "branch", "model", "effort", "archived")
+
+    def __init__(self, path: Path, data: dict, account: Account):
+        self.path = path
+        self.account = account
+        self.sid = data.get("sessionId", "")
+        self.cli_id = data.get("cliSessionId", "")
+        self.cwd = data.get("cwd", "")
+        self.title = data.get("title", "(untitled)")
+        self.turns = _int_field(data, "completedTurns")
+        self.last_activity_ms = _int_field(data, "lastActivityAt")
+        self.branch = str(data.get("branch") or "")
+        self.model = str(data.get("model") or "")
+        self.effort = str(data.get("effort") or "")
+        self.archived = bool(data.get("isArchived"))
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+    def __eq__(self, other):
+        return self._fields() == other._fields() if type(other) is Session else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Session(path={self.path!r}, sid={self.sid!r}, cli_id={self.cli_id!r}, "
+                f"cwd={self.cwd!r}, account={self.account.short!r})")
 
     @property
-    def last_activity_ms(self) -> int:
-        return int(self.data.get("lastActivityAt", 0))
+    def data(self) -> dict:
+        """The full wrapper JSON, read fresh (OSError / ValueError if it's
+        gone or no longer parses)."""
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError("wrapper is not a JSON object")
+        return data
 
     @property
     def is_remote(self) -> bool:
@@ -551,13 +646,26 @@ class Session:
 
 
 def load_sessions(account: Account) -> list[Session]:
+    """Every parseable wrapper of one account, in path order.
+
+    Served from the session index (only new/changed wrappers are re-read);
+    falls back to parsing every wrapper when the index is unavailable.
+    """
+    indexed = _indexed_sessions([account])
+    if indexed is not None:
+        return indexed
+    return _load_sessions_direct(account)
+
+
+def _load_sessions_direct(account: Account) -> list[Session]:
     out: list[Session] = []
     for f in _iter_session_files(account.sessions_dir):
         try:
             data = json.loads(f.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             continue
-        out.append(Session(path=f, data=data, account=account))
+        if isinstance(data, dict):
+            out.append(Session(path=f, data=data, account=account))
     return out
 
 
@@ -584,6 +692,411 @@ def filter_sessions(
     return sorted(out, key=lambda s: -s.last_activity_ms)
 
 
+def query_sessions(
+    accounts: list[Account],
+    *,
+    days: int | None,
+    cwd_pattern: str = "",
+    title_pattern: str = "",
+) -> list[Session]:
+    """filter_sessions() over every account, answered by the session index.
+
+    Same semantics and ordering as loading everything and calling
+    filter_sessions(), but the window/cwd/title predicates run as SQL, so only
+    the matching wrappers are ever decoded.
+    """
+    if _HOT is not None:
+        return filter_sessions(_HOT.sessions(accounts), days=days,
+                               cwd_pattern=cwd_pattern, title_pattern=title_pattern)
+    now_ms = int(time.time() * 1000)
+    where = ["is_remote = 0"]
+    params: list = []
+    if days is not None:
+        where.append("last_activity_ms >= ?")
+        params.append(now_ms - days * 86_400_000)
+    if cwd_pattern:
+        where.append("instr(cwd_lc, ?) > 0")
+        params.append(cwd_pattern.lower())
+    if title_pattern:
+        where.append("instr(title_lc, ?) > 0")
+        params.append(title_pattern.lower())
+    indexed = _indexed_sessions(accounts, " AND ".join(where), params)
+    if indexed is None:
+        sessions = [s for acct in accounts for s in _load_sessions_direct(acct)]
+        return filter_sessions(sessions, days=days, cwd_pattern=cwd_pattern,
+                               title_pattern=title_pattern)
+    return sorted(indexed, key=lambda s: -s.last_activity_ms)
+
+
+def _sessions_matching_id(query: str, accounts: list[Account]) -> list[Session]:
+    """Candidate wrappers for an id lookup: every session whose sessionId or
+    cliSessionId could match `query` exactly or as a prefix, in load order.
+
+    A superset — callers apply their own exact/prefix precedence on top.
+    """
+    q = query.lower().removeprefix("local_")
+    indexed = _indexed_sessions(
+        accounts,
+        "substr(sid_key, 1, ?) = ? OR substr(cli_key, 1, ?) = ? OR cli_key = ?",
+        [len(q), q, len(q), q, query.lower()])
+    if indexed is not None:
+        return indexed
+    return [s for acct in accounts for s in _load_sessions_direct(acct)]
+
+
+# ============================================================
+#  Index (persistent session cache)
+# ============================================================
+#
+# Every mode starts by enumerating the wrapper store, and json-decoding
+# thousands of local_*.json files on every run dominated even `pick --json`.
+# The index is a SQLite file under cache_root() holding each wrapper's raw JSON
+# plus the handful of columns the filters need, keyed by path and validated by
+# (mtime_ns, size): a run stats every wrapper but re-reads only the ones that
+# changed, and window/cwd/title/id queries run as SQL. The same file holds
+# the byte-offset checkpoints of resumable transcript scans, the listing of
+# every transcript dir under cli_jsonl_root() and the per-account summaries
+# behind discover_accounts(). It is a pure cache — any
+# sqlite error, or SUMMON_NO_CACHE=1, drops back to parsing.
+
+INDEX_SCHEMA_VERSION = 5
+
+_INDEX_TABLES = {
+    "wrappers": """CREATE TABLE wrappers (
+        path TEXT PRIMARY KEY, account TEXT NOT NULL,
+        mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL,
+        sid_key TEXT, cli_key TEXT, cwd_lc TEXT, title_lc TEXT,
+        last_activity_ms INTEGER, is_remote INTEGER, data TEXT)""",
+    # Resumable scans over append-only transcripts, one row per (consumer,
+    # file): the byte offset of the last complete line consumed, the file
+    # identity it was read under, and the consumer's packed state.
+    "checkpoints": """CREATE TABLE checkpoints (
+        kind TEXT NOT NULL, path TEXT NOT NULL,
+        dev INTEGER, ino INTEGER, offset INTEGER, sig INTEGER, state BLOB,
+        PRIMARY KEY (kind, path))""",
+    # One row per ~/.claude/projects/<dir>: the cliSessionIds of its *.jsonl
+    # files (newline-joined), valid while the dir's mtime is unchanged.
+    "transcript_dirs": """CREATE TABLE transcript_dirs (
+        name TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, ids TEXT NOT NULL)""",
+    # `summon stats`: each transcript's usage rollup, one row per (model, UTC
+    # day), valid while the (size, mtime_ns) in usage_files still holds.
+    "usage": """CREATE TABLE usage (
+        path TEXT NOT NULL, model TEXT NOT NULL, day TEXT NOT NULL,
+        input INTEGER, output INTEGER, cache_write INTEGER, cache_read INTEGER,
+        tools INTEGER, active_ms INTEGER,
+        PRIMARY KEY (path, model, day)) WITHOUT ROWID""",
+    "usage_files": """CREATE TABLE usage_files (
+        path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL)""",
+    # discover_accounts(): one summary per account, valid while the account's
+    # directory stamp holds (see _account_stamp).
+    "accounts": """CREATE TABLE accounts (
+        uuid TEXT PRIMARY KEY, stamp TEXT, session_count INTEGER,
+        last_activity REAL, email TEXT, email_stamp TEXT, scanned_at REAL)""",
+}
+
+_INDEX_CONN = None  # per-process connection; False once known unavailable
+
+
+def _index_db():
+    """The per-process index connection, or None when disabled/unavailable.
+
+    A schema-version mismatch drops and rebuilds every table — it's a cache.
+    """
+    global _INDEX_CONN
+    if _INDEX_CONN is not None:
+        return _INDEX_CONN or None
+    _INDEX_CONN = False
+    if os.environ.get("SUMMON_NO_CACHE") == "1":
+        return None
+    import sqlite3
+    try:
+        root = cache_root()
+        root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(root / "index.sqlite"), timeout=5)
+        conn.execute("PRAGMA synchronous = OFF")  # a cache: durability not needed
+        if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_SCHEMA_VERSION:
+            with conn:
+                # Virtual tables first: dropping one drops its shadow tables.
+                stale = [r[0] for r in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "ORDER BY sql LIKE 'CREATE VIRTUAL%' DESC")]
+                for name in stale:
+                    conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+                for ddl in _INDEX_TABLES.values():
+                    conn.execute(ddl)
+                conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+    except (OSError, sqlite3.Error) as e:
+        eecho(f"warning: session index unavailable ({e}) — reading the store directly")
+        return None
+    _INDEX_CONN = conn
+    return conn
+
+
+def _wrapper_row(f: Path, st: os.stat_result, account: Account) -> tuple:
+    """One `wrappers` row. Unparseable wrappers are recorded with NULL data
+    (so they aren't re-read every run) and skipped when building sessions."""
+    key = (str(f), account.uuid, st.st_mtime_ns, st.st_size)
+    try:
+        raw = f.read_text(encoding="utf-8")
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("wrapper is not a JSON object")
+        s = Session(path=f, data=data, account=account)
+        return key + (s.sid.lower().removeprefix("local_"), s.cli_id.lower(),
+                      s.cwd.lower(), s.title.lower(), s.last_activity_ms,
+                      int(s.is_remote), raw)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return key + (None,) * 7
+
+
+def _sync_account_index(db, account: Account) -> bool:
+    """Bring one account's rows up to date: re-read only the wrappers whose
+    (mtime_ns, size) changed, drop rows for vanished files. False on any
+    sqlite error (caller falls back to the direct read)."""
+    import sqlite3
+    try:
+        known = {p: (m, n) for p, m, n in db.execute(
+            "SELECT path, mtime_ns, size FROM wrappers WHERE account = ?",
+            (account.uuid,))}
+        seen: set[str] = set()
+        upserts = []
+        for f in _iter_session_files(account.sessions_dir):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            key = str(f)
+            seen.add(key)
+            if known.get(key) != (st.st_mtime_ns, st.st_size):
+                upserts.append(_wrapper_row(f, st, account))
+        gone = [(p,) for p in known if p not in seen]
+        if upserts or gone:
+            with db:
+                db.executemany("INSERT OR REPLACE INTO wrappers VALUES "
+                               "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", upserts)
+                db.executemany("DELETE FROM wrappers WHERE path = ?", gone)
+        return True
+    except (OSError, sqlite3.Error) as e:
+        eecho(f"warning: session index sync failed ({e}) — reading the store directly")
+        return False
+
+
+def _load_checkpoint(kind: str, path: Path) -> tuple | None:
+    """(dev, ino, offset, sig, state) for one file's resumable scan, or None."""
+    import sqlite3
+    db = _index_db()
+    if db is None:
+        return None
+    try:
+        return db.execute(
+            "SELECT dev, ino, offset, sig, state FROM checkpoints "
+            "WHERE kind = ? AND path = ?", (kind, str(path))).fetchone()
+    except sqlite3.Error:
+        return None
+
+
+def _store_checkpoint(kind: str, path: Path, checkpoint: tuple) -> None:
+    """Persist a scan checkpoint; best-effort (a lost write costs one rescan)."""
+    _store_checkpoints(kind, [(path, checkpoint)])
+
+
+def _store_checkpoints(kind: str, items: list[tuple[Path, tuple]]) -> None:
+    """Persist many scan checkpoints in one transaction."""
+    import sqlite3
+    db = _index_db()
+    if db is None or not items:
+        return
+    try:
+        with db:
+            db.executemany("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                           [(kind, str(p), *cp) for p, cp in items])
+    except sqlite3.Error:
+        pass
+
+
+_TRANSCRIPT_DIRS: dict[str, list[tuple[str, str]]] | None = None  # per-process memo
+_TRANSCRIPT_SWEEP: dict[str, int] = {}  # last sweep's stat counts, for doctor --json
+_RACY_MTIME_NS = 2_000_000_000  # dirs touched this recently aren't trusted next run
+
+
+def transcript_locations() -> dict[str, list[tuple[str, str]]]:
+    """cliSessionId -> (project dir, file name) of each <id>.jsonl — or its
+    archive, <id>.jsonl.zst/.gz — sorted by dir, a plain file before an
+    archive of the same id.
+
+    Built once per process from a single os.scandir sweep of cli_jsonl_root():
+    a dir is listed again only when its mtime moved since the cached listing
+    (adding, removing or renaming a transcript bumps it), so resolving every
+    session of a run costs one root listing plus one stat per project dir.
+    """
+    global _TRANSCRIPT_DIRS
+    if _TRANSCRIPT_DIRS is not None:
+        return _TRANSCRIPT_DIRS
+    import sqlite3
+    db = _index_db()
+    known: dict[str, tuple[int, str]] = {}
+    if db is not None:
+        try:
+            known = {n: (m, ids) for n, m, ids in db.execute(
+                "SELECT name, mtime_ns, ids FROM transcript_dirs")}
+        except sqlite3.Error:
+            db = None
+    now_ns = time.time_ns()
+    listing: dict[str, str] = {}
+    upserts = []
+    try:
+        entries = list(os.scandir(cli_jsonl_root()))
+    except OSError:
+        entries = []
+    for entry in entries:
+        try:
+            if not entry.is_dir():
+                continue
+            mtime_ns = entry.stat().st_mtime_ns
+        except OSError:
+            continue
+        cached = known.get(entry.name)
+        if cached and cached[0] == mtime_ns:
+            listing[entry.name] = cached[1]
+            continue
+        try:
+            # "<id>" for <id>.jsonl, the full name for an archive
+            ids = "\n".join(sorted(
+                e.name[:-6] if e.name.endswith(".jsonl") else e.name
+                for e in os.scandir(entry.path)
+                if e.name.endswith((".jsonl",) + ARCHIVE_SUFFIXES) and e.is_file()))
+        except OSError:
+            continue
+        listing[entry.name] = ids
+        # A dir modified within the mtime granularity of this sweep could
+        # change again without its mtime moving: store it as never-valid.
+        racy = now_ns - mtime_ns < _RACY_MTIME_NS
+        upserts.append((entry.name, -1 if racy else mtime_ns, ids))
+    if db is not None:
+        gone = [(n,) for n in known if n not in listing]
+        try:
+            if upserts or gone:
+                with db:
+                    db.executemany("INSERT OR REPLACE INTO transcript_dirs VALUES (?, ?, ?)",
+                                   upserts)
+                    db.executemany("DELETE FROM transcript_dirs WHERE name = ?", gone)
+        except sqlite3.Error:
+            pass
+    out: dict[str, list[tuple[str, str]]] = {}
+    for name in sorted(listing):
+        for entry in filter(None, listing[name].split("\n")):
+            if entry.endswith(ARCHIVE_SUFFIXES):
+                cli_id = entry[:entry.rindex(".jsonl")]
+                out.setdefault(cli_id, []).append((name, entry))
+            else:
+                out.setdefault(entry, []).append((name, entry + ".jsonl"))
+    _TRANSCRIPT_DIRS = out
+    _TRANSCRIPT_SWEEP.update(dirs=len(entries), relisted=len(upserts))
+    return out
+
+
+# Account discovery cache. An account's summary — wrapper count, newest
+# wrapper mtime, email — is valid while its directory "stamp" holds: the
+# mtime of the account dir (a workspace added or removed) and of each
+# workspace dir (a wrapper created, deleted or renamed in). An in-place
+# wrapper edit moves no directory, so a summary is also re-derived once it
+# is ACCOUNT_CACHE_MAX_AGE_S old; last_activity only orders accounts.
+ACCOUNT_CACHE_MAX_AGE_S = 300
+
+
+def _account_stamp(root: Path, like: str | None = None) -> str | None:
+    """JSON [[name, mtime_ns], ...] for root ("") and its subdirs; "" when
+    root is missing, None when a dir was touched too recently to trust (a
+    None stamp never validates). With ``like`` (a previous stamp) only the
+    subdirs it names are stat'ed — enough while root's own mtime, which the
+    comparison includes, is unchanged."""
+    now_ns = time.time_ns()
+    try:
+        entries = [("", root.stat().st_mtime_ns)]
+        if like:
+            names = [n for n, _ in json.loads(like)[1:]]
+            entries += [(n, (root / n).stat().st_mtime_ns) for n in names]
+        else:
+            entries += sorted((e.name, e.stat().st_mtime_ns) for e in os.scandir(root)
+                              if e.is_dir())
+    except (OSError, ValueError):
+        return ""
+    if any(now_ns - m < _RACY_MTIME_NS for _, m in entries):
+        return None
+    return json.dumps(entries, separators=(",", ":"))
+
+
+def _account_row(acct_dir: Path, agent_root: Path, count: int, last: float,
+                 email: str, scanned_at: float | None = None) -> tuple:
+    """An accounts row; ``scanned_at`` dates the count (now, for a fresh listing)."""
+    return (acct_dir.name, _account_stamp(acct_dir), count, last, email,
+            _account_stamp(agent_root / acct_dir.name),
+            time.time() if scanned_at is None else scanned_at)
+
+
+def _cached_accounts() -> dict[str, dict]:
+    """uuid -> cached account summary, only rows younger than the max age
+    with a trustworthy stamp; {} without an index."""
+    import sqlite3
+    db = _index_db()
+    if db is None:
+        return {}
+    try:
+        rows = db.execute(
+            "SELECT uuid, stamp, session_count, last_activity, email, email_stamp, scanned_at "
+            "FROM accounts WHERE stamp IS NOT NULL AND scanned_at > ?",
+            (time.time() - ACCOUNT_CACHE_MAX_AGE_S,)).fetchall()
+    except sqlite3.Error:
+        return {}
+    return {u: {"stamp": st, "count": n, "last": last, "email": email, "emailStamp": est,
+                "scannedAt": at}
+            for u, st, n, last, email, est, at in rows}
+
+
+def _store_accounts(rows: list[tuple]) -> None:
+    import sqlite3
+    db = _index_db()
+    if db is None or not rows:
+        return
+    try:
+        with db:
+            db.executemany("INSERT OR REPLACE INTO accounts VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    except sqlite3.Error:
+        pass
+
+
+def _forget_transcript_locations() -> None:
+    """Drop the memo after summon itself writes a transcript into the tree."""
+    global _TRANSCRIPT_DIRS
+    _TRANSCRIPT_DIRS = None
+
+
+def _indexed_sessions(accounts: list[Account], where: str = "",
+                      params: Iterable = ()) -> list[Session] | None:
+    """Sessions for `accounts` (in account order, then path order) whose index
+    row satisfies the SQL `where` clause; None when the index can't serve."""
+    import sqlite3
+    db = _index_db()
+    if db is None:
+        return None
+    clause = f" AND ({where})" if where else ""
+    out: list[Session] = []
+    try:
+        for acct in accounts:
+            if not _sync_account_index(db, acct):
+                return None
+            rows = db.execute(
+                "SELECT path, data FROM wrappers WHERE account = ? "
+                f"AND data IS NOT NULL{clause} ORDER BY path",
+                (acct.uuid, *params))
+            out.extend(Session(path=Path(p), data=json.loads(d), account=acct)
+                       for p, d in rows)
+    except (sqlite3.Error, json.JSONDecodeError) as e:
+        eecho(f"warning: session index query failed ({e}) — reading the store directly")
+        return None
+    return out
+
+
 # ============================================================
 #  Grouping
 # ============================================================
@@ -734,6 +1247,7 @@ def interactive_pick(sessions: list[Session], *, grouped: bool) -> list[Session]
 # ============================================================
 
 def pick_destination_workspace(account: Account) -> Path:
+    import uuid as uuidlib
     workspaces = [w for w in account.sessions_dir.iterdir() if w.is_dir()]
     if not workspaces:
         new_ws = account.sessions_dir / str(uuidlib.uuid4())
@@ -747,7 +1261,8 @@ def pick_destination_workspace(account: Account) -> Path:
 #  Operate
 # ============================================================
 
-def summon_session(s: Session, dest_workspace: Path, *, move: bool, dry_run: bool) -> str:
+def summon_session(s: Session, dest_workspace: Path, *, move: bool, dry_run: bool,
+                   link: bool = False) -> str:
     target = dest_workspace / s.path.name
     if target.exists():
         return "skip (already there)"
@@ -755,12 +1270,80 @@ def summon_session(s: Session, dest_workspace: Path, *, move: bool, dry_run: boo
         return "skip (no cliSessionId)"
     transcript = s.transcript_path()
     if transcript and not transcript.exists():
+        if any(transcript.with_name(transcript.name + ext).exists()
+               for ext in _ARCHIVE_EXT.values()):
+            return "skip (transcript archived — summon archive --restore first)"
         return "skip (transcript missing)"
     if dry_run:
         return "would " + ("move" if move else "copy")
-    op = shutil.move if move else shutil.copy2
-    op(str(s.path), str(target))
-    return "moved" if move else "copied"
+    if move:
+        shutil.move(str(s.path), str(target))
+        return "moved"
+    # never a hardlink: the two accounts' wrappers would share one inode, and
+    # nudge_watcher's utime or any in-place write would show through both
+    how = link_or_copy(s.path, target, link=link, hardlink=False)
+    return "copied" if how == "copy" else f"copied ({how})"
+
+
+# --link: materialize a file without duplicating its bytes when the
+# filesystem allows. Reflink first (copy-on-write clone: independent files
+# that share extents until one is written), then a hardlink (one inode under
+# two names — zero bytes, but every later write shows through both), then a
+# plain copy. Wrappers never take the hardlink step (hardlink=False): they
+# are tiny, and a shared inode would tie two accounts' copies together.
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def link_or_copy(src: Path, dst: Path, *, link: bool, hardlink: bool = True) -> str:
+    """Create dst from src; returns the method used: "reflink", "hardlink"
+    or "copy". Without `link` it is always shutil.copy2; without `hardlink`
+    it is reflink-or-copy. dst must not exist."""
+    if link:
+        if _reflink(src, dst):
+            return "reflink"
+        if not hardlink:
+            shutil.copy2(src, dst)
+            return "copy"
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except (OSError, NotImplementedError):
+            pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone: clonefile(2) on macOS (APFS), the FICLONE ioctl on
+    Linux (Btrfs, XFS, bcachefs, ...). False when unsupported, leaving no dst."""
+    if sys.platform == "darwin":
+        import ctypes
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+        except (OSError, AttributeError):
+            return False
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        with open(src, "rb") as fin, open(dst, "xb") as fout:
+            try:
+                fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+                cloned = True
+            except OSError:
+                cloned = False
+    except OSError:
+        return False
+    if not cloned:
+        dst.unlink(missing_ok=True)
+        return False
+    try:
+        shutil.copystat(src, dst)
+    except OSError:
+        pass
+    return True
 
 
 def nudge_watcher(workspace_dir: Path, moved_files: list[Path] | None = None) -> None:
@@ -782,6 +1365,7 @@ def nudge_watcher(workspace_dir: Path, moved_files: list[Path] | None = None) ->
     require a Logout -> Login cycle to refresh the sidebar. That's
     documented in SKILL.md as the canonical fallback.
     """
+    import uuid as uuidlib
     now = time.time()
     account_dir = workspace_dir.parent
 
@@ -830,14 +1414,13 @@ def nudge_watcher(workspace_dir: Path, moved_files: list[Path] | None = None) ->
 
 def find_session_by_id(query: str, accounts: list[Account]) -> Session | None:
     q = query.lower().removeprefix("local_")
-    for acct in accounts:
-        for s in load_sessions(acct):
-            sid = s.sid.lower().removeprefix("local_")
-            cli = s.cli_id.lower()
-            if sid == q or cli == query.lower():
-                return s
-            if sid.startswith(q) or cli.startswith(q):
-                return s
+    for s in _sessions_matching_id(query, accounts):
+        sid = s.sid.lower().removeprefix("local_")
+        cli = s.cli_id.lower()
+        if sid == q or cli == query.lower():
+            return s
+        if sid.startswith(q) or cli.startswith(q):
+            return s
     return None
 
 
@@ -851,6 +1434,8 @@ def peek_session(query: str, accounts: list[Account], turns: int = 3) -> int:
         echo(panel_close())
         return 1
     transcript = s.transcript_path()
+    if transcript and not transcript.exists():
+        transcript = resolve_transcript(s)[0] or transcript  # moved or archived
     if not transcript or not transcript.exists():
         echo(panel_open(f"summon {Term.g('·', '|')} peek", indicator=f"{s.account.short} {Term.g('·', '|')} {s.title}"))
         echo(panel_blank())
@@ -859,21 +1444,35 @@ def peek_session(query: str, accounts: list[Account], turns: int = 3) -> int:
         echo(panel_close())
         return 2
 
+    # Walk back from EOF: only the last turns*2 messages are shown, so the
+    # cost is the tail, not the whole (possibly hundreds-of-MB) transcript.
+    # An archive can't be read backwards: stream it forward, keeping the tail.
+    want = turns * 2
     exchanges: list[tuple[str, str]] = []
+    sealed = is_archived(transcript)
+
+    def exchange(raw: bytes) -> tuple[str, str] | None:
+        rec = _conversation_record(raw)
+        t = rec.get("type")
+        if t not in ("user", "assistant"):
+            return None
+        msg = rec.get("message")
+        text = _extract_text(msg.get("content") if isinstance(msg, dict) else None)
+        return (t, text) if text else None
+
     try:
-        with transcript.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                t = rec.get("type")
-                if t not in ("user", "assistant"):
-                    continue
-                msg = rec.get("message", {})
-                text = _extract_text(msg.get("content"))
-                if text:
-                    exchanges.append((t, text))
+        with open_transcript(transcript) as f:
+            if sealed:
+                from collections import deque
+                exchanges = list(deque(filter(None, map(exchange, f)), maxlen=want or None))
+            else:
+                for _, raw in iter_lines_reverse(f):
+                    ex = exchange(raw)
+                    if ex:
+                        exchanges.append(ex)
+                        if want and len(exchanges) >= want:
+                            break
+                exchanges.reverse()
     except OSError as e:
         echo(panel_open(f"summon {Term.g('·', '|')} peek", indicator="read error"))
         echo(panel_blank())
@@ -929,6 +1528,162 @@ def peek_session(query: str, accounts: list[Account], turns: int = 3) -> int:
     return 0
 
 
+def iter_lines_reverse(fh, chunk_size: int = 64 * 1024) -> Iterable[tuple[int, bytes]]:
+    """Yield (offset, line) for a binary file from EOF back to BOF.
+
+    Reads fixed-size chunks backwards and splits on b"\\n", so finding the
+    last N records of a JSONL costs time proportional to those records, not
+    to the file. Lines come without their newline; the empty "line" after a
+    trailing newline is yielded too (callers skip blanks as a forward read
+    would). A line longer than chunk_size spans several reads; its pieces are
+    joined once, not re-concatenated per chunk.
+    """
+    fh.seek(0, os.SEEK_END)
+    pos = end = fh.tell()
+    carry: list[bytes] = []  # right-to-left pieces of the line being assembled
+    while pos > 0:
+        step = min(chunk_size, pos)
+        pos -= step
+        fh.seek(pos)
+        block = fh.read(step)
+        if b"\n" not in block:
+            carry.append(block)
+            continue
+        parts = block.split(b"\n")
+        parts[-1] += b"".join(reversed(carry))
+        for line in reversed(parts[1:]):
+            start = end - len(line)
+            yield start, line
+            end = start - 1
+        carry = [parts[0]]
+    yield 0, b"".join(reversed(carry))
+
+
+def _json_record(raw: bytes) -> dict:
+    """One JSONL line -> dict; {} for blank, malformed or non-object lines."""
+    loads = _orjson_loads()
+    if loads:
+        try:
+            rec = loads(raw)
+        except ValueError:
+            pass  # invalid UTF-8, NaN, huge ints, ... — the stdlib decides
+        else:
+            return rec if isinstance(rec, dict) else {}
+    try:
+        rec = json.loads(raw.decode("utf-8", "replace"))
+    except json.JSONDecodeError:
+        return {}
+    return rec if isinstance(rec, dict) else {}
+
+
+# Most transcript bytes are tool output no scan here displays: the tool_result
+# block, its toolUseResult echo, attachment payloads. Three cheap layers keep
+# the full decode off them — _record_type sniffs the record "type" from the
+# raw bytes so a consumer skips whole records it never reads, _record_fields
+# decodes top-level members in order and stops once it holds the ones asked
+# for, and orjson (when installed) does the whole-record decodes.
+
+_ORJSON: list = []  # [orjson.loads or None], resolved on first use
+
+
+def _orjson_loads():
+    """orjson.loads when installed (SUMMON_NO_ORJSON=1 opts out), else None."""
+    if not _ORJSON:
+        loads = None
+        if os.environ.get("SUMMON_NO_ORJSON") != "1":
+            try:
+                import orjson
+                loads = orjson.loads
+            except ImportError:
+                pass
+        _ORJSON.append(loads)
+    return _ORJSON[0]
+
+
+def _conversation_record(raw: bytes) -> dict:
+    """type + message of a user/assistant record; {} for anything else,
+    without decoding records whose type already rules them out."""
+    if _record_type(raw) not in (None, "user", "assistant"):
+        return {}
+    return _record_fields(raw, ("type", "message"))
+
+
+def _record_type(raw: bytes) -> str | None:
+    """The record's top-level "type", read from the bytes; None when that
+    can't be proven without decoding.
+
+    Proof: the line opens with "{" and no other "{" comes before the first
+    ``"type":`` — so that key sits at depth 1 (a JSON string can't hold an
+    unescaped ``"type":``). Records whose type follows a nested object
+    (assistant records lead with "message") come back None.
+    """
+    at = raw.find(b'"type":')
+    if at < 0 or raw.count(b"{", 0, at) != 1 or raw.lstrip()[:1] != b"{":
+        return None
+    start = at + 7
+    if raw[start:start + 1] == b" ":
+        start += 1
+    if raw[start:start + 1] != b'"':
+        return None
+    end = raw.find(b'"', start + 1)
+    if end < 0 or raw.find(b"\\", start, end) >= 0:
+        return None
+    return raw[start + 1:end].decode("utf-8", "replace")
+
+
+_PARTIAL_DECODE_MIN = 32 * 1024  # bytes; smaller lines decode whole, faster
+_JSON_WS = json.decoder.WHITESPACE.match
+_JSON_SCAN = json.JSONDecoder().scan_once
+
+
+def _record_fields(raw: bytes, fields: tuple[str, ...]) -> dict:
+    """The wanted top-level members of one JSONL record (those present).
+
+    Decodes member by member and returns as soon as every wanted field is in
+    hand, so whatever follows — a user record's toolUseResult echo of the
+    tool output, say — is never parsed. Stepping members costs Python time
+    per member, so it only pays on big lines: below _PARTIAL_DECODE_MIN, or
+    with orjson installed, the whole line is decoded instead. A line that
+    doesn't end in "}" gets the strict full decode too, so a half-written
+    record yields {} as before rather than its leading fields.
+    """
+    if (len(raw) < _PARTIAL_DECODE_MIN or _orjson_loads()
+            or not raw.rstrip().endswith(b"}")):
+        rec = _json_record(raw)
+        return {k: rec[k] for k in fields if k in rec}
+    text = raw.decode("utf-8", "replace")
+    want = set(fields)
+    out: dict = {}
+    try:
+        i = _JSON_WS(text, 0).end()
+        if text[i] != "{":
+            return {}
+        i = _JSON_WS(text, i + 1).end()
+        if text[i] == "}":
+            return {}
+        while True:
+            if text[i] != '"':
+                return {}
+            key, i = json.decoder.scanstring(text, i + 1)
+            i = _JSON_WS(text, i).end()
+            if text[i] != ":":
+                return {}
+            value, i = _JSON_SCAN(text, _JSON_WS(text, i + 1).end())
+            if key in want:
+                out[key] = value
+                want.discard(key)
+                if not want:
+                    return out
+            i = _JSON_WS(text, i).end()
+            if text[i] == "}":
+                return out if _JSON_WS(text, i + 1).end() == len(text) else {}
+            if text[i] != ",":
+                return {}
+            i = _JSON_WS(text, i + 1).end()
+    except (ValueError, IndexError, StopIteration):
+        return {}
+
+
 def _extract_text(content) -> str:
     if isinstance(content, str):
         return content
@@ -969,21 +1724,28 @@ def resolve_transcript(s: Session) -> tuple[Path | None, str]:
 
     Returns (path, how) with how in:
       "expected"  — at ~/.claude/projects/<enc(cwd)>/<cliSessionId>.jsonl
-      "scanned"   — found by scanning all project dirs for <cliSessionId>.jsonl
+      "scanned"   — found in another project dir (transcript_locations(): one
+                    cached sweep of every project dir, then a dict lookup)
                     (the wrapper-uuid != transcript-filename trap: the transcript
                     is named by cliSessionId, and may live under a munged dir that
                     doesn't derive from the wrapper's recorded cwd)
       ""          — not found anywhere (path is None)
+    An archived transcript resolves to its <id>.jsonl.zst/.gz — read it
+    through open_transcript().
     """
     if not s.cli_id:
         return None, ""
+    hits = transcript_locations().get(s.cli_id)
+    if not hits:
+        return None, ""
     expected = s.transcript_path()
-    if expected and expected.exists():
-        return expected, "expected"
-    hits = sorted(cli_jsonl_root().glob(f"*/{s.cli_id}.jsonl"))
-    if hits:
-        return hits[0], "scanned"
-    return None, ""
+    if expected:
+        want = os.path.normcase(expected.parent.name)
+        for d, name in hits:
+            if os.path.normcase(d) == want:
+                return expected.parent / name, "expected"
+    d, name = hits[0]
+    return cli_jsonl_root() / d / name, "scanned"
 
 
 # Boilerplate the first-ask sniffer must skip: slash-command echoes, skill
@@ -995,94 +1757,343 @@ _ASK_SKIP_MARKERS = (
 
 
 def _ts_ms(value: str) -> int | None:
+    """ISO-8601 timestamp -> epoch ms (None when unparseable).
+
+    Transcript stamps share one fixed layout, ``YYYY-MM-DDTHH:MM:SS.fffZ``,
+    and arrive in order, so consecutive stamps usually share a second and
+    almost always a minute. For that layout the epoch base of the current
+    second and minute is memoized and the rest is table lookups; anything
+    else goes through datetime.fromisoformat. Every path ends in the same
+    correctly-rounded ``int(seconds * 1000)`` float step (all operands are
+    exact floats below 2**53), so the results are identical.
+    """
+    global _TS_MEMO
+    if type(value) is str:
+        frac = _TS_FRACTION.get(value[19:])
+        if frac is not None:
+            memo = _TS_MEMO
+            if value[:19] != memo[0]:
+                sec = _TS_SECOND.get(value[16:19])
+                if sec is None:
+                    return _ts_ms_slow(value)
+                minute_us = memo[3] if value[:16] == memo[2] else _ts_minute_us(value)
+                if minute_us is None:
+                    return _ts_ms_slow(value)
+                # one tuple swap, so a concurrent --jobs reader never sees a
+                # prefix paired with another second's base
+                memo = _TS_MEMO = (value[:19], minute_us + sec, value[:16], minute_us)
+            return int((memo[1] + frac) / 1e6 * 1000)
+    return _ts_ms_slow(value)
+
+
+def _ts_ms_slow(value: str) -> int | None:
     try:
         return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000)
     except (ValueError, AttributeError):
         return None
 
 
+_TS_EPOCH = datetime(1970, 1, 1)
+_TS_FRACTION = {f".{i:03d}Z": i * 1e3 for i in range(1000)}  # ".fffZ" -> µs
+_TS_SECOND = {f":{i:02d}": i * 1e6 for i in range(60)}       # ":SS" -> µs
+# (second prefix "YYYY-MM-DDTHH:MM:SS", its epoch µs, minute prefix, its epoch µs)
+_TS_MEMO: tuple = ("", 0.0, "", 0.0)
+
+
+def _ts_minute_us(value: str) -> float | None:
+    """Epoch µs of value's "YYYY-MM-DDTHH:MM" minute; None when that part is
+    off the fixed layout (the caller falls back to fromisoformat)."""
+    minute = value[:16]
+    digits = minute[0:4] + minute[5:7] + minute[8:10] + minute[11:13] + minute[14:16]
+    if (minute[4] + minute[7] + minute[10] + minute[13] != "--T:"
+            or not (digits.isdigit() and digits.isascii())):
+        return None
+    try:
+        dt = datetime.fromisoformat(minute)
+    except ValueError:
+        return None
+    return float(((dt - _TS_EPOCH).days * 86400 + dt.hour * 3600
+                  + dt.minute * 60) * 1_000_000)
+
+
 def analyze_transcript(path: Path | None, buckets: int = 24) -> dict:
     """Stream a transcript JSONL once and derive picker display metrics.
 
     Returns events / toolCalls / density buckets / durationMin / sizeKB /
     ctxTokens (last-turn context occupancy, matching Claude Code's live meter) /
-    ctxPeak (max occupancy before any auto-compaction) / firstAsk. Every field
+    ctxPeak (max occupancy before any auto-compaction) / firstAsk / rollup
+    ("model\tYYYY-MM-DD" in UTC -> [input, output, cache-write, cache-read
+    tokens, tool calls, active ms] — the feed of `summon stats`). Every field
     degrades to a zero/empty default on a missing or unreadable transcript, so
-    the picker still renders — just without the extras. One pass, so a large
-    transcript costs one linear read, never a re-scan.
+    the picker still renders — just without the extras.
+
+    Incremental: transcripts are append-only, so the scan state is checkpointed
+    in the session index at the last complete line (see _analyze). A re-run
+    parses only the bytes appended since; a truncated, replaced or rewritten
+    file fails the checkpoint's identity check and is re-scanned from zero.
+    """
+    checkpoint = _load_checkpoint("analysis", path) if path else None
+    out, fresh = _analyze(path, buckets, checkpoint)
+    if fresh is not None:
+        _store_checkpoint("analysis", path, fresh)
+    return out
+
+
+def _new_scan_state() -> dict:
+    """analyze_transcript's running counters — everything the metrics derive
+    from, so a checkpointed state plus the appended tail equals a full scan."""
+    return {"events": 0, "toolCalls": 0, "stamps": [], "lastCtx": 0,
+            "peakCtx": 0, "firstAsk": "",
+            # rollup feed: current model + UTC day, the previous stamp, and the
+            # last usage block folded in (message id, rollup key, its counts)
+            "model": "", "day": "", "dayLo": 0, "prevMs": 0,
+            "msg": ["", "", [0, 0, 0, 0]], "rollup": {}}
+
+
+_ACTIVE_GAP_MS = 5 * 60 * 1000  # a longer gap between records is idle, not active time
+_DAY_MS = 86_400_000
+
+
+def _scan_line(state: dict, raw: bytes) -> None:
+    """Fold one transcript line into the scan state.
+
+    Only user/assistant records feed anything beyond the event count and the
+    timestamp, so the rest are decoded just up to their "timestamp".
+    """
+    if not raw.strip():
+        return
+    state["events"] += 1
+    if _record_type(raw) in (None, "user", "assistant"):
+        obj = _record_fields(raw, ("type", "timestamp", "message"))
+    else:
+        obj = _record_fields(raw, ("timestamp",))
+    stamp = obj.get("timestamp")
+    ms = _ts_ms(stamp) if stamp else 0
+    if ms:
+        state["stamps"].append(ms)
+    msg = obj.get("message")
+    msg = msg if isinstance(msg, dict) else {}
+    typ = obj.get("type")
+    if typ == "assistant" and isinstance(msg.get("model"), str):
+        state["model"] = msg["model"]
+    key, slot = _rollup_slot(state, ms)
+    usage = msg.get("usage")
+    if isinstance(usage, dict):
+        tokens = [usage.get("input_tokens", 0), usage.get("output_tokens", 0),
+                  usage.get("cache_creation_input_tokens", 0),
+                  usage.get("cache_read_input_tokens", 0)]
+        occ = sum(tokens)
+        if occ:
+            state["lastCtx"] = occ
+            state["peakCtx"] = max(state["peakCtx"], occ)
+        # A streamed reply is logged as several records of one message id,
+        # each repeating the usage so far: the last record's block replaces
+        # the earlier ones instead of adding to them.
+        mid = msg.get("id") or ""
+        last = state["msg"]
+        if mid and mid == last[0]:
+            prev = state["rollup"].get(last[1])
+            if prev:
+                for i in range(4):
+                    prev[i] -= last[2][i]
+        for i in range(4):
+            slot[i] += tokens[i]
+        state["msg"] = [mid, key, tokens]
+    if typ == "assistant":
+        content = msg.get("content")
+        if isinstance(content, list):
+            calls = sum(1 for p in content
+                        if isinstance(p, dict) and p.get("type") == "tool_use")
+            state["toolCalls"] += calls
+            slot[4] += calls
+    elif typ == "user" and not state["firstAsk"]:
+        content = msg.get("content")
+        if isinstance(content, str):
+            txt = content
+        elif isinstance(content, list):
+            txt = "".join(p.get("text", "") for p in content
+                          if isinstance(p, dict) and p.get("type") == "text")
+        else:
+            txt = ""
+        txt = txt.strip()
+        if txt and not txt.startswith("<") and not any(
+                m in txt for m in _ASK_SKIP_MARKERS):
+            state["firstAsk"] = txt[:280]
+
+
+def _rollup_slot(state: dict, ms: int) -> tuple[str, list[int]]:
+    """The rollup counters a record at `ms` folds into — keyed by the current
+    model and UTC day — crediting the gap since the previous stamp as active
+    time when it is under _ACTIVE_GAP_MS. Stamp-less records keep the last day."""
+    if ms and not state["dayLo"] <= ms < state["dayLo"] + _DAY_MS:
+        state["dayLo"] = ms - ms % _DAY_MS
+        state["day"] = time.strftime("%Y-%m-%d", time.gmtime(state["dayLo"] // 1000))
+    key = f"{state['model']}\t{state['day']}"
+    rollup = state["rollup"]
+    slot = rollup.get(key)
+    if slot is None:
+        slot = rollup[key] = [0, 0, 0, 0, 0, 0]
+    if ms:
+        gap = ms - state["prevMs"]
+        if state["prevMs"] and 0 < gap <= _ACTIVE_GAP_MS:
+            slot[5] += gap
+        state["prevMs"] = ms
+    return key, slot
+
+
+def _transcript_metrics(state: dict, out: dict, buckets: int) -> dict:
+    """Project a scan state onto analyze_transcript's output shape."""
+    out["events"] = state["events"]
+    out["toolCalls"] = state["toolCalls"]
+    out["ctxTokens"] = state["lastCtx"]
+    out["ctxPeak"] = state["peakCtx"]
+    out["firstAsk"] = state["firstAsk"]
+    out["rollup"] = {k: v for k, v in state["rollup"].items() if any(v)}
+    stamps = state["stamps"]
+    if stamps:
+        lo, hi = min(stamps), max(stamps)
+        span = hi - lo
+        out["durationMin"] = round(span / 60000)
+        out["buckets"] = _density_buckets(stamps, lo, span, buckets)
+    return out
+
+
+def _density_buckets(stamps: list[int], lo: int, span: int, buckets: int) -> list[int]:
+    """Histogram stamps into `buckets` equal slices of [lo, lo + span].
+
+    A stamp lands in ``min(buckets - 1, int((ms - lo) / span * buckets))`` —
+    monotone in ms, so each bucket starts at one exact integer edge. Find the
+    inner edges, sort the (already near-ordered) stamps once, and count each
+    bucket with two bisects instead of a float division per stamp.
+    """
+    counts = [0] * buckets
+    if span <= 0:
+        counts[0] = len(stamps)
+        return counts
+
+    def slot(ms: int) -> int:
+        return min(buckets - 1, int((ms - lo) / span * buckets))
+
+    ordered = sorted(stamps)
+    prev = 0
+    for k in range(1, buckets):
+        edge = lo + (k * span + buckets - 1) // buckets  # exact ceil(k*span/b)
+        while edge > lo and slot(edge - 1) >= k:          # float rounding nudges
+            edge -= 1
+        while slot(edge) < k:
+            edge += 1
+        cut = bisect.bisect_left(ordered, edge)
+        counts[k - 1] = cut - prev
+        prev = cut
+    counts[-1] = len(ordered) - prev
+    return counts
+
+
+def _pack_state(state: dict) -> bytes:
+    """Checkpoint blob: the scan state as JSON with the timestamp list
+    delta-encoded (near-constant deltas), zlib-compressed."""
+    import zlib
+    stamps = state["stamps"]
+    deltas = stamps[:1] + [b - a for a, b in zip(stamps, stamps[1:])]
+    body = dict(state, stamps=deltas)
+    return zlib.compress(json.dumps(body, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack_state(blob: bytes) -> dict:
+    import zlib
+    from itertools import accumulate
+    state = json.loads(zlib.decompress(blob).decode("utf-8"))
+    state["stamps"] = list(accumulate(state["stamps"]))
+    return state
+
+
+_SIG_BYTES = 256  # bytes before the checkpoint offset that must still match
+
+
+def _tail_sig(fh, offset: int) -> int:
+    """crc32 of the _SIG_BYTES ending at `offset` — catches an in-place
+    rewrite that kept the inode and didn't shrink the file."""
+    import zlib
+    start = max(0, offset - _SIG_BYTES)
+    fh.seek(start)
+    return zlib.crc32(fh.read(offset - start))
+
+
+def _checkpoint_matches(fh, st: os.stat_result, checkpoint: tuple,
+                        sealed: bool = False) -> bool:
+    """Does (dev, ino, offset, sig, state) still describe a prefix of this
+    file? False on an inode/device change (replaced), a size below the offset
+    (truncated), or different bytes just before the offset (rewritten).
+
+    A `sealed` file (an archive: immutable, offsets count decompressed bytes)
+    stores its compressed size as the sig instead, and matches on identity
+    and that size alone."""
+    dev, ino, offset, sig, _ = checkpoint
+    if (dev, ino) != (st.st_dev, st.st_ino):
+        return False
+    if sealed:
+        return sig == st.st_size
+    if st.st_size < offset:
+        return False
+    return _tail_sig(fh, offset) == sig
+
+
+def _analyze(path: Path | None, buckets: int,
+             checkpoint: tuple | None) -> tuple[dict, tuple | None]:
+    """analyze_transcript without the index I/O — resume from `checkpoint`
+    when it still matches the file, scan to EOF, return (metrics, new
+    checkpoint or None when nothing needs storing).
+
+    The checkpoint stops at the last complete line: a half-written trailing
+    line still counts toward this run's metrics but is re-read next time. An
+    archived transcript is final, so its checkpoint covers the whole stream
+    and a matching one is the answer without opening the file.
     """
     out = {"events": 0, "toolCalls": 0, "buckets": [0] * buckets,
            "durationMin": 0, "sizeKB": 0, "ctxTokens": 0, "ctxPeak": 0,
-           "firstAsk": ""}
+           "firstAsk": "", "rollup": {}}
     if not path or not path.exists():
-        return out
+        return out, None
     try:
-        out["sizeKB"] = round(path.stat().st_size / 1024)
+        st = path.stat()
+        out["sizeKB"] = round(st.st_size / 1024)
     except OSError:
-        pass
-    stamps: list[int] = []
-    last_ctx = peak_ctx = 0
+        st = None
+    fresh = None
+    sealed = is_archived(path)
+    if sealed and checkpoint and st and _checkpoint_matches(None, st, checkpoint, True):
+        out["sizeKB"] = round(checkpoint[2] / 1024)
+        return _transcript_metrics(_unpack_state(checkpoint[4]), out, buckets), None
     try:
-        with path.open(encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                out["events"] += 1
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                stamp = obj.get("timestamp")
-                if stamp:
-                    ms = _ts_ms(stamp)
-                    if ms:
-                        stamps.append(ms)
-                msg = obj.get("message")
-                msg = msg if isinstance(msg, dict) else {}
-                usage = msg.get("usage")
-                if isinstance(usage, dict):
-                    occ = (usage.get("input_tokens", 0)
-                           + usage.get("cache_creation_input_tokens", 0)
-                           + usage.get("cache_read_input_tokens", 0)
-                           + usage.get("output_tokens", 0))
-                    if occ:
-                        last_ctx = occ
-                        peak_ctx = max(peak_ctx, occ)
-                typ = obj.get("type")
-                if typ == "assistant":
-                    content = msg.get("content")
-                    if isinstance(content, list):
-                        out["toolCalls"] += sum(
-                            1 for p in content
-                            if isinstance(p, dict) and p.get("type") == "tool_use")
-                elif typ == "user" and not out["firstAsk"]:
-                    content = msg.get("content")
-                    if isinstance(content, str):
-                        txt = content
-                    elif isinstance(content, list):
-                        txt = "".join(p.get("text", "") for p in content
-                                      if isinstance(p, dict) and p.get("type") == "text")
-                    else:
-                        txt = ""
-                    txt = txt.strip()
-                    if txt and not txt.startswith("<") and not any(
-                            m in txt for m in _ASK_SKIP_MARKERS):
-                        out["firstAsk"] = txt[:280]
+        with open_transcript(path) as fh:
+            resumed = (not sealed and bool(checkpoint) and st is not None
+                       and _checkpoint_matches(fh, st, checkpoint))
+            if resumed:
+                offset, state = checkpoint[2], _unpack_state(checkpoint[4])
+            else:
+                offset, state = 0, _new_scan_state()
+            start = offset
+            if not sealed:
+                fh.seek(offset)
+            partial = b""
+            for raw in fh:
+                if not raw.endswith(b"\n") and not sealed:
+                    partial = raw
+                    break
+                offset += len(raw)
+                _scan_line(state, raw)
+            # a stale checkpoint is replaced even when the rescan read nothing
+            # (truncated to empty), or it would fail the match on every run
+            if st and (offset != start or not resumed):
+                sig = st.st_size if sealed else _tail_sig(fh, offset)
+                fresh = (st.st_dev, st.st_ino, offset, sig, _pack_state(state))
+            if partial:
+                _scan_line(state, partial)
     except OSError:
-        return out
-    out["ctxTokens"] = last_ctx
-    out["ctxPeak"] = peak_ctx
-    if stamps:
-        lo, hi = min(stamps), max(stamps)
-        span = hi - lo
-        out["durationMin"] = round(span / 60000)
-        counts = [0] * buckets
-        for ms in stamps:
-            idx = 0 if span <= 0 else min(buckets - 1, int((ms - lo) / span * buckets))
-            counts[idx] += 1
-        out["buckets"] = counts
-    return out
+        return out, None
+    if sealed:
+        out["sizeKB"] = round(offset / 1024)  # the transcript's size, not the archive's
+    return _transcript_metrics(state, out, buckets), fresh
 
 
 def find_wrappers_by_id(query: str, accounts: list[Account]) -> tuple[list[Session], bool]:
@@ -1095,14 +2106,13 @@ def find_wrappers_by_id(query: str, accounts: list[Account]) -> tuple[list[Sessi
     q = query.lower().removeprefix("local_")
     exact: list[Session] = []
     prefix: list[Session] = []
-    for acct in accounts:
-        for s in load_sessions(acct):
-            sid = s.sid.lower().removeprefix("local_")
-            cli = s.cli_id.lower()
-            if sid == q or cli == q:
-                exact.append(s)
-            elif sid.startswith(q) or cli.startswith(q):
-                prefix.append(s)
+    for s in _sessions_matching_id(query, accounts):
+        sid = s.sid.lower().removeprefix("local_")
+        cli = s.cli_id.lower()
+        if sid == q or cli == q:
+            exact.append(s)
+        elif sid.startswith(q) or cli.startswith(q):
+            prefix.append(s)
     matches = exact or prefix
     logical = {s.sid for s in matches}
     return matches, len(logical) > 1
@@ -1131,15 +2141,61 @@ def _rebase_path(old_val: str, old_cwd: str, new_cwd: str) -> str:
     return old_val
 
 
+def _rewrite_wrapper(s: Session, new_cwd: str, backup_root: Path,
+                     rebase=None) -> bool:
+    """Rebind one wrapper: back it up under backup_root (outside the live
+    store), atomically rewrite cwd + rebase originCwd/worktreePath, verify by
+    re-read. False (and the backup restored) when the verify fails; False
+    with nothing touched when the wrapper can no longer be read.
+
+    `rebase(value)` maps a sibling path field; default _rebase_path against
+    the session's old cwd.
+    """
+    rebase = rebase or (lambda v: _rebase_path(v, s.cwd, new_cwd))
+    try:
+        data = s.data  # the full wrapper, fresh from disk
+    except (OSError, ValueError):
+        return False
+
+    # 1. Backup outside the live store
+    backup_root.mkdir(parents=True, exist_ok=True)
+    backup = backup_root / f"{s.account.uuid}__{s.path.parent.name}__{s.path.name}"
+    shutil.copy2(s.path, backup)
+
+    # 2. Atomic rewrite
+    data["cwd"] = new_cwd
+    for field in ("originCwd", "worktreePath"):
+        if field in data:
+            data[field] = rebase(str(data[field] or ""))
+    tmp = s.path.with_name(s.path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, s.path)
+
+    # 3. Verify by re-read
+    try:
+        reread = json.loads(s.path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        reread = {}
+    if reread.get("cwd") != new_cwd:
+        shutil.copy2(backup, s.path)  # restore from backup
+        return False
+    return True
+
+
 def mode_rebind(args, accounts: list[Account]) -> int:
     """Fix a session's recorded cwd after a folder move.
 
     Backs up each wrapper OUTSIDE the live store, atomically rewrites
     cwd/originCwd/worktreePath, bridges the transcript into the new munged
     project dir (Desktop resolves it via enc(cwd)), and verifies by re-read.
+    With --from-prefix/--to-prefix it does that for a whole moved tree
+    (mode_rebind_prefix).
     """
+    if args.from_prefix or args.to_prefix:
+        return mode_rebind_prefix(args, accounts)
     if not args.target:
-        eecho("usage: summon rebind <id> --cwd <newpath>")
+        eecho("usage: summon rebind <id> --cwd <newpath>",
+              "       summon rebind --from-prefix <old-root> --to-prefix <new-root>")
         return 2
     if not args.cwd:
         eecho("rebind needs --cwd <newpath> — the folder's new location")
@@ -1187,29 +2243,8 @@ def mode_rebind(args, accounts: list[Account]) -> int:
                       last=is_last, depth=1))
             continue
 
-        # 1. Backup outside the live store
-        backup_root.mkdir(parents=True, exist_ok=True)
-        backup = backup_root / f"{s.account.uuid}__{s.path.parent.name}__{s.path.name}"
-        shutil.copy2(s.path, backup)
-
-        # 2. Atomic rewrite
-        data = dict(s.data)
-        data["cwd"] = new_cwd
-        for field in ("originCwd", "worktreePath"):
-            if field in data:
-                data[field] = _rebase_path(str(data[field] or ""), s.cwd, new_cwd)
-        tmp = s.path.with_name(s.path.name + ".tmp")
-        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        os.replace(tmp, s.path)
-
-        # 3. Verify by re-read
-        try:
-            reread = json.loads(s.path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            reread = {}
-        if reread.get("cwd") != new_cwd:
+        if not _rewrite_wrapper(s, new_cwd, backup_root):
             problems += 1
-            shutil.copy2(backup, s.path)  # restore from backup
             echo(leaf(0, label, meta=Term.color("alarm", "verify FAILED — restored"),
                       last=is_last, depth=1))
             continue
@@ -1219,8 +2254,10 @@ def mode_rebind(args, accounts: list[Account]) -> int:
     # 4. Transcript bridge — Desktop looks in enc(new cwd) after the rebind
     s0 = matches[0]
     if s0.cli_id:
-        old_transcript, how = resolve_transcript(s0)  # s0.data still holds OLD cwd
+        old_transcript, how = resolve_transcript(s0)  # s0.cwd still holds OLD cwd
         new_dir = cli_jsonl_root() / encode_cwd(new_cwd)
+        # Claude Code only opens <id>.jsonl: an archived transcript is
+        # restored before it is bridged, never bridged compressed
         new_transcript = new_dir / f"{s0.cli_id}.jsonl"
         if new_transcript.exists():
             transcript_note = "transcript already at new path"
@@ -1230,11 +2267,27 @@ def mode_rebind(args, accounts: list[Account]) -> int:
         elif args.no_transcript:
             transcript_note = f"transcript NOT copied (--no-transcript): {old_transcript}"
         elif args.dry_run:
-            transcript_note = f"would copy transcript {Term.g('→', '->')} {new_transcript}"
+            verb = "link" if args.link else "copy"
+            if is_archived(old_transcript):
+                verb = f"restore the archived transcript and {verb} it"
+            else:
+                verb += " transcript"
+            transcript_note = f"would {verb} {Term.g('→', '->')} {new_transcript}"
         else:
-            new_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(old_transcript, new_transcript)
-            transcript_note = f"transcript copied ({how}) {Term.g('→', '->')} {new_transcript}"
+            try:
+                old_transcript = restore_for_use(old_transcript)
+            except OSError as e:
+                old_transcript = None
+                problems += 1
+                transcript_note = (f"transcript NOT bridged — archived and could not "
+                                   f"be restored ({e}); {_restore_hint(s0)}")
+            if old_transcript:
+                new_dir.mkdir(parents=True, exist_ok=True)
+                method = link_or_copy(old_transcript, new_transcript, link=args.link)
+                _forget_transcript_locations()
+                verb = "copied" if method == "copy" else f"{method}ed"
+                transcript_note = (f"transcript {verb} ({how}) {Term.g('→', '->')} "
+                                   f"{new_transcript}")
 
     echo(panel_blank())
     if transcript_note:
@@ -1257,21 +2310,211 @@ def mode_rebind(args, accounts: list[Account]) -> int:
     return 1 if problems else 0
 
 
-_RECOVERY_INSTRUCTION = (
-    "First read only the TAIL of the transcript (last ~150-200 lines) to see where "
-    "it left off — do not ingest the whole file; read earlier chunks selectively "
-    "only if something is unclear. Then: summarize the session state in a few "
-    "bullets (goal, what's done, what was in flight, blockers), and continue the "
-    "work from there in the current directory."
-)
+def _is_root_prefix(prefix: str) -> bool:
+    """Empty, `/`, or a bare drive (`C:`, `C:\\`) — a prefix everything is under."""
+    return bool(re.fullmatch(r"(?:[A-Za-z]:)?", prefix.rstrip("/\\")))
 
 
-# --- Distilled handover: extract -> distill -> cache -> emit -----------------
+def _under_prefix(path: str, prefix: str) -> bool:
+    """path is prefix itself or inside it (component-wise, either separator;
+    case-insensitive where the filesystem is). Never true for a root prefix."""
+    if _is_root_prefix(prefix):
+        return False
+    p, q = os.path.normcase(path), os.path.normcase(prefix.rstrip("/\\"))
+    return p == q or (p.startswith(q) and p[len(q)] in "/\\")
+
+
+def _swap_prefix(path: str, old: str, new: str) -> str:
+    """path with its leading `old` replaced by `new` (path under old)."""
+    old, new = old.rstrip("/\\"), new.rstrip("/\\")
+    return new + path[len(old):]
+
+
+def sessions_under_prefix(prefix: str, accounts: list[Account]) -> list[Session]:
+    """Every local wrapper whose cwd is `prefix` or under it — one index query
+    (a lower-cased prefix pre-filter, then the exact component-wise test).
+    The pre-filter folds `/` into `\\` on both sides, so it never drops a
+    mixed-separator match that _under_prefix accepts on Windows."""
+    root = prefix.rstrip("/\\")
+    indexed = _indexed_sessions(
+        accounts, "is_remote = 0 AND substr(replace(cwd_lc, '/', '\\'), 1, ?) = ?",
+        [len(root), root.lower().replace("/", "\\")])
+    if indexed is None:
+        indexed = [s for acct in accounts for s in _load_sessions_direct(acct)
+                   if not s.is_remote]
+    return [s for s in indexed if s.cwd and _under_prefix(s.cwd, root)]
+
+
+def mode_rebind_prefix(args, accounts: list[Account]) -> int:
+    """`summon rebind --from-prefix OLD --to-prefix NEW` — rebind a moved tree.
+
+    One index pass finds every wrapper bound under OLD; all of them are backed
+    up into ONE backup root and rewritten (same backup -> atomic rewrite ->
+    verify -> restore-on-mismatch as a single rebind) by a pool of --jobs
+    workers; then every transcript dir the new cwds need is created in one
+    step and the transcripts are bridged (copied, or --link'ed).
+    """
+    if not (args.from_prefix and args.to_prefix):
+        eecho("usage: summon rebind --from-prefix <old-root> --to-prefix <new-root>")
+        return 2
+    if args.target:
+        eecho("rebind takes either a session id or --from-prefix/--to-prefix, not both")
+        return 2
+    if _is_root_prefix(args.from_prefix):
+        eecho(f"refusing --from-prefix {args.from_prefix!r}: a filesystem root would "
+              "rebind every session — name the folder that moved")
+        return 2
+    old_root = args.from_prefix.rstrip("/\\")
+    new_path = Path(args.to_prefix)
+    if new_path.exists():
+        new_root = str(new_path.resolve())
+    elif args.force:
+        new_root = args.to_prefix.rstrip("/\\")
+    else:
+        eecho(f"new prefix does not exist on disk: {args.to_prefix}",
+              "(pass --force to rebind to a not-yet-existing path)")
+        return 3
 
-EXTRACT_BUDGET_DEFAULT = 120_000   # chars of conversation fed to the distiller
-VERBATIM_TAIL_TURNS = 15           # final turns always included in full
-HEAD_TURN_CAP = 4_000              # per-turn cap for pre-tail turns (giant pastes)
-DISTILL_TIMEOUT_S = 60
+    matches = sessions_under_prefix(old_root, accounts)
+    if not matches:
+        eecho(f"no session bound under: {old_root}")
+        return 3
+    plan = [(s, _swap_prefix(s.cwd, old_root, new_root)) for s in matches]
+
+    sep = Term.g("·", "|")
+    arrow = Term.g("→", "->")
+    n_logical = len({s.sid for s in matches})
+    echo(panel_open(f"summon {sep} rebind",
+                    indicator="dry-run" if args.dry_run
+                    else f"{n_logical} session(s)"))
+    echo(panel_blank())
+    echo(summary_line(old_root))
+    echo(summary_line(f"{arrow} {new_root}"))
+    echo(panel_blank())
+
+    # Transcript bridges, resolved while the wrappers still hold the OLD cwd:
+    # one per logical session (cliSessionId), whichever account copy.
+    bridges: dict[str, tuple[Path | None, str, Path]] = {}
+    for s, new_cwd in plan:
+        if s.cli_id and s.cli_id not in bridges:
+            old_transcript, how = resolve_transcript(s)
+            # always the plain name: archives are restored before bridging
+            new_transcript = cli_jsonl_root() / encode_cwd(new_cwd) / f"{s.cli_id}.jsonl"
+            bridges[s.cli_id] = (old_transcript, how, new_transcript)
+
+    problems = 0
+    rebound: set[str] = set()  # cliSessionIds with at least one wrapper rewritten
+    if args.dry_run:
+        for i, (s, new_cwd) in enumerate(plan):
+            echo(leaf(0, f"{s.account.short}/{s.path.name}",
+                      meta=Term.color("meta", f"would rebind {arrow} {new_cwd}"),
+                      last=i == len(plan) - 1, depth=1))
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        backup_root = Path.home() / ".claude" / "summon-backups" / stamp
+        backup_root.mkdir(parents=True, exist_ok=True)
+
+        def rebind_one(item: tuple[Session, str]) -> bool:
+            s, new_cwd = item
+            rebase = (lambda v: _swap_prefix(v, old_root, new_root)
+                      if v and _under_prefix(v, old_root)
+                      else _rebase_path(v, s.cwd, new_cwd))
+            try:
+                return _rewrite_wrapper(s, new_cwd, backup_root, rebase)
+            except OSError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(_jobs(args), len(plan))) as pool:
+            results = list(pool.map(rebind_one, plan))
+        for i, ((s, new_cwd), good) in enumerate(zip(plan, results)):
+            problems += not good
+            if good:
+                rebound.add(s.cli_id)
+            meta = (Term.color("ok", "rebound") if good
+                    else Term.color("alarm", "FAILED — restored"))
+            echo(leaf(0, f"{s.account.short}/{s.path.name}", meta=meta,
+                      last=i == len(plan) - 1, depth=1))
+
+    # Bridge the transcripts: every new project dir created in one step, then
+    # one copy / link per logical session.
+    counts: dict[str, int] = {}
+    todo = []
+    for cli, (old_transcript, how, new_transcript) in bridges.items():
+        if not args.dry_run and cli not in rebound:
+            # no wrapper points at the new cwd — a bridge there would be an orphan
+            counts["skipped (rewrite failed)"] = counts.get("skipped (rewrite failed)", 0) + 1
+        elif new_transcript.exists():
+            counts["already there"] = counts.get("already there", 0) + 1
+        elif not old_transcript:
+            counts["missing"] = counts.get("missing", 0) + 1
+            problems += 1
+        else:
+            todo.append((old_transcript, new_transcript))
+    if todo and args.no_transcript:
+        counts["not bridged (--no-transcript)"] = len(todo)
+    elif todo and args.dry_run:
+        counts["would " + ("link" if args.link else "copy")] = len(todo)
+        sealed = sum(is_archived(old) for old, _ in todo)
+        if sealed:
+            counts["archived — would restore first"] = sealed
+    elif todo:
+        for d in {new for _, new in todo}:
+            d.parent.mkdir(parents=True, exist_ok=True)
+        for old_transcript, new_transcript in todo:
+            try:
+                if is_archived(old_transcript):
+                    old_transcript = restore_for_use(old_transcript)
+                    counts["restored"] = counts.get("restored", 0) + 1
+                method = link_or_copy(old_transcript, new_transcript, link=args.link)
+            except OSError:
+                problems += 1
+                label = ("archived, restore failed — `summon archive --restore "
+                         f"{Path(old_transcript.stem).stem}` first"
+                         if is_archived(old_transcript) else "failed")
+            else:
+                label = "copied" if method == "copy" else f"{method}ed"
+            counts[label] = counts.get(label, 0) + 1
+        _forget_transcript_locations()
+
+    echo(panel_blank())
+    if counts:
+        echo(summary_line("transcripts: " + f" {sep} ".join(
+            f"{n} {label}" for label, n in counts.items())))
+    if not args.dry_run:
+        echo(summary_line(f"backup: {backup_root}"))
+    echo(panel_blank())
+    healths = [("ok", f"{len(plan)} wrapper(s) in {n_logical} session(s)")]
+    if problems:
+        healths.append(("alarm", f"{problems} problem(s)"))
+    echo(panel_close(healths=healths))
+    if not args.dry_run and not problems:
+        echo()
+        echo(Term.color("warn",
+             "next: restart Desktop (or Logout/Login) so the sidebar re-reads the wrappers."))
+        if any(any(m in cwd for m in _WORKTREE_MARKERS) for _, cwd in plan):
+            echo(Term.color("meta",
+                 "  git worktree links break on folder moves — run "
+                 "`git worktree repair` from each moved repo root."))
+    return 1 if problems else 0
+
+
+_RECOVERY_INSTRUCTION = (
+    "First read only the TAIL of the transcript (last ~150-200 lines) to see where "
+    "it left off — do not ingest the whole file; read earlier chunks selectively "
+    "only if something is unclear. Then: summarize the session state in a few "
+    "bullets (goal, what's done, what was in flight, blockers), and continue the "
+    "work from there in the current directory."
+)
+
+
+# --- Distilled handover: extract -> distill -> cache -> emit -----------------
+
+EXTRACT_BUDGET_DEFAULT = 120_000   # chars of conversation fed to the distiller
+VERBATIM_TAIL_TURNS = 15           # final turns always included in full
+HEAD_TURN_CAP = 4_000              # per-turn cap for pre-tail turns (giant pastes)
+DISTILL_TIMEOUT_S = 60
+DISTILL_JOBS_DEFAULT = 4           # concurrent `claude -p` calls: LLM rate limits, not cores
 DISTILL_MODEL_DEFAULT = "sonnet"
 
 _DISTILL_INSTRUCTION = """\
@@ -1319,48 +2562,80 @@ def extract_conversation(transcript: Path, budget: int = EXTRACT_BUDGET_DEFAULT)
     always included in full; earlier turns fill the remaining budget from the
     START (so the goal statement survives), with the middle elided when the
     session is too long to fit.
+
+    Two bounded passes instead of holding every turn: the tail is collected
+    walking back from EOF (iter_lines_reverse), then the head is read forward
+    from the start only until the budget is spent or the tail is reached. An
+    archived transcript can't be walked backwards, so its tail comes from a
+    forward pass holding just the last VERBATIM_TAIL_TURNS turns, and the
+    head pass reopens the stream.
     """
-    turns: list[tuple[str, str]] = []
+    import contextlib
+    sealed = is_archived(transcript)
     try:
-        with transcript.open("r", encoding="utf-8", errors="replace") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                role = rec.get("type")
-                if role not in ("user", "assistant"):
-                    continue
-                text = _text_only(rec.get("message", {}).get("content")).strip()
-                if text:
-                    turns.append((role, text))
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(open_transcript(transcript))
+            tail: list[tuple[str, str]] = []
+            tail_start = 0
+            reached_bof = True
+            if sealed:
+                from collections import deque
+                last: deque = deque(maxlen=VERBATIM_TAIL_TURNS)
+                pos = seen = 0
+                for raw in f:
+                    turn = _conversation_turn(raw)
+                    if turn:
+                        last.append((pos, turn))
+                        seen += 1
+                    pos += len(raw)
+                if last:
+                    tail_start = last[0][0]
+                    tail = [turn for _, turn in last]
+                    reached_bof = seen <= VERBATIM_TAIL_TURNS
+            else:
+                for offset, raw in iter_lines_reverse(f):
+                    turn = _conversation_turn(raw)
+                    if turn:
+                        tail.append(turn)
+                        tail_start = offset
+                        if len(tail) == VERBATIM_TAIL_TURNS:
+                            reached_bof = offset == 0
+                            break
+                tail.reverse()
+            if not tail:
+                return ""
+            tail_block = "\n\n".join(_fmt_turn(r, t) for r, t in tail)
+            if len(tail_block) >= budget:
+                return tail_block[-budget:]  # most recent state wins
+
+            remaining = budget - len(tail_block)
+            head_parts: list[str] = []
+            elided = False
+            if not reached_bof:
+                if sealed:
+                    f = stack.enter_context(open_transcript(transcript))
+                else:
+                    f.seek(0)
+                pos = 0
+                for raw in f:
+                    if pos >= tail_start:
+                        break
+                    pos += len(raw)
+                    turn = _conversation_turn(raw)
+                    if not turn:
+                        continue
+                    r, t = turn
+                    if len(t) > HEAD_TURN_CAP:
+                        t = t[:HEAD_TURN_CAP] + " …[turn truncated]"
+                    piece = _fmt_turn(r, t)
+                    cost = len(piece) + 2
+                    if cost > remaining:
+                        elided = True
+                        break
+                    head_parts.append(piece)
+                    remaining -= cost
     except OSError:
         return ""
-    if not turns:
-        return ""
-
-    def fmt(role: str, text: str) -> str:
-        return f"{role.upper()}: {text}"
-
-    tail = turns[-VERBATIM_TAIL_TURNS:]
-    head = turns[:-VERBATIM_TAIL_TURNS]
-    tail_block = "\n\n".join(fmt(r, t) for r, t in tail)
-    if len(tail_block) >= budget:
-        return tail_block[-budget:]  # most recent state wins
-
-    remaining = budget - len(tail_block)
-    head_parts: list[str] = []
-    elided = not head
-    for r, t in head:
-        if len(t) > HEAD_TURN_CAP:
-            t = t[:HEAD_TURN_CAP] + " …[turn truncated]"
-        piece = fmt(r, t)
-        cost = len(piece) + 2
-        if cost > remaining:
-            elided = True
-            break
-        head_parts.append(piece)
-        remaining -= cost
 
     parts = list(head_parts)
     if elided and head_parts:
@@ -1369,46 +2644,82 @@ def extract_conversation(transcript: Path, budget: int = EXTRACT_BUDGET_DEFAULT)
     return "\n\n".join(parts)
 
 
-def handover_cache_path(transcript: Path) -> Path:
+def _conversation_turn(raw: bytes) -> tuple[str, str] | None:
+    """(role, text) for a user/assistant line with conversational text, else None."""
+    rec = _conversation_record(raw)
+    role = rec.get("type")
+    if role not in ("user", "assistant"):
+        return None
+    msg = rec.get("message")
+    text = _text_only(msg.get("content") if isinstance(msg, dict) else None).strip()
+    return (role, text) if text else None
+
+
+def _fmt_turn(role: str, text: str) -> str:
+    return f"{role.upper()}: {text}"
+
+
+def handover_key(extraction: str, model: str) -> str:
+    """Content address of a brief: sha256 over the distiller's whole input
+    that matters — instruction, model, extraction. Path and mtime play no
+    part, so a transcript copied across accounts, bridged by rebind or merely
+    touched still hits; any new conversational text changes the key."""
+    import hashlib
+    h = hashlib.sha256()
+    for part in (_DISTILL_INSTRUCTION, model, extraction):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def handover_cache_path(key: str) -> Path:
+    """The shared brief store: cache_root()/handover/<key>.md."""
+    return cache_root() / "handover" / f"{key}.md"
+
+
+def handover_mirror_path(transcript: Path) -> Path:
+    """Human-facing copy of the latest brief, next to the transcript."""
     return transcript.with_name(transcript.name + ".handover.md")
 
 
-def load_cached_brief(transcript: Path, *, refresh: bool) -> str | None:
-    """Cached brief, valid only when newer than the transcript itself."""
+def load_cached_brief(key: str, *, refresh: bool) -> str | None:
+    """The brief distilled from this exact input before, if any."""
     if refresh:
         return None
-    cache = handover_cache_path(transcript)
     try:
-        if cache.exists() and cache.stat().st_mtime > transcript.stat().st_mtime:
-            text = cache.read_text(encoding="utf-8").strip()
-            return text or None
+        text = handover_cache_path(key).read_text(encoding="utf-8").strip()
     except OSError:
-        pass
-    return None
+        return None
+    return text or None
 
 
-def store_brief(transcript: Path, brief: str) -> None:
-    cache = handover_cache_path(transcript)
-    tmp = cache.with_name(cache.name + ".tmp")
-    try:
-        tmp.write_text(brief + "\n", encoding="utf-8")
-        os.replace(tmp, cache)
-    except OSError as e:
-        eecho(f"warning: could not cache handover brief at {cache}: {e}")
+def store_brief(key: str, brief: str, transcript: Path) -> None:
+    """Write the brief under its key, and mirror it next to the transcript."""
+    for cache in (handover_cache_path(key), handover_mirror_path(transcript)):
+        tmp = cache.with_name(cache.name + ".tmp")
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(brief + "\n", encoding="utf-8")
+            os.replace(tmp, cache)
+        except OSError as e:
+            eecho(f"warning: could not cache handover brief at {cache}: {e}")
 
 
-def distill_brief(extraction: str, s: Session, model: str) -> str | None:
+def distill_brief(extraction: str, s: Session, model: str,
+                  announce: bool = True) -> str | None:
     """One-shot tool-less `claude -p` summarisation (gated child: dontAsk,
     no allowlist — per loop-engineering, never bypassPermissions).
 
     Returns None on any worker unavailability — absent CLI, non-zero exit,
     timeout, empty output — with a stderr warning. Advisory, never fatal.
+    ``announce`` False drops the per-call progress line (batch mode reports
+    once at the end instead).
     """
     claude_bin = shutil.which("claude")
     if not claude_bin:
         eecho("warning: `claude` CLI not on PATH — emitting non-distilled pointer prompt")
         return None
-    branch = str(s.data.get("branch") or "")
+    branch = s.branch
     payload = (
         _DISTILL_INSTRUCTION
         + "\n--- SESSION METADATA ---\n"
@@ -1417,8 +2728,9 @@ def distill_brief(extraction: str, s: Session, model: str) -> str | None:
         + extraction
     )
     import subprocess
-    eecho(f"distilling handover brief via `claude -p --model {model}` "
-          f"({len(extraction)} chars in, ~{DISTILL_TIMEOUT_S}s timeout)…")
+    if announce:
+        eecho(f"distilling handover brief via `claude -p --model {model}` "
+              f"({len(extraction)} chars in, ~{DISTILL_TIMEOUT_S}s timeout)…")
     try:
         r = subprocess.run(
             [claude_bin, "-p", "--model", model, "--permission-mode", "dontAsk"],
@@ -1446,7 +2758,7 @@ def distill_brief(extraction: str, s: Session, model: str) -> str | None:
 
 
 def _pointer_clause(s: Session, transcript: Path) -> str:
-    branch = str(s.data.get("branch") or "")
+    branch = s.branch
     ident = s.sid.removeprefix("local_") or s.cli_id
     branch_part = f", branch {branch}" if branch else ""
     return (f"Full transcript at {transcript} (session {ident}{branch_part}); "
@@ -1456,8 +2768,9 @@ def _pointer_clause(s: Session, transcript: Path) -> str:
 def emit_recovery_prompt(s: Session, args) -> int:
     """Print a paste-ready recovery prompt for a new session (stdout = the prompt).
 
-    Default flow: extract conversation -> distill via `claude -p` -> cache the
-    brief at <transcript>.handover.md -> emit brief + pointer clause. Falls
+    Default flow: extract conversation -> reuse the brief cached under the
+    extraction's handover_key, or distill via `claude -p` and cache it -> emit
+    brief + pointer clause. Falls
     back to the plain pointer prompt when distillation is unavailable/disabled.
     """
     transcript, how = resolve_transcript(s)
@@ -1475,26 +2788,34 @@ def emit_recovery_prompt(s: Session, args) -> int:
     if not transcript:
         eecho(f"no transcript found for cliSessionId {s.cli_id or '(none)'} — cannot recover")
         return 3
+    # the pointer sends a model to read the file's tail: it must be plain JSONL
+    try:
+        transcript = restore_for_use(transcript)
+    except OSError as e:
+        eecho(f"transcript is archived and could not be restored: {e}", _restore_hint(s))
+        return 1
 
-    branch = str(s.data.get("branch") or "")
+    branch = s.branch
 
     # --- Distilled handover path ---
     if not getattr(args, "no_distill", False):
-        brief = load_cached_brief(transcript, refresh=getattr(args, "refresh", False))
-        if brief:
-            eecho(f"reusing cached handover brief: {handover_cache_path(transcript)} "
-                  "(--refresh to re-distill)")
-        else:
-            extraction = extract_conversation(
-                transcript, getattr(args, "budget", EXTRACT_BUDGET_DEFAULT))
-            if extraction:
-                brief = distill_brief(extraction, s,
-                                      getattr(args, "model", DISTILL_MODEL_DEFAULT))
-                if brief:
-                    store_brief(transcript, brief)
+        brief = None
+        model = getattr(args, "model", DISTILL_MODEL_DEFAULT)
+        extraction = extract_conversation(
+            transcript, getattr(args, "budget", EXTRACT_BUDGET_DEFAULT))
+        if extraction:
+            key = handover_key(extraction, model)
+            brief = load_cached_brief(key, refresh=getattr(args, "refresh", False))
+            if brief:
+                eecho(f"reusing cached handover brief: {handover_cache_path(key)} "
+                      "(--refresh to re-distill)")
             else:
-                eecho("warning: transcript has no conversational text — "
-                      "emitting non-distilled pointer prompt")
+                brief = distill_brief(extraction, s, model)
+                if brief:
+                    store_brief(key, brief, transcript)
+        else:
+            eecho("warning: transcript has no conversational text — "
+                  "emitting non-distilled pointer prompt")
         if brief:
             lines = [f"Continue a previous Claude session: {s.title!r}."]
             if branch:
@@ -1525,8 +2846,11 @@ def emit_recovery_prompt(s: Session, args) -> int:
 
 
 def mode_recover(args, accounts: list[Account]) -> int:
+    if not args.target and (args.all or args.days is not None):
+        return recover_batch(args, accounts)
     if not args.target:
-        eecho("usage: summon recover <id>   (sessionId or cliSessionId, prefix ok)")
+        eecho("usage: summon recover <id>   (sessionId or cliSessionId, prefix ok)\n"
+              "       summon recover --all [--days N] [--jobs N]   (refresh briefs in bulk)")
         return 2
     matches, ambiguous = find_wrappers_by_id(args.target, accounts)
     if not matches:
@@ -1540,6 +2864,115 @@ def mode_recover(args, accounts: list[Account]) -> int:
     return emit_recovery_prompt(matches[0], args)
 
 
+def recover_batch(args, accounts: list[Account]) -> int:
+    """`summon recover --all [--days N] [--jobs N]` — refresh the cached
+    handover brief of every session in the window.
+
+    Each `claude -p` call is a blocking subprocess of up to
+    DISTILL_TIMEOUT_S, so extraction + distillation run in a bounded thread
+    pool (the work is subprocess-bound; threads are enough). Sessions whose
+    cached brief is still valid are skipped, and transcripts with identical
+    extractions (wrapper copies, transferred or bridged transcripts) share
+    one handover key and so one distillation. The run ends with throughput
+    and failure counts. Nothing goes to stdout but the report — the product
+    is the cache.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    candidates = query_sessions(accounts, days=args.days,
+                                cwd_pattern=args.cwd, title_pattern=args.title)
+    work: dict[str, tuple[Session, Path]] = {}
+    missing = 0
+    for s in candidates:
+        if s.is_remote:
+            continue
+        transcript = resolve_transcript(s)[0]
+        if transcript is None:
+            missing += 1
+        elif str(transcript) not in work:
+            work[str(transcript)] = (s, transcript)
+    if not work:
+        eecho(f"no sessions with a transcript match ({_window_label(args.days)})")
+        return 3
+    if args.no_distill:
+        eecho("--no-distill: nothing to do in batch mode (briefs are the product)")
+        return 0
+    if not shutil.which("claude"):
+        eecho("warning: `claude` CLI not on PATH — nothing to distill")
+        return 0
+
+    items = list(work.values())
+    jobs = min(_jobs(args, DISTILL_JOBS_DEFAULT), len(items))
+
+    def distill(key: str) -> tuple[str, str | None]:
+        brief = load_cached_brief(key, refresh=args.refresh)
+        if brief:
+            return "cached", brief
+        first = groups[key][0]
+        brief = distill_brief(extracted[first], items[first][0], args.model,
+                              announce=False)
+        return ("distilled" if brief else "failed"), brief
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        extracted = list(pool.map(
+            lambda item: extract_conversation(item[1], args.budget), items))
+        groups: dict[str, list[int]] = {}
+        for i, text in enumerate(extracted):
+            if text:
+                groups.setdefault(handover_key(text, args.model), []).append(i)
+        outcomes = dict(zip(groups, pool.map(distill, groups)))
+    elapsed = time.perf_counter() - t0
+
+    counts = {"cached": 0, "distilled": 0, "empty": 0, "failed": 0}
+    status_of = ["empty"] * len(items)
+    for key, members in groups.items():
+        status, brief = outcomes[key]
+        for n, i in enumerate(members):
+            # Copies beyond the first rode along on one distillation.
+            status_of[i] = "cached" if status == "distilled" and n else status
+            if status == "distilled":
+                store_brief(key, brief, items[i][1])
+    rows = []
+    for (s, transcript), status in zip(items, status_of):
+        counts[status] += 1
+        rows.append({"sessionId": s.sid, "title": s.title,
+                     "transcriptPath": str(transcript), "status": status})
+    calls = sum(1 for st, _ in outcomes.values() if st != "cached")
+    chars = sum(len(t) for t in extracted)
+    per_min = calls / elapsed * 60 if elapsed > 0 else 0.0
+
+    if args.json:
+        print(json.dumps({
+            "data": rows,
+            "meta": {"count": len(rows), **counts, "transcriptMissing": missing,
+                     "distillCalls": calls, "jobs": jobs, "elapsedS": round(elapsed, 2),
+                     "sessionsPerMin": round(per_min, 1), "extractedChars": chars,
+                     "schema": "claude-mods.summon.recover-batch/v1"},
+        }, indent=2))
+        return 0
+
+    sep = Term.g("·", "|")
+    echo(panel_open(f"summon {sep} recover --all", indicator=_window_label(args.days)))
+    echo(panel_blank())
+    for r in rows:
+        if r["status"] in ("failed", "empty"):
+            tone = "alarm" if r["status"] == "failed" else "meta"
+            echo(leaf(0, r["title"], meta=Term.color(tone, r["status"]), depth=1))
+    echo(summary_line(f"{len(rows)} transcript(s) {sep} {counts['distilled']} distilled "
+                      f"{sep} {counts['cached']} cached {sep} {counts['failed']} failed "
+                      f"{sep} {counts['empty']} empty"
+                      + (f" {sep} {missing} missing" if missing else "")))
+    echo(summary_line(f"{elapsed:.1f}s with {jobs} job(s) {sep} {per_min:.1f} sessions/min "
+                      f"{sep} {chars // 1000}k chars extracted"))
+    echo(panel_blank())
+    healths = [("ok", f"{counts['distilled'] + counts['cached']} brief(s) current")]
+    if counts["failed"]:
+        healths.append(("alarm", f"{counts['failed']} failed"))
+    echo(panel_close(healths=healths))
+    return 0
+
+
 def _is_live(s: Session, now_ms: int) -> bool:
     """Heuristic 'running state': wrapper touched within the last 10 minutes."""
     recent = now_ms - 10 * 60_000
@@ -1556,6 +2989,65 @@ def _cwd_broken(s: Session) -> bool:
     return not (bool(s.cwd) and Path(s.cwd).exists())
 
 
+def _path_exists(path: str) -> bool:
+    try:
+        return Path(path).exists()
+    except OSError:
+        return False
+
+
+def stat_paths(paths: Iterable[str], *, jobs: int, timeout: float,
+               check=_path_exists) -> dict[str, bool | None]:
+    """path -> exists, for each distinct path; None when the stat timed out.
+
+    A stat against an unmounted network volume can block for minutes, so the
+    checks run on up to `jobs` daemon threads and any single path that takes
+    longer than `timeout` seconds is given up on: its worker is abandoned
+    (daemon, so it can't hold the interpreter open) and a fresh one takes its
+    place, so one dead mount costs `timeout` once instead of stalling the run.
+    """
+    import queue
+    import threading
+    todo = list(dict.fromkeys(paths))
+    out: dict[str, bool | None] = {}
+    if not todo:
+        return out
+    pending: "queue.Queue[str]" = queue.Queue()
+    for path in todo:
+        pending.put(path)
+    done: "queue.Queue[tuple[str, bool]]" = queue.Queue()
+    started: dict[str, float] = {}  # path -> monotonic start, while in flight
+
+    def worker() -> None:
+        while True:
+            try:
+                path = pending.get_nowait()
+            except queue.Empty:
+                return
+            started[path] = time.monotonic()
+            done.put((path, check(path)))
+
+    def spawn() -> None:
+        threading.Thread(target=worker, daemon=True, name="summon-stat").start()
+
+    for _ in range(min(max(1, jobs), len(todo))):
+        spawn()
+    while len(out) < len(todo):
+        try:
+            path, ok = done.get(timeout=0.05)
+        except queue.Empty:
+            now = time.monotonic()
+            for path, t0 in list(started.items()):
+                if path not in out and now - t0 >= timeout:
+                    out[path] = None
+                    started.pop(path, None)
+                    spawn()
+            continue
+        started.pop(path, None)
+        out.setdefault(path, ok)  # a late answer after a timeout stays None
+    return out
+
+
 def _iso_utc(ms: int) -> str:
     """Epoch-ms -> ISO-8601 Z, '' for the unset 0."""
     if not ms:
@@ -1563,7 +3055,8 @@ def _iso_utc(ms: int) -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ms / 1000))
 
 
-def session_rows(candidates: list[Session], now_ms: int, rich: bool = False) -> list[dict]:
+def session_rows(candidates: list[Session], now_ms: int, rich: bool = False,
+                 jobs: int = 1) -> list[dict]:
     """Build the pick inventory rows for a set of sessions (in-process).
 
     The single source of truth for a session's machine-readable shape — shared
@@ -1574,12 +3067,21 @@ def session_rows(candidates: list[Session], now_ms: int, rich: bool = False) ->
 
     With ``rich`` each row gains transcript-derived display metrics (context
     occupancy, activity density, event/tool counts, size, duration, opening
-    ask) at the cost of one linear transcript read per session; without it the
-    rows are metadata-only and instant.
+    ask) at the cost of one linear transcript read per session (only the
+    unread tail, once checkpointed); without it the rows are metadata-only and
+    instant. ``jobs`` > 1 fans the transcript reads out across worker
+    processes — rows, and so the serialized output, are identical either way.
     """
-    rows = []
-    for s in candidates:
-        transcript = resolve_transcript(s)[0]
+    return list(iter_session_rows(candidates, now_ms, rich, jobs))
+
+
+def iter_session_rows(candidates: list[Session], now_ms: int, rich: bool = False,
+                      jobs: int = 1) -> Iterator[dict]:
+    """session_rows() one row at a time, each yielded as soon as its
+    transcript is analyzed — what `pick --ndjson` streams."""
+    transcripts = [resolve_transcript(s)[0] for s in candidates]
+    metrics = _iter_rich_metrics(transcripts, jobs) if rich else None
+    for s, transcript in zip(candidates, transcripts):
         row = {
             "id": s.sid.removeprefix("local_")[:8],
             "sessionId": s.sid,
@@ -1588,11 +3090,11 @@ def session_rows(candidates: list[Session], now_ms: int, rich: bool = False) ->
             "cwd": s.cwd,
             "projectRoot": project_root(s.cwd),
             "worktree": worktree_name(s.cwd),
-            "branch": str(s.data.get("branch") or ""),
-            "model": str(s.data.get("model") or ""),
-            "effort": str(s.data.get("effort") or ""),
+            "branch": s.branch,
+            "model": s.model,
+            "effort": s.effort,
             "turns": s.turns,
-            "isArchived": bool(s.data.get("isArchived")),
+            "isArchived": s.archived,
             "isRunning": _is_live(s, now_ms),
             "brokenCwd": _cwd_broken(s),
             "lastActivityAt": _iso_utc(s.last_activity_ms),
@@ -1600,8 +3102,8 @@ def session_rows(candidates: list[Session], now_ms: int, rich: bool = False) ->
             "accountEmail": s.account.email,
             "transcriptPath": str(transcript) if transcript else None,
         }
-        if rich:
-            m = analyze_transcript(transcript)
+        if metrics is not None:
+            m = next(metrics)
             window = 1_000_000 if m["ctxPeak"] > 200_000 else 200_000
             row.update({
                 "events": m["events"],
@@ -1616,11 +3118,95 @@ def session_rows(candidates: list[Session], now_ms: int, rich: bool = False) ->
                 "ctxPeakPct": round(min(100, m["ctxPeak"] / window * 100)) if window else 0,
                 "firstAsk": m["firstAsk"],
             })
-        rows.append(row)
-    return rows
+        yield row
+
+
+# Below this much unread transcript the pool's start-up (a fresh interpreter
+# per worker on Windows/macOS) costs more than the JSON decoding it spreads.
+RICH_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _rich_metrics(transcripts: list[Path | None], jobs: int) -> list[dict]:
+    """analyze_transcript() for many transcripts, in input order (memoized
+    in memory under `summon serve`)."""
+    return list(_iter_rich_metrics(transcripts, jobs))
+
+
+def _iter_rich_metrics(transcripts: list[Path | None], jobs: int) -> Iterator[dict]:
+    """_rich_metrics, yielding each result as soon as it is ready."""
+    if _HOT is not None:
+        return iter(_HOT.metrics(transcripts, jobs))
+    return _scan_rich_metrics(transcripts, jobs)
+
+
+# Checkpoints from a streaming scan are committed in batches of this many, so
+# a consumer that stops reading early (`| head`) still keeps most of the work.
+CHECKPOINT_BATCH = 64
+
+
+def _scan_rich_metrics(transcripts: list[Path | None], jobs: int) -> Iterator[dict]:
+    """The checkpointed transcript scans behind _rich_metrics, in input order.
+
+    With jobs > 1 and enough unread bytes, the scans run in a bounded process
+    pool (JSON decoding is CPU-bound, so threads wouldn't help). Workers run
+    the pure _analyze(); checkpoints are loaded before the fan-out and stored
+    by this process as results arrive, so only one writer ever touches the
+    index. Should the pool break mid-way, the rest is analyzed serially. A
+    consumer that stops early (a closed pipe, an abandoned generator) cancels
+    the queued scans instead of waiting for the pool to finish them.
+    """
+    checkpoints = [_load_checkpoint("analysis", t) if t else None for t in transcripts]
+    pending: list[tuple[Path, tuple]] = []
+    done = 0
+
+    def take(t: Path | None, result: tuple) -> dict:
+        nonlocal done
+        out, fresh = result
+        done += 1
+        if fresh is not None:
+            pending.append((t, fresh))
+            if len(pending) >= CHECKPOINT_BATCH:
+                _store_checkpoints("analysis", pending)
+                pending.clear()
+        return out
 
+    try:
+        if (jobs > 1 and len(transcripts) > 1
+                and _unread_bytes(transcripts, checkpoints) >= RICH_PARALLEL_MIN_BYTES):
+            from concurrent.futures import ProcessPoolExecutor
+            from concurrent.futures.process import BrokenProcessPool
+            try:
+                pool = ProcessPoolExecutor(max_workers=min(jobs, len(transcripts)))
+                try:
+                    for t, result in zip(transcripts, pool.map(
+                            _analyze, transcripts, [24] * len(transcripts), checkpoints)):
+                        yield take(t, result)
+                except BaseException:  # GeneratorExit included: don't drain the queue
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                pool.shutdown(wait=True)
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                eecho(f"warning: parallel transcript analysis unavailable ({e}) — "
+                      "analyzing serially")
+        for t, cp in zip(transcripts[done:], checkpoints[done:]):
+            yield take(t, _analyze(t, 24, cp))
+    finally:
+        _store_checkpoints("analysis", pending)
+
+
+def _unread_bytes(transcripts: list[Path | None], checkpoints: list) -> int:
+    """Bytes past each transcript's checkpoint — the work a rich pass faces."""
+    total = 0
+    for t, cp in zip(transcripts, checkpoints):
+        try:
+            total += max(0, t.stat().st_size - (cp[2] if cp else 0)) if t else 0
+        except OSError:
+            continue
+    return total
 
-def pick_json(candidates: list[Session], now_ms: int, rich: bool = False) -> int:
+
+def pick_json(candidates: list[Session], now_ms: int, rich: bool = False,
+              jobs: int = 1, ndjson: bool = False) -> int:
     """`pick --json` — the session inventory as a claude-mods.summon.pick
     envelope on stdout (JSON only; panels never touch stdout on this path).
 
@@ -1630,29 +3216,56 @@ def pick_json(candidates: list[Session], now_ms: int, rich: bool = False) -> int
 
     With ``rich`` (``--rich``) the schema advances to pick/v2 and each row
     gains transcript-derived display metrics (see ``session_rows``).
+
+    With ``ndjson`` (``--ndjson``) nothing is held back: each row goes out as
+    one compact JSON line the moment it is built, and the envelope's meta
+    follows as a last ``{"meta": {...}}`` line — a consumer knows the stream
+    is complete when it sees it.
     """
-    rows = session_rows(candidates, now_ms, rich)
-    print(json.dumps({
-        "data": rows,
-        "meta": {"count": len(rows),
-                 "schema": "claude-mods.summon.pick/v2" if rich else
-                           "claude-mods.summon.pick/v1"},
-    }, indent=2))
+    schema = "claude-mods.summon.pick/v2" if rich else "claude-mods.summon.pick/v1"
+    if not ndjson:
+        rows = session_rows(candidates, now_ms, rich, jobs)
+        print(json.dumps({
+            "data": rows,
+            "meta": {"count": len(rows), "schema": schema},
+        }, indent=2))
+        return 0
+    count = 0
+    rows = iter_session_rows(candidates, now_ms, rich, jobs)
+    try:
+        for row in rows:
+            sys.stdout.write(json.dumps(row) + "\n")
+            if rich:  # rows are slow to come; don't sit on them in the buffer
+                sys.stdout.flush()
+            count += 1
+        sys.stdout.write(json.dumps({"meta": {"count": count, "schema": schema,
+                                              "format": "ndjson"}}) + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # the reader went away (`| head`): stop scanning, and keep Python's
+        # exit-time flush from raising on the closed pipe
+        rows.close()
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
     return 0
 
 
+def _jobs(args, default: int | None = None) -> int:
+    """--jobs, defaulting to `default`, else the CPU count."""
+    jobs = getattr(args, "jobs", None)
+    if jobs is None:
+        jobs = default or os.cpu_count() or 1
+    return max(1, jobs)
+
+
 def mode_pick(args, accounts: list[Account]) -> int:
     """Interactive picker over the whole session store -> recovery prompt."""
-    sessions: list[Session] = []
-    for acct in accounts:
-        sessions.extend(load_sessions(acct))
-
     days = None if args.all else (args.days if args.days is not None else 30)
-    candidates = filter_sessions(sessions, days=days,
-                                 cwd_pattern=args.cwd, title_pattern=args.title)
+    candidates = query_sessions(accounts, days=days,
+                                cwd_pattern=args.cwd, title_pattern=args.title)
 
-    if args.json:
-        return pick_json(candidates, int(time.time() * 1000), rich=args.rich)
+    if args.json or args.ndjson:
+        return pick_json(candidates, int(time.time() * 1000), rich=args.rich,
+                         jobs=_jobs(args), ndjson=args.ndjson)
 
     if not candidates:
         eecho(f"no sessions match ({_window_label(days)})")
@@ -1693,6 +3306,15 @@ def mode_pick(args, accounts: list[Account]) -> int:
     eecho(panel_blank())
     eecho(panel_close(hotkeys=[("#", "select"), ("blank", "cancel")]))
 
+    idx, rc = _read_selection(args, len(candidates))
+    if idx is None:
+        return rc
+    return emit_recovery_prompt(candidates[idx - 1], args)
+
+
+def _read_selection(args, count: int) -> tuple[int | None, int]:
+    """The 1-based pick from --select or a stdin answer, as (idx, 0); (None,
+    rc) when there is nothing to recover — 0 cancelled, 2 a bad answer."""
     raw = args.select
     if not raw:
         try:
@@ -1703,16 +3325,261 @@ def mode_pick(args, accounts: list[Account]) -> int:
             raw = ""
     if not raw:
         eecho("cancelled.")
-        return 0
+        return None, 0
     try:
         idx = int(raw.split(",")[0].strip())
     except ValueError:
         eecho(f"not a session number: {raw!r}")
-        return 2
-    if not (1 <= idx <= len(candidates)):
+        return None, 2
+    if not (1 <= idx <= count):
         eecho(f"out of range: {idx}")
+        return None, 2
+    return idx, 0
+
+
+# ============================================================
+#  Search (full-text transcript index)
+# ============================================================
+#
+# "Which session discussed X" used to mean grepping gigabytes of JSONL. The
+# search index keeps the conversational text of every transcript — the same
+# user/assistant turns extract_conversation feeds the distiller (_text_only:
+# no tool inputs, no tool_result blobs) — one row per turn, in an FTS5 table
+# inside the session index. Ingestion reuses the scan checkpoints: a refresh
+# reads each transcript from the last complete line it already indexed, so
+# it costs the appended bytes only. Hits rank by bm25 relevance decayed by
+# session age, and a pick goes straight to emit_recovery_prompt. A sqlite
+# built without FTS5 gets a plain table and substring matching instead.
+
+SEARCH_HALF_LIFE_DAYS = 30   # a month-old hit needs twice the relevance
+SEARCH_SNIPPET_CHARS = 160
+
+
+def _search_db():
+    """The session index, or a throwaway in-memory one under
+    SUMMON_NO_CACHE=1 (search always needs somewhere to put the text)."""
+    db = _index_db()
+    if db is None:
+        import sqlite3
+        db = sqlite3.connect(":memory:")
+        db.execute(_INDEX_TABLES["checkpoints"])
+    return db
+
+
+def _search_table(db) -> bool:
+    """Create the search table on first use; True when it is FTS5-backed."""
+    import sqlite3
+    row = db.execute("SELECT sql FROM sqlite_master WHERE name = 'search_turns'").fetchone()
+    if row is None:
+        try:
+            with db:
+                db.execute("CREATE VIRTUAL TABLE search_turns USING fts5("
+                           "text, path UNINDEXED, role UNINDEXED)")
+        except sqlite3.OperationalError:  # no FTS5 compiled in
+            with db:
+                db.execute("CREATE TABLE search_turns (text TEXT, path TEXT, role TEXT)")
+                db.execute("CREATE INDEX search_turns_path ON search_turns (path)")
+        row = db.execute("SELECT sql FROM sqlite_master WHERE name = 'search_turns'").fetchone()
+    return row[0].upper().startswith("CREATE VIRTUAL")
+
+
+def _ingest_transcript(db, path: Path) -> int:
+    """Index the turns appended to one transcript since its checkpoint and
+    return the bytes read. A checkpoint that no longer describes the file
+    (truncated, replaced, rewritten) drops its rows and re-reads from zero;
+    a half-written trailing line waits for the next refresh."""
+    key = str(path)
+    cp = db.execute("SELECT dev, ino, offset, sig, state FROM checkpoints "
+                    "WHERE kind = 'search' AND path = ?", (key,)).fetchone()
+    sealed = is_archived(path)
+    try:
+        st = path.stat()
+        if sealed and cp and _checkpoint_matches(None, st, cp, True):
+            return 0  # an archive never changes once indexed
+        with open_transcript(path) as fh:
+            resume = not sealed and bool(cp) and _checkpoint_matches(fh, st, cp)
+            if resume and cp[2] == st.st_size:
+                return 0
+            offset = cp[2] if resume else 0
+            start = offset
+            if not sealed:
+                fh.seek(offset)
+            rows = []
+            for raw in fh:
+                if not raw.endswith(b"\n") and not sealed:
+                    break
+                offset += len(raw)
+                turn = _conversation_turn(raw)
+                if turn:
+                    rows.append((turn[1], key, turn[0]))
+            sig = st.st_size if sealed else _tail_sig(fh, offset)
+    except OSError:
+        return 0
+    with db:
+        if cp and not resume:
+            db.execute("DELETE FROM search_turns WHERE path = ?", (key,))
+        db.executemany("INSERT INTO search_turns VALUES (?, ?, ?)", rows)
+        db.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                   ("search", key, st.st_dev, st.st_ino, offset, sig, b""))
+    return offset - start
+
+
+def _prune_search_rows(db, keep: set[str]) -> int:
+    """Drop the rows (and checkpoint) of every indexed transcript that is no
+    longer in the project tree — deleted, moved, archived or restored under
+    another name — so its text stops matching. Returns how many went."""
+    root = cli_jsonl_root()
+    live = {str(root / d / name) for hits in transcript_locations().values()
+            for d, name in hits} | keep
+    stale = [p for (p,) in db.execute(
+        "SELECT path FROM checkpoints WHERE kind = 'search'") if p not in live]
+    if stale:
+        with db:
+            for i in range(0, len(stale), 500):  # under SQLite's host-parameter cap
+                part = stale[i:i + 500]
+                marks = ",".join("?" * len(part))
+                db.execute(f"DELETE FROM search_turns WHERE path IN ({marks})", part)
+                db.execute(f"DELETE FROM checkpoints WHERE kind = 'search' "
+                           f"AND path IN ({marks})", part)
+    return len(stale)
+
+
+def _fts_query(query: str) -> str:
+    """Free text -> an FTS5 MATCH expression: every word a quoted phrase
+    (implicitly ANDed), so punctuation like `foo-bar` or `a:b` is literal.
+    NUL, which FTS5 reads as the end of the string, separates words."""
+    return " ".join('"' + w.replace('"', '""') + '"'
+                    for w in query.replace("\0", " ").split())
+
+
+def _snippet_around(text: str, words: list[str]) -> str:
+    """A SEARCH_SNIPPET_CHARS window of `text` around the first hit."""
+    low = text.lower()
+    at = min((i for i in (low.find(w) for w in words) if i >= 0), default=0)
+    start = max(0, at - SEARCH_SNIPPET_CHARS // 3)
+    snip = " ".join(text[start:start + SEARCH_SNIPPET_CHARS].split())
+    return ("…" if start else "") + snip
+
+
+def search_hits(db, query: str, fts: bool) -> dict[str, tuple[float, int, str]]:
+    """transcript path -> (relevance, matching turns, snippet of the best turn);
+    ValueError for a query FTS5 can't parse.
+
+    A session's relevance sums 1 + the turn's score over its matching turns
+    (bm25, or the word-occurrence count without FTS5): a session that keeps
+    coming back to X outranks one that mentions it once, and bm25 — which
+    flattens to ~0 for words common across the corpus — only refines that.
+    """
+    words = [w.lower() for w in query.replace("\0", " ").split()]
+    hits: dict[str, tuple[float, int, str]] = {}
+    if fts:
+        import sqlite3
+        try:
+            rows = db.execute(
+                "SELECT path, -bm25(search_turns), text FROM search_turns "
+                "WHERE search_turns MATCH ?", (_fts_query(query),)).fetchall()
+        except sqlite3.OperationalError as e:  # the query, not the index
+            raise ValueError(f"malformed search query {query!r} ({e})") from None
+    else:
+        where = " AND ".join(["instr(lower(text), ?) > 0"] * len(words))
+        rows = ((p, float(sum(t.lower().count(w) for w in words)), t)
+                for p, t in db.execute(
+                    f"SELECT path, text FROM search_turns WHERE {where}", words))
+    best: dict[str, float] = {}
+    for path, rel, text in rows:
+        total, n, snip = hits.get(path, (0.0, 0, ""))
+        if rel > best.get(path, float("-inf")):
+            best[path], snip = rel, _snippet_around(text, words)
+        hits[path] = (total + 1 + rel, n + 1, snip)
+    return hits
+
+
+def search_sessions(query: str, candidates: list[Session], now_ms: int
+                    ) -> tuple[list[tuple[Session, Path, float, int, str]], dict]:
+    """Refresh the index over the candidates' transcripts and rank the hits.
+
+    Returns ([(session, transcript, score, hits, snippet)], stats); score is
+    relevance halved every SEARCH_HALF_LIFE_DAYS of session age. Wrapper
+    copies of one session (several accounts) share a transcript and collapse
+    to the most recently active one.
+    """
+    db = _search_db()
+    fts = _search_table(db)
+    by_path: dict[str, tuple[Session, Path]] = {}
+    for s in candidates:
+        transcript = resolve_transcript(s)[0]
+        if transcript and str(transcript) not in by_path:
+            by_path[str(transcript)] = (s, transcript)
+    t0 = time.perf_counter()
+    ingested = sum(_ingest_transcript(db, tr) for _, tr in by_path.values())
+    pruned = _prune_search_rows(db, set(by_path))
+    stats = {"transcripts": len(by_path), "ingestedBytes": ingested, "pruned": pruned,
+             "ingestMs": round((time.perf_counter() - t0) * 1000), "fts5": fts}
+    ranked = []
+    for path, (rel, n, snip) in search_hits(db, query, fts).items():
+        if path not in by_path:
+            continue
+        s, transcript = by_path[path]
+        age_days = max(0, now_ms - s.last_activity_ms) / 86_400_000
+        score = rel * 0.5 ** (age_days / SEARCH_HALF_LIFE_DAYS)
+        ranked.append((s, transcript, score, n, snip))
+    ranked.sort(key=lambda r: (-r[2], -r[0].last_activity_ms))
+    return ranked, stats
+
+
+def mode_search(args, accounts: list[Account]) -> int:
+    """`summon search <query>` — ranked full-text hits -> recovery prompt."""
+    query = (args.target or "").strip()
+    if not query:
+        eecho("usage: summon search <query>   (words are ANDed; --json for the envelope)")
         return 2
-    return emit_recovery_prompt(candidates[idx - 1], args)
+    days = None if args.all else args.days
+    candidates = query_sessions(accounts, days=days,
+                                cwd_pattern=args.cwd, title_pattern=args.title)
+    now_ms = int(time.time() * 1000)
+    import sqlite3
+    try:
+        ranked, stats = search_sessions(query, candidates, now_ms)
+    except ValueError as e:
+        eecho(f"{e} — words are matched literally; drop control characters")
+        return 2
+    except sqlite3.Error as e:
+        eecho(f"search index unavailable: {e}")
+        return 2
+    ranked = ranked[:max(1, args.limit)]
+
+    if args.json:
+        print(json.dumps({
+            "data": [{"id": s.sid.removeprefix("local_")[:8], "sessionId": s.sid,
+                      "cliSessionId": s.cli_id, "title": s.title, "cwd": s.cwd,
+                      "lastActivityAt": _iso_utc(s.last_activity_ms),
+                      "transcriptPath": str(tr), "score": round(score, 4),
+                      "hits": n, "snippet": snip}
+                     for s, tr, score, n, snip in ranked],
+            "meta": {"count": len(ranked), "query": query, **stats,
+                     "schema": "claude-mods.summon.search/v1"},
+        }, indent=2))
+        return 0
+
+    if not ranked:
+        eecho(f"no transcript matches {query!r} ({_window_label(days)}, "
+              f"{stats['transcripts']} transcript(s) searched)")
+        return 3
+
+    sep = Term.g("·", "|")
+    eecho(panel_open(f"summon {sep} search", indicator=repr(query)))
+    eecho(panel_blank())
+    for i, (s, _, _, n, snip) in enumerate(ranked, 1):
+        eecho(leaf(i, s.title, meta=f"{n} hits", age=_ago(s.last_activity_ms),
+                   last=(i == len(ranked)), depth=1))
+        eecho(f"{Term.g('│', '|')}        {Term.color('meta', snip[:100])}")
+    eecho(panel_blank())
+    eecho(panel_close(hotkeys=[("#", "select"), ("blank", "cancel")]))
+
+    idx, rc = _read_selection(args, len(ranked))
+    if idx is None:
+        return rc
+    return emit_recovery_prompt(ranked[idx - 1][0], args)
 
 
 # ============================================================
@@ -1833,20 +3700,41 @@ def _set_widget_window(html: str, days: int | None) -> str:
     return html[:m.start()] + head + body + tail + html[m.end():]
 
 
+def _widget_fit(row_bytes: list[int], fixed_bytes: int, budget_bytes: int) -> int:
+    """How many leading rows fit: the largest n with fixed + block(n) <= budget.
+
+    block(n) is exactly what _widget_data_block emits — "[\n", the rows joined
+    by ",\n", "\n]" — so its size is a prefix sum of the per-row costs plus
+    2 bytes of separator per row; monotone in n, hence a bisect. Never below 1
+    while there is a row (one card beats an empty picker), 0 only for no rows.
+    """
+    if not row_bytes:
+        return 0
+    # totals[n-1] = len("[\n") + sum(rows) + 2 * (n - 1) + len("\n]")
+    totals = [t + 2 * n + 2
+              for n, t in enumerate(itertools.accumulate(row_bytes), 1)]
+    return max(1, bisect.bisect_right(totals, budget_bytes - fixed_bytes))
+
+
 def _assemble_widget(trimmed: list[dict], days: int | None, limit: int,
                      budget_bytes: int, template_html: str) -> tuple[str, int, list[str]]:
     """Inject rows into the template, dropping the oldest until the assembled
-    HTML fits budget_bytes. Returns (html, effective_count, notes)."""
+    HTML fits budget_bytes. Returns (html, effective_count, notes).
+
+    Each row is serialized once; the fit is a bisect over prefix sums of those
+    byte costs (_widget_fit), and the HTML is assembled exactly once.
+    """
     notes: list[str] = []
-    eff = min(limit, len(trimmed))
-    while True:
-        html = _set_widget_window(
-            _inject_widget_data(template_html, _widget_data_block(trimmed[:eff])),
-            days)
-        if len(html.encode("utf-8")) <= budget_bytes or eff <= 1:
-            break
-        eff -= 1
-    if eff < min(limit, len(trimmed)):
+    want = min(limit, len(trimmed))
+    lines = [json.dumps(r) for r in trimmed[:want]]
+    # The window <select> lives in the template, not the data, so set it first.
+    # The empty-payload assembly measures everything except the block itself.
+    shell = _set_widget_window(template_html, days)
+    fixed = len(_inject_widget_data(shell, "").encode("utf-8"))
+    eff = _widget_fit([len(ln.encode("utf-8")) for ln in lines], fixed, budget_bytes)
+    block = "[\n" + ",\n".join(lines[:eff]) + "\n]" if eff else "[]"
+    html = _inject_widget_data(shell, block)
+    if eff < want:
         notes.append(
             f"capped to {eff} session(s) to stay under the "
             f"{budget_bytes // 1024} KB HTML budget (--limit was {limit}); "
@@ -1869,12 +3757,9 @@ def mode_widget(args, accounts: list[Account]) -> int:
         eecho(f"cannot read widget template {_asset_template()}: {e}")
         return 3
 
-    sessions: list[Session] = []
-    for acct in accounts:
-        sessions.extend(load_sessions(acct))
     days = None if args.all else (args.days if args.days is not None else 30)
-    candidates = filter_sessions(sessions, days=days,
-                                 cwd_pattern=args.cwd, title_pattern=args.title)
+    candidates = query_sessions(accounts, days=days,
+                                cwd_pattern=args.cwd, title_pattern=args.title)
     now_ms = int(time.time() * 1000)
 
     n_all = len(candidates)
@@ -1884,7 +3769,7 @@ def mode_widget(args, accounts: list[Account]) -> int:
 
     limit = max(1, args.limit)
     # Cap BEFORE the rich pass so we read at most `limit` transcripts, never all.
-    rows = session_rows(candidates[:limit], now_ms, rich=True)
+    rows = session_rows(candidates[:limit], now_ms, rich=True, jobs=_jobs(args))
     trimmed = [_trim_widget_row(r, full_density=args.full_density) for r in rows]
 
     budget_bytes = max(4096, round(args.max_kb * 1024))
@@ -1933,42 +3818,69 @@ def mode_widget(args, accounts: list[Account]) -> int:
 
 
 def _default_widget_out() -> Path:
+    import tempfile
     return Path(tempfile.gettempdir()) / "claude" / "summon-widget.html"
 
 
+DOCTOR_STAT_JOBS = 16          # cwd stats in flight — I/O-bound, not CPU-bound
+DOCTOR_STAT_TIMEOUT = 3.0      # seconds before a cwd stat is given up on
+
+
 def mode_doctor(args, accounts: list[Account]) -> int:
-    """Scan every wrapper for broken cwd bindings + transcript resolution."""
+    """Scan every wrapper for broken cwd bindings + transcript resolution.
+
+    Three timed phases: inventory (load every wrapper), cwd (one stat per
+    distinct recorded cwd, on a thread pool with a per-path timeout — a cwd
+    whose stat times out is reported as unreachable, not broken) and
+    transcripts (one sweep of the project dirs, then dict lookups).
+    """
     broken: "OrderedDict[str, dict]" = OrderedDict()  # sessionId -> finding
     transcript_missing = 0
     transcript_scanned = 0
-    checked = 0
     remote = 0
+    timings: dict[str, float] = {}
+    t_start = t0 = time.perf_counter()
 
+    local: list[Session] = []
     for acct in accounts:
         for s in load_sessions(acct):
             if s.is_remote:
                 remote += 1
-                continue
-            checked += 1
-            cwd_ok = not _cwd_broken(s)
-            transcript, how = resolve_transcript(s)
-            if how == "scanned":
-                transcript_scanned += 1
-            if transcript is None:
-                transcript_missing += 1
-            if not cwd_ok:
-                f = broken.setdefault(s.sid, {
-                    "sessionId": s.sid,
-                    "cliSessionId": s.cli_id,
-                    "title": s.title,
-                    "cwd": s.cwd,
-                    "accounts": [],
-                    "archived": bool(s.data.get("isArchived")),
-                    "transcript": str(transcript) if transcript else None,
-                    "lastActivityAt": s.last_activity_ms,
-                })
-                if s.account.short not in f["accounts"]:
-                    f["accounts"].append(s.account.short)
+            else:
+                local.append(s)
+    checked = len(local)
+    timings["inventory"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    jobs = args.jobs if getattr(args, "jobs", None) else DOCTOR_STAT_JOBS
+    timeout = getattr(args, "stat_timeout", None) or DOCTOR_STAT_TIMEOUT
+    exists = stat_paths((s.cwd for s in local if s.cwd), jobs=jobs, timeout=timeout)
+    unreachable = sorted(p for p, ok in exists.items() if ok is None)
+    timings["cwd"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for s in local:
+        transcript, how = resolve_transcript(s)
+        if how == "scanned":
+            transcript_scanned += 1
+        if transcript is None:
+            transcript_missing += 1
+        if s.cwd and exists.get(s.cwd) is not False:
+            continue  # present, or unreachable (timed out) — not judged
+        f = broken.setdefault(s.sid, {
+            "sessionId": s.sid,
+            "cliSessionId": s.cli_id,
+            "title": s.title,
+            "cwd": s.cwd,
+            "accounts": [],
+            "archived": s.archived,
+            "transcript": str(transcript) if transcript else None,
+            "lastActivityAt": s.last_activity_ms,
+        })
+        if s.account.short not in f["accounts"]:
+            f["accounts"].append(s.account.short)
+    timings["transcripts"] = time.perf_counter() - t0
+    timings["total"] = time.perf_counter() - t_start
 
     findings = list(broken.values())
 
@@ -1979,6 +3891,13 @@ def mode_doctor(args, accounts: list[Account]) -> int:
                      "remoteSkipped": remote,
                      "transcriptMissing": transcript_missing,
                      "transcriptFoundByScan": transcript_scanned,
+                     "cwdUnreachable": unreachable,
+                     "timingsMs": {k: round(v * 1000, 1) for k, v in timings.items()},
+                     "stats": {"wrappers": checked + remote,
+                               "cwdDistinct": len(exists),
+                               "cwdTimedOut": len(unreachable),
+                               "transcriptDirs": _TRANSCRIPT_SWEEP.get("dirs", 0),
+                               "transcriptDirsRelisted": _TRANSCRIPT_SWEEP.get("relisted", 0)},
                      "schema": "claude-mods.summon.doctor/v1"},
         }, indent=2))
         return 10 if findings else 0
@@ -1990,6 +3909,11 @@ def mode_doctor(args, accounts: list[Account]) -> int:
     echo(summary_line(f"{checked} local {sep} {remote} remote skipped {sep} "
                       f"{transcript_missing} transcript-missing {sep} "
                       f"{transcript_scanned} found-by-scan"))
+    if unreachable:
+        echo(summary_line(Term.color("warn", f"{len(unreachable)} cwd stat(s) timed out "
+                                             f"after {timeout:g}s — not judged: ")
+                          + ", ".join(unreachable[:3])
+                          + (f" +{len(unreachable) - 3}" if len(unreachable) > 3 else "")))
     echo(panel_blank())
 
     if not findings:
@@ -2016,11 +3940,1597 @@ def mode_doctor(args, accounts: list[Account]) -> int:
     return 10
 
 
+# ============================================================
+#  Stats (token / activity rollup)
+# ============================================================
+#
+# "Which repo burned the most cache-read tokens this month" needs every
+# transcript's usage blocks, summed per project root, model and day. The
+# incremental analyzer already walks each transcript once (and only its
+# appended tail after that), so it also folds each record into a per-(model,
+# UTC day) rollup of input / output / cache-write / cache-read tokens, tool
+# calls and active time. `summon stats` keeps those rollups as rows of the
+# `usage` table, one set per transcript and valid while its (size, mtime_ns)
+# holds: an unchanged transcript is never opened again, a grown one resumes
+# from its analysis checkpoint, and the grouping itself is a sum over rows.
+
+STATS_GROUPS = ("project", "model", "day")
+# --sort value -> output field (ties break on the group labels)
+STATS_SORTS = {"tokens": "totalTokens", "input": "inputTokens",
+               "output": "outputTokens", "cache-write": "cacheWriteTokens",
+               "cache-read": "cacheReadTokens", "tools": "toolCalls",
+               "active": "activeMin"}
+
+
+def usage_rollup(sessions: list[Session], jobs: int) -> tuple[list[tuple], dict[str, str], dict]:
+    """(rows, projects, stats) for the transcripts behind `sessions`.
+
+    rows: (path, model, day, input, output, cache_write, cache_read, tools,
+    active_ms) — one per transcript x model x UTC day. projects: transcript
+    path -> project_root of the first session that points at it (a transfer
+    copy shares its transcript with the original). Only transcripts whose
+    size or mtime moved since their cached rows are analyzed.
+    """
+    import sqlite3
+    projects: dict[str, str] = {}
+    for s in sessions:
+        transcript = resolve_transcript(s)[0]
+        if transcript is not None:
+            projects.setdefault(str(transcript), project_root(s.cwd))
+    sigs: dict[str, tuple[int, int]] = {}
+    for path in projects:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        sigs[path] = (st.st_size, st.st_mtime_ns)
+
+    db = _index_db()
+    known: dict[str, tuple[int, int]] = {}
+    if db is not None:
+        try:
+            known = {p: (n, m) for p, n, m in db.execute(
+                "SELECT path, size, mtime_ns FROM usage_files")}
+        except sqlite3.Error:
+            db = None
+    stale = [p for p in sigs if known.get(p) != sigs[p]]
+    rows: list[tuple] = []
+    if db is not None and len(stale) < len(sigs):
+        current = sigs.keys() - set(stale)
+        try:
+            rows = [r for r in db.execute("SELECT * FROM usage") if r[0] in current]
+        except sqlite3.Error:
+            db, rows, stale = None, [], list(sigs)
+    fresh: list[tuple] = []
+    metrics = _rich_metrics([Path(p) for p in stale], jobs) if stale else []
+    for path, m in zip(stale, metrics):
+        for key, counts in m["rollup"].items():
+            model, _, day = key.partition("\t")
+            fresh.append((path, model, day, *counts))
+    rows.extend(fresh)
+
+    if db is not None and stale:
+        gone = [(p,) for p in known if p not in sigs and not os.path.exists(p)]
+        try:
+            with db:
+                db.executemany("DELETE FROM usage WHERE path = ?",
+                               [(p,) for p in stale] + gone)
+                db.executemany("DELETE FROM usage_files WHERE path = ?", gone)
+                db.executemany("INSERT INTO usage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", fresh)
+                db.executemany("INSERT OR REPLACE INTO usage_files VALUES (?, ?, ?)",
+                               [(p, *sigs[p]) for p in stale])
+        except sqlite3.Error:
+            pass
+    return rows, projects, {"transcripts": len(sigs), "analyzed": len(stale)}
+
+
+def rollup_groups(rows: list[tuple], projects: dict[str, str], by: tuple[str, ...],
+                  since_day: str = "") -> list[dict]:
+    """Sum usage rows per `by` labels (a subset of STATS_GROUPS, in order),
+    keeping days >= since_day ("YYYY-MM-DD"; "" keeps all). Unsorted."""
+    groups: dict[tuple, list] = {}
+    for path, model, day, *counts in rows:
+        if since_day and day < since_day:
+            continue
+        labels = {"project": projects.get(path, ""), "model": model, "day": day}
+        key = tuple(labels[b] for b in by)
+        g = groups.get(key)
+        if g is None:
+            g = groups[key] = [0, 0, 0, 0, 0, 0, set()]
+        for i, n in enumerate(counts):
+            g[i] += n
+        g[6].add(path)
+    out = []
+    for key, (inp, outp, cw, cr, tools, active_ms, paths) in groups.items():
+        out.append({**dict(zip(by, key)),
+                    "inputTokens": inp, "outputTokens": outp,
+                    "cacheWriteTokens": cw, "cacheReadTokens": cr,
+                    "totalTokens": inp + outp + cw + cr, "toolCalls": tools,
+                    "activeMin": round(active_ms / 60000, 1), "sessions": len(paths)})
+    return out
+
+
+def _si(n: float) -> str:
+    """Compact count: 950, 12.3k, 4.1M, 2.0B."""
+    for div, unit in ((1e9, "B"), (1e6, "M"), (1e3, "k")):
+        if abs(n) >= div:
+            return f"{n / div:.1f}{unit}"
+    return f"{n:g}"
+
+
+def mode_stats(args, accounts: list[Account]) -> int:
+    """`summon stats` — token / tool / active-time rollup per project, model, day."""
+    by = tuple(b.strip() for b in (args.by or "project").split(",") if b.strip())
+    bad = [b for b in by if b not in STATS_GROUPS]
+    if not by or bad or len(set(by)) != len(by):
+        eecho(f"usage: summon stats --by {{{','.join(STATS_GROUPS)}}}[,...]  "
+              f"(got {args.by!r})")
+        return 2
+    days = None if args.all else (args.days if args.days is not None else 30)
+    now_ms = int(time.time() * 1000)
+    since_day = "" if days is None else time.strftime(
+        "%Y-%m-%d", time.gmtime((now_ms - days * _DAY_MS) // 1000))
+    sessions = query_sessions(accounts, days=days,
+                              cwd_pattern=args.cwd, title_pattern=args.title)
+    rows, projects, stats = usage_rollup(sessions, _jobs(args))
+    field = STATS_SORTS[args.sort]
+    groups = rollup_groups(rows, projects, by, since_day)
+    groups.sort(key=lambda g: tuple(g[b] for b in by))
+    groups.sort(key=lambda g: g[field], reverse=True)
+    groups = groups[:max(1, args.limit)]
+
+    if args.json:
+        print(json.dumps({
+            "data": groups,
+            "meta": {"count": len(groups), "by": list(by), "sort": args.sort,
+                     "days": days, "since": since_day or None, **stats,
+                     "schema": "claude-mods.summon.stats/v1"},
+        }, indent=2))
+        return 0
+
+    sep = Term.g("·", "|")
+    echo(panel_open(f"summon {sep} stats", indicator=_window_label(days)))
+    echo(panel_blank())
+    echo(summary_line(f"{stats['transcripts']} transcripts {sep} "
+                      f"{stats['analyzed']} analyzed {sep} by {'/'.join(by)} "
+                      f"{sep} sorted by {args.sort}"))
+    echo(panel_blank())
+    if not groups:
+        echo(section("no usage recorded in this window", color_token="meta"))
+        echo(panel_blank())
+        echo(panel_close())
+        return 0
+    pipe = Term.g("│", "|")
+    for i, g in enumerate(groups, 1):
+        # the folder name reads better than a truncated absolute path; --json
+        # keeps the full path
+        label = " / ".join((os.path.basename(g[b].rstrip("/\\")) if b == "project"
+                            else g[b]) or "(none)" for b in by)
+        echo(leaf(i, label, meta=_si(g[field]) if field != "activeMin" else "",
+                  age=f"{g['activeMin'] / 60:.1f}h", last=(i == len(groups)), depth=1))
+        echo(f"{pipe}        " + Term.color("meta", (
+            f"in {_si(g['inputTokens'])} {sep} out {_si(g['outputTokens'])} {sep} "
+            f"cache r {_si(g['cacheReadTokens'])} w {_si(g['cacheWriteTokens'])} {sep} "
+            f"{g['toolCalls']} tools {sep} {g['sessions']} sessions")))
+    echo(panel_blank())
+    echo(panel_close(healths=[("ok", f"{len(groups)} groups")]))
+    return 0
+
+
+# ============================================================
+#  Timeline (tool latency profile)
+# ============================================================
+#
+# analyze_transcript counts tool_use blocks; `summon timeline <id>` times
+# them. One streaming pass pairs each assistant tool_use with the user
+# record carrying its tool_result (by tool_use_id): the call's latency is the
+# gap between the two records' timestamps. Per tool it keeps counts and a
+# log-bucketed latency histogram (1% wide buckets, so p50/p95 are within
+# ~0.5% of exact and memory is O(tools), not O(calls)); the slowest N calls
+# sit in a bounded heap; the gap before each human prompt (a user record
+# without tool_result blocks) is idle time. Calls in flight are the only
+# per-call state, capped at TIMELINE_PENDING_MAX. The Chrome trace-event
+# file (chrome://tracing, Perfetto) is written as the pass goes: one lane
+# per concurrently running call, idle gaps on a lane of their own.
+
+TIMELINE_PENDING_MAX = 10_000   # unanswered tool_use ids held at once
+_TIMELINE_BUCKET = 1.01         # histogram bucket ratio
+
+
+def _hist_add(hist: dict[int, int], ms: int, log_step: float) -> None:
+    import math
+    b = 0 if ms < 1 else 1 + int(math.log(ms) / log_step)
+    hist[b] = hist.get(b, 0) + 1
+
+
+def _hist_quantile(hist: dict[int, int], count: int, q: float, min_ms: int,
+                   max_ms: int) -> int:
+    """Nearest-rank quantile of a latency histogram: the geometric middle
+    of the bucket holding the rank, kept within the exact min and max."""
+    if not count:
+        return 0
+    rank = max(1, -(-int(q * count * 1000) // 1000))  # ceil without float drift
+    seen = 0
+    for b in sorted(hist):
+        seen += hist[b]
+        if seen >= rank:
+            if b == 0:
+                return 0
+            return max(min_ms, min(max_ms, round(_TIMELINE_BUCKET ** (b - 0.5))))
+    return max_ms
+
+
+def _latency_summary(acc: dict) -> dict:
+    n, lo, hi = acc["count"], acc["minMs"], acc["maxMs"]
+    return {"totalMs": acc["totalMs"],
+            "p50Ms": _hist_quantile(acc["hist"], n, 0.50, lo, hi),
+            "p95Ms": _hist_quantile(acc["hist"], n, 0.95, lo, hi),
+            "maxMs": hi}
+
+
+class _TraceWriter:
+    """Chrome trace-event JSON, streamed: events go to disk as they come."""
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.n = 0
+        fh.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+
+    def event(self, ev: dict) -> None:
+        self.fh.write((",\n" if self.n else "") + json.dumps(ev))
+        self.n += 1
+
+    def close(self) -> None:
+        self.fh.write("\n]}\n")
+
+
+def tool_timeline(path: Path, top: int = 10, trace: _TraceWriter | None = None) -> dict:
+    """One pass over a transcript -> per-tool latency, idle gaps, slowest calls.
+
+    Raises OSError when the transcript can't be read, a damaged archive
+    included (see _ArchiveReader).
+    """
+    import heapq
+    import math
+    log_step = math.log(_TIMELINE_BUCKET)
+    pending: dict[str, tuple[str, int, int]] = {}  # tool_use id -> (tool, start ms, lane)
+    busy: list[bool] = []                          # trace lanes in use
+    tools: dict[str, dict] = {}
+    idle = {"count": 0, "totalMs": 0, "minMs": 0, "maxMs": 0, "hist": {}}
+    slowest: list[tuple] = []                      # min-heaps of (ms, seq, item)
+    longest_idle: list[tuple] = []
+    counts = {"events": 0, "toolCalls": 0, "answered": 0, "unanswered": 0,
+              "orphanResults": 0}
+    origin = prev_ms = last_ms = 0
+    seq = itertools.count()
+
+    def keep(heap: list, ms: int, item: dict) -> None:
+        if len(heap) < top:
+            heapq.heappush(heap, (ms, next(seq), item))
+        elif heap and ms > heap[0][0]:
+            heapq.heapreplace(heap, (ms, next(seq), item))
+
+    def lane() -> int:
+        for i, used in enumerate(busy):
+            if not used:
+                busy[i] = True
+                return i
+        busy.append(True)
+        if trace:
+            trace.event({"ph": "M", "name": "thread_name", "pid": 1, "tid": len(busy),
+                         "args": {"name": f"tool calls {len(busy)}"}})
+        return len(busy) - 1
+
+    if trace:
+        trace.event({"ph": "M", "name": "thread_name", "pid": 1, "tid": 0,
+                     "args": {"name": "idle (waiting on the user)"}})
+    with open_transcript(path) as fh:
+        for raw in fh:
+            if not raw.strip():
+                continue
+            counts["events"] += 1
+            if _record_type(raw) not in (None, "user", "assistant"):
+                continue
+            obj = _record_fields(raw, ("type", "timestamp", "message"))
+            typ, stamp = obj.get("type"), obj.get("timestamp")
+            ms = _ts_ms(stamp) if typ in ("user", "assistant") and stamp else None
+            if not ms:
+                continue
+            origin = origin or ms
+            last_ms = max(last_ms, ms)
+            msg = obj.get("message")
+            content = msg.get("content") if isinstance(msg, dict) else None
+            parts = [p for p in content if isinstance(p, dict)] \
+                if isinstance(content, list) else []
+            if typ == "assistant":
+                for p in parts:
+                    if p.get("type") != "tool_use" or not p.get("id"):
+                        continue
+                    counts["toolCalls"] += 1
+                    pending[str(p["id"])] = (str(p.get("name") or "?"), ms, lane())
+                    if len(pending) > TIMELINE_PENDING_MAX:
+                        stale = next(iter(pending))
+                        busy[pending.pop(stale)[2]] = False
+                        counts["unanswered"] += 1
+            elif any(p.get("type") == "tool_result" for p in parts):
+                for p in parts:
+                    if p.get("type") != "tool_result":
+                        continue
+                    call = pending.pop(str(p.get("tool_use_id")), None)
+                    if call is None:
+                        counts["orphanResults"] += 1
+                        continue
+                    tool, start, ln = call
+                    busy[ln] = False
+                    took = max(0, ms - start)
+                    failed = bool(p.get("is_error"))
+                    acc = tools.get(tool)
+                    if acc is None:
+                        acc = tools[tool] = {"count": 0, "errors": 0, "totalMs": 0,
+                                             "minMs": took, "maxMs": 0, "hist": {}}
+                    acc["count"] += 1
+                    acc["minMs"] = min(acc["minMs"], took)
+                    acc["errors"] += failed
+                    acc["totalMs"] += took
+                    acc["maxMs"] = max(acc["maxMs"], took)
+                    _hist_add(acc["hist"], took, log_step)
+                    counts["answered"] += 1
+                    keep(slowest, took, {"tool": tool, "id": str(p.get("tool_use_id")),
+                                         "startedAt": _iso_utc(start), "ms": took,
+                                         "isError": failed})
+                    if trace:
+                        trace.event({"ph": "X", "name": tool, "cat": "tool", "pid": 1,
+                                     "tid": ln + 1, "ts": (start - origin) * 1000,
+                                     "dur": took * 1000,
+                                     "args": {"id": p.get("tool_use_id"), "isError": failed}})
+            elif typ == "user" and prev_ms and ms > prev_ms:
+                gap = ms - prev_ms
+                idle["minMs"] = min(idle["minMs"], gap) if idle["count"] else gap
+                idle["count"] += 1
+                idle["totalMs"] += gap
+                idle["maxMs"] = max(idle["maxMs"], gap)
+                _hist_add(idle["hist"], gap, log_step)
+                keep(longest_idle, gap, {"endedAt": _iso_utc(ms), "ms": gap})
+                if trace:
+                    trace.event({"ph": "X", "name": "idle", "cat": "idle", "pid": 1,
+                                 "tid": 0, "ts": (prev_ms - origin) * 1000,
+                                 "dur": gap * 1000})
+            prev_ms = ms
+    counts["unanswered"] += len(pending)
+    ranked = sorted(tools.items(), key=lambda kv: (-kv[1]["totalMs"], kv[0]))
+    return {
+        "tools": [{"tool": name, "calls": acc["count"], "errors": acc["errors"],
+                   **_latency_summary(acc)} for name, acc in ranked],
+        "slowest": [item for *_, item in sorted(slowest, reverse=True)],
+        "idle": {"gaps": idle["count"], **_latency_summary(idle),
+                 "longest": [item for *_, item in sorted(longest_idle, reverse=True)]},
+        "counts": {**counts, "spanMs": last_ms - origin, "lanes": len(busy)},
+    }
+
+
+def _ms_label(ms: int) -> str:
+    """Compact duration: 850ms, 12.3s, 4.2m, 1.5h."""
+    if ms < 1000:
+        return f"{ms}ms"
+    if ms < 60_000:
+        return f"{ms / 1000:.1f}s"
+    if ms < 3_600_000:
+        return f"{ms / 60_000:.1f}m"
+    return f"{ms / 3_600_000:.1f}h"
+
+
+def _default_trace_out(s: Session) -> Path:
+    import tempfile
+    return (Path(tempfile.gettempdir()) / "claude"
+            / f"summon-timeline-{(s.cli_id or s.sid)[:8]}.trace.json")
+
+
+def mode_timeline(args, accounts: list[Account]) -> int:
+    """`summon timeline <id>` — tool latency + idle profile of one session."""
+    if not args.target:
+        eecho("usage: summon timeline <id>   (sessionId or cliSessionId, prefix ok)")
+        return 2
+    matches, ambiguous = find_wrappers_by_id(args.target, accounts)
+    if not matches:
+        eecho(f"no session matching: {args.target}")
+        return 3
+    if ambiguous:
+        eecho(f"'{args.target}' matches {len({m.sid for m in matches})} different sessions — be more specific:")
+        for m in matches[:8]:
+            eecho(f"  {m.sid}  {m.title!r}  {m.cwd}")
+        return 2
+    s = matches[0]
+    transcript = resolve_transcript(s)[0]
+    if transcript is None:
+        eecho(f"no transcript for {s.sid} ({s.title!r})")
+        return 3
+    out = Path(args.out) if args.out else _default_trace_out(s)
+    tmp = out.with_name(out.name + ".tmp")
+    try:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as fh:
+            trace = _TraceWriter(fh)
+            trace.event({"ph": "M", "name": "process_name", "pid": 1,
+                         "args": {"name": f"{s.title} ({s.cli_id[:8]})"}})
+            tl = tool_timeline(transcript, max(1, args.limit), trace)
+            trace.close()
+        os.replace(tmp, out)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        eecho(f"timeline failed: {e}")
+        return 1
+    counts = tl.pop("counts")
+
+    if args.json:
+        print(json.dumps({
+            "data": tl,
+            "meta": {"sessionId": s.sid, "cliSessionId": s.cli_id, "title": s.title,
+                     "transcriptPath": str(transcript), "trace": str(out), **counts,
+                     "schema": "claude-mods.summon.timeline/v1"},
+        }, indent=2))
+        return 0
+
+    sep = Term.g("·", "|")
+    echo(panel_open(f"summon {sep} timeline", indicator=s.sid.removeprefix("local_")[:8]))
+    echo(panel_blank())
+    echo(summary_line(f"{counts['toolCalls']} tool calls {sep} {len(tl['tools'])} tools "
+                      f"{sep} span {_ms_label(counts['spanMs'])} {sep} "
+                      f"idle {_ms_label(tl['idle']['totalMs'])}"))
+    echo(panel_blank())
+    echo(section("tools by total time", len(tl["tools"]), color_token="accent"))
+    for i, t in enumerate(tl["tools"]):
+        errs = f" {sep} {t['errors']} failed" if t["errors"] else ""
+        echo(leaf(0, t["tool"], meta=(f"p50 {_ms_label(t['p50Ms'])} {sep} p95 "
+                                      f"{_ms_label(t['p95Ms'])} {sep} max "
+                                      f"{_ms_label(t['maxMs'])}{errs}"),
+                  age=f"{t['calls']}x {_ms_label(t['totalMs'])}",
+                  last=(i == len(tl["tools"]) - 1), depth=1))
+    if tl["slowest"]:
+        echo(panel_blank())
+        echo(section("slowest calls", len(tl["slowest"]), color_token="accent"))
+        for i, c in enumerate(tl["slowest"]):
+            echo(leaf(0, c["tool"], meta=c["startedAt"] + (" (error)" if c["isError"] else ""),
+                      age=_ms_label(c["ms"]), last=(i == len(tl["slowest"]) - 1), depth=1))
+    echo(panel_blank())
+    echo(section("idle before prompts", tl["idle"]["gaps"], color_token="meta"))
+    echo(leaf(0, "gaps", meta=(f"p50 {_ms_label(tl['idle']['p50Ms'])} {sep} p95 "
+                               f"{_ms_label(tl['idle']['p95Ms'])} {sep} max "
+                               f"{_ms_label(tl['idle']['maxMs'])}"),
+              age=_ms_label(tl["idle"]["totalMs"]), last=True, depth=1))
+    echo(panel_blank())
+    echo(summary_line(f"trace {sep} {out}"))
+    echo(summary_line(Term.color("meta", "open in ui.perfetto.dev or chrome://tracing")))
+    healths = [("ok", f"{counts['answered']} timed")]
+    if counts["unanswered"] or counts["orphanResults"]:
+        healths.append(("warn", f"{counts['unanswered']} unanswered"))
+    echo(panel_close(healths=healths))
+    return 0
+
+
+# ============================================================
+#  Archive (cold transcript compression)
+# ============================================================
+#
+# Transcripts are append-only JSONL that nobody writes to once a session goes
+# cold, and they compress 5-15x. `summon archive --older-than 60d` replaces
+# each cold <id>.jsonl under ~/.claude/projects with <id>.jsonl.zst (zstd when
+# a binding is importable — Python 3.14's compression.zstd or the zstandard
+# package) or <id>.jsonl.gz, in place, so the transcript location sweep still
+# finds it under the same munged dir. Every archive is verified (sha256 of the
+# decompressed stream) before the original is removed, keeps the original's
+# mtime, and is logged to an append-only manifest. Summon's readers go through
+# open_transcript(), which streams the decompression; an archive is immutable,
+# so its scan checkpoints are validated by (dev, ino, compressed size) and a
+# cached scan is never re-read. Claude Code itself only opens <id>.jsonl: an
+# archived session needs `summon archive --restore <id>` before it can be
+# resumed in the app.
+
+ARCHIVE_AGE_DEFAULT = "60d"
+ARCHIVE_ZSTD_LEVEL = 10
+ARCHIVE_GZIP_LEVEL = 6
+_ARCHIVE_EXT = {"zstd": ".zst", "gzip": ".gz"}        # appended to <id>.jsonl
+ARCHIVE_SUFFIXES = tuple(f".jsonl{ext}" for ext in _ARCHIVE_EXT.values())
+
+
+def archive_root() -> Path:
+    """Where the archive manifest lives — outside the live store and the cache."""
+    return Path.home() / ".claude" / "summon-archive"
+
+
+def is_archived(path: Path) -> bool:
+    """Is this transcript path a compressed archive (<id>.jsonl.zst/.gz)?"""
+    return path.name.endswith(ARCHIVE_SUFFIXES)
+
+
+def _zstd_open(path: Path, mode: str):
+    """A zstd file object over `path` ("rb"/"wb"), or None without a binding."""
+    try:
+        from compression import zstd  # Python 3.14+
+        return zstd.open(path, mode, level=ARCHIVE_ZSTD_LEVEL) if mode == "wb" \
+            else zstd.open(path, mode)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    import io
+    fh = open(path, mode)
+    if mode == "rb":
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(fh, closefd=True))
+    return zstandard.ZstdCompressor(level=ARCHIVE_ZSTD_LEVEL).stream_writer(fh, closefd=True)
+
+
+def archive_codec() -> str:
+    """The codec new archives use: zstd when a binding is importable, else gzip."""
+    try:
+        from compression import zstd  # noqa: F401  (Python 3.14+)
+        return "zstd"
+    except ImportError:
+        pass
+    import importlib.util
+    return "zstd" if importlib.util.find_spec("zstandard") else "gzip"
+
+
+def _codec_errors(codec: str) -> tuple[type[Exception], ...]:
+    """What a damaged `codec` stream raises mid-read besides OSError: EOFError
+    for a truncated one, the codec's own error for corrupt bytes."""
+    import zlib
+    errors: list[type[Exception]] = [EOFError, zlib.error]
+    if codec == "zstd":
+        try:
+            from compression.zstd import ZstdError  # Python 3.14+
+            errors.append(ZstdError)
+        except ImportError:
+            try:
+                from zstandard import ZstdError
+                errors.append(ZstdError)
+            except ImportError:
+                pass
+    return tuple(errors)
+
+
+class _ArchiveReader:
+    """A decompressing reader that re-raises the codec's errors as OSError
+    naming the archive, so a truncated or corrupt archive is just another
+    unreadable transcript to every `except OSError` reader."""
+
+    def __init__(self, fh, path: Path, errors: tuple[type[Exception], ...]):
+        self._fh, self._path, self._errors = fh, path, errors
+
+    def _damaged(self, e: Exception) -> OSError:
+        return OSError(f"{self._path.name}: damaged archive ({type(e).__name__}: {e})")
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self._fh.read(size)
+        except self._errors as e:
+            raise self._damaged(e) from e
+
+    def readline(self, size: int = -1) -> bytes:
+        try:
+            return self._fh.readline(size)
+        except self._errors as e:
+            raise self._damaged(e) from e
+
+    def __iter__(self):
+        try:
+            yield from self._fh
+        except self._errors as e:
+            raise self._damaged(e) from e
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _codec_open(path: Path, codec: str, mode: str):
+    if codec == "gzip":
+        import gzip
+        if mode == "wb":
+            return gzip.open(path, mode, compresslevel=ARCHIVE_GZIP_LEVEL)
+        return _ArchiveReader(gzip.open(path, mode), path, _codec_errors(codec))
+    fh = _zstd_open(path, mode)
+    if fh is None:
+        raise OSError(f"{path.name}: zstd archive, but no zstd module "
+                      "(Python 3.14+, or pip install zstandard)")
+    return fh if mode == "wb" else _ArchiveReader(fh, path, _codec_errors(codec))
+
+
+def open_transcript(path: Path):
+    """Binary reader over a transcript, decompressing an archived one as a
+    stream. Line iteration works on every kind; seeking backwards only on a
+    plain .jsonl (check is_archived() before reverse reads). OSError when the
+    file is missing, its codec isn't available, or the archive is truncated
+    or corrupt."""
+    for codec, ext in _ARCHIVE_EXT.items():
+        if path.name.endswith(".jsonl" + ext):
+            return _codec_open(path, codec, "rb")
+    return path.open("rb")
+
+
+def _stream_sha256(fh, out=None) -> tuple[str, int]:
+    """(sha256 hex, bytes) of a binary stream, copying it to `out` on the way."""
+    import hashlib
+    h = hashlib.sha256()
+    n = 0
+    while chunk := fh.read(1 << 20):
+        h.update(chunk)
+        n += len(chunk)
+        if out is not None:
+            out.write(chunk)
+    return h.hexdigest(), n
+
+
+def archive_transcript(path: Path, codec: str) -> dict:
+    """Compress one transcript next to itself and drop the original.
+
+    Written to a temp name, re-read and checked against the sha256 of the
+    bytes that went in, given the original's atime/mtime, renamed into place
+    — and only then is the original unlinked. Raises OSError with the
+    original untouched on any failure, including the file changing mid-way.
+    Returns the manifest record.
+    """
+    st = path.stat()
+    final = path.with_name(path.name + _ARCHIVE_EXT[codec])
+    tmp = final.with_name(final.name + ".tmp")
+    try:
+        with path.open("rb") as fin, _codec_open(tmp, codec, "wb") as fout:
+            digest, size = _stream_sha256(fin, fout)
+        now = path.stat()
+        if (now.st_size, now.st_mtime_ns) != (st.st_size, st.st_mtime_ns) or size != st.st_size:
+            raise OSError(f"{path.name} changed while archiving — left as is")
+        with _codec_open(tmp, codec, "rb") as check:
+            if _stream_sha256(check) != (digest, size):
+                raise OSError(f"{path.name}: archive failed verification — left as is")
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, final)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    path.unlink()
+    return {"action": "archive", "path": str(path), "archive": str(final),
+            "codec": codec, "size": size, "archivedSize": final.stat().st_size,
+            "sha256": digest, "mtime": _iso_utc(st.st_mtime_ns // 1_000_000),
+            "at": _iso_utc(int(time.time() * 1000))}
+
+
+def restore_transcript(archive: Path, sha256: str = "") -> dict:
+    """Decompress an archive back to <id>.jsonl (mtime kept) and remove it.
+    `sha256` (from the manifest) is checked when given. Raises OSError, and
+    leaves the archive in place, when the original name is taken or on any
+    failure."""
+    codec = next(c for c, ext in _ARCHIVE_EXT.items() if archive.name.endswith(ext))
+    original = archive.with_name(archive.name[: -len(_ARCHIVE_EXT[codec])])
+    if original.exists():
+        raise OSError(f"{original.name} already exists — archive left in place")
+    st = archive.stat()
+    tmp = original.with_name(original.name + ".tmp")
+    try:
+        with _codec_open(archive, codec, "rb") as fin, tmp.open("wb") as fout:
+            digest, size = _stream_sha256(fin, fout)
+        if sha256 and digest != sha256:
+            raise OSError(f"{archive.name}: sha256 differs from the manifest — left as is")
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, original)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    archive.unlink()
+    return {"action": "restore", "path": str(original), "archive": str(archive),
+            "codec": codec, "size": size, "sha256": digest,
+            "at": _iso_utc(int(time.time() * 1000))}
+
+
+def restore_for_use(transcript: Path) -> Path:
+    """The plain <id>.jsonl of a transcript about to be handed to Claude Code
+    or to a model (a recovery pointer, a rebind bridge): an archive is
+    restored in place first — checked against and logged to the manifest —
+    a plain transcript comes back as is. OSError when the restore fails."""
+    if not is_archived(transcript):
+        return transcript
+    record = restore_transcript(transcript, _manifest_digests().get(str(transcript), ""))
+    _append_manifest([record])
+    _forget_transcript_locations()
+    eecho(f"restored archived transcript {transcript.name} "
+          f"{Term.g('→', '->')} {Path(record['path']).name}")
+    return Path(record["path"])
+
+
+def _restore_hint(s: Session) -> str:
+    return f"run `summon archive --restore {s.cli_id or s.sid}` first"
+
+
+def _manifest_path() -> Path:
+    return archive_root() / "manifest.jsonl"
+
+
+def _append_manifest(records: list[dict]) -> None:
+    if not records:
+        return
+    root = archive_root()
+    root.mkdir(parents=True, exist_ok=True)
+    with _manifest_path().open("a", encoding="utf-8") as fh:
+        fh.writelines(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+
+
+def _manifest_digests() -> dict[str, str]:
+    """archive path -> sha256 of its content, from the latest archive record."""
+    out: dict[str, str] = {}
+    try:
+        with _manifest_path().open("rb") as fh:
+            for raw in fh:
+                rec = _json_record(raw)
+                if rec.get("action") == "archive" and rec.get("archive"):
+                    out[rec["archive"]] = str(rec.get("sha256") or "")
+    except OSError:
+        pass
+    return out
+
+
+def _parse_age_days(text: str) -> float | None:
+    """'60d' / '8w' / '36h' / '60' (days) -> days; None when unparseable."""
+    text = (text or "").strip().lower()
+    unit = {"h": 1 / 24, "d": 1.0, "w": 7.0}.get(text[-1:], None)
+    number = text[:-1] if unit is not None else text
+    try:
+        value = float(number)
+    except ValueError:
+        return None
+    return value * (unit or 1.0) if value >= 0 else None
+
+
+def cold_transcripts(older_than_days: float) -> list[tuple[Path, os.stat_result]]:
+    """Plain <id>.jsonl transcripts under cli_jsonl_root() whose mtime is
+    older than the cutoff, largest first."""
+    cutoff = time.time() - older_than_days * 86400
+    found = []
+    try:
+        dirs = [e for e in os.scandir(cli_jsonl_root()) if e.is_dir()]
+    except OSError:
+        dirs = []
+    for d in dirs:
+        try:
+            entries = list(os.scandir(d.path))
+        except OSError:
+            continue
+        for e in entries:
+            if not e.name.endswith(".jsonl"):
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            if st.st_mtime < cutoff and e.is_file():
+                found.append((Path(e.path), st))
+    found.sort(key=lambda item: -item[1].st_size)
+    return found
+
+
+def _archived_transcripts(args, accounts: list[Account]) -> list[Path] | None:
+    """--restore's targets: the archived transcripts of session ID, or every
+    archive in the tree with --all; None when neither was given."""
+    query = args.restore or args.target
+    if query:
+        matches, _ = find_wrappers_by_id(query, accounts)
+        found = {resolve_transcript(s)[0] for s in matches}
+        return sorted(p for p in found if p is not None and is_archived(p))
+    if args.all:
+        return sorted(cli_jsonl_root() / d / name
+                      for hits in transcript_locations().values()
+                      for d, name in hits if name.endswith(ARCHIVE_SUFFIXES))
+    return None
+
+
+def mode_archive(args, accounts: list[Account]) -> int:
+    """`summon archive` — compress cold transcripts in place (dry-run unless
+    --apply), or `--restore <id>|--all` them back to plain JSONL."""
+    sep = Term.g("·", "|")
+    arrow = Term.g("→", "->")
+    if args.restore is not None:
+        targets = _archived_transcripts(args, accounts)
+        if targets is None:
+            eecho("usage: summon archive --restore <id>   (or --restore --all)")
+            return 2
+        if not targets:
+            eecho(f"no archived transcript for {args.restore or args.target or 'any session'}")
+            return 3
+        digests = _manifest_digests()
+        records, failed = [], []
+        for archive in targets:
+            try:
+                records.append(restore_transcript(archive, digests.get(str(archive), "")))
+            except OSError as e:
+                failed.append(str(e))
+        _append_manifest(records)
+        _forget_transcript_locations()
+        if args.json:
+            print(json.dumps({"data": records, "meta": {
+                "count": len(records), "failed": failed,
+                "schema": "claude-mods.summon.archive/v1"}}, indent=2))
+            return 1 if failed else 0
+        echo(panel_open(f"summon {sep} archive", indicator="restore"))
+        echo(panel_blank())
+        for i, r in enumerate(records):
+            echo(leaf(0, Path(r["path"]).name, meta=Term.color("ok", "restored"),
+                      last=i == len(records) - 1 and not failed, depth=1))
+        for msg in failed:
+            echo(summary_line(Term.color("alarm", msg)))
+        echo(panel_blank())
+        echo(panel_close(healths=[("alarm" if failed else "ok",
+                                   f"{len(records)} restored")]))
+        return 1 if failed else 0
+
+    days = _parse_age_days(args.older_than)
+    if days is None:
+        eecho(f"usage: summon archive --older-than 60d   (d/w/h; got {args.older_than!r})")
+        return 2
+    cold = cold_transcripts(days)
+    codec = archive_codec()
+    total = sum(st.st_size for _, st in cold)
+    records, failed = [], []
+    if args.apply and cold:
+        from concurrent.futures import ThreadPoolExecutor  # zlib/zstd drop the GIL
+
+        def one(path: Path) -> dict | None:
+            try:
+                return archive_transcript(path, codec)
+            except OSError as e:
+                failed.append(str(e))
+                return None
+
+        with ThreadPoolExecutor(max_workers=_jobs(args)) as pool:
+            records = [r for r in pool.map(one, [p for p, _ in cold]) if r]
+        _append_manifest(records)
+        _forget_transcript_locations()
+    packed = sum(r["archivedSize"] for r in records)
+    done = sum(r["size"] for r in records)
+
+    if args.json:
+        data = records if args.apply else [
+            {"path": str(p), "size": st.st_size,
+             "mtime": _iso_utc(st.st_mtime_ns // 1_000_000)} for p, st in cold]
+        print(json.dumps({"data": data, "meta": {
+            "count": len(data), "applied": bool(args.apply), "codec": codec,
+            "olderThanDays": days, "bytes": done if args.apply else total,
+            "archivedBytes": packed, "failed": failed,
+            "manifest": str(_manifest_path()),
+            "schema": "claude-mods.summon.archive/v1"}}, indent=2))
+        return 1 if failed else 0
+
+    echo(panel_open(f"summon {sep} archive", indicator=f"older than {args.older_than}"))
+    echo(panel_blank())
+    if not cold:
+        echo(section("no transcripts that cold", color_token="ok"))
+        echo(panel_blank())
+        echo(panel_close())
+        return 0
+    shown = cold[:10]
+    echo(section("largest" if len(cold) > len(shown) else "transcripts", len(cold)))
+    for i, (p, st) in enumerate(shown):
+        echo(leaf(0, p.stem, meta=f"{st.st_size / 1e6:.1f}MB",
+                  age=_ago(st.st_mtime_ns // 1_000_000), last=i == len(shown) - 1, depth=1))
+    echo(panel_blank())
+    mb = total / 1e6
+    if not args.apply:
+        echo(summary_line(f"would archive {len(cold)} transcript(s) {sep} {mb:.1f} MB "
+                          f"{sep} codec {codec} — re-run with --apply"))
+        echo(summary_line("archived sessions can't be resumed in the app until "
+                          "`summon archive --restore <id>`"))
+        echo(panel_blank())
+        echo(panel_close(healths=[("meta", "dry run")]))
+        return 0
+    echo(summary_line(f"{len(records)} archived ({codec}) {sep} {done / 1e6:.1f} MB "
+                      f"{arrow} {packed / 1e6:.1f} MB {sep} manifest {_manifest_path()}"))
+    for msg in failed:
+        echo(summary_line(Term.color("alarm", msg)))
+    echo(panel_blank())
+    echo(panel_close(healths=[("alarm", f"{len(failed)} failed")] if failed
+                     else [("ok", f"{len(records)} archived")]))
+    return 1 if failed else 0
+
+
+# ============================================================
+#  Dedupe (duplicate transcript collapse)
+# ============================================================
+#
+# The same <cli_id>.jsonl ends up in several munged project dirs: rebind's
+# transcript bridge copies it into enc(new cwd), transfers and manual moves do
+# the same, and the session then keeps growing in one place while the stale
+# copy sits in the other. `summon dedupe` finds those copies — only files with
+# the same name, i.e. the same session, are ever compared — and reads each
+# distinct inode once, in DEDUPE_CHUNK pieces, hashing the whole file and,
+# on the same pass, the prefix lengths of its shorter namesakes. Two results:
+#
+#   exact  — identical bytes. With --apply every copy but one keeper becomes a
+#            hardlink to it: the replaced file is first linked (else copied)
+#            into ~/.claude/summon-backups/<stamp>/ like rebind's wrappers,
+#            then swapped atomically, verified by inode, restored on mismatch.
+#            The bytes come back once that backup dir is deleted.
+#   prefix — one copy is a byte-for-byte prefix of another (the session went
+#            on appending in one dir). Reported, never touched: the shorter
+#            copy is what some wrapper may still resolve to.
+#
+# Copies modified in the last DEDUPE_QUIET_S are skipped — a live session may
+# be mid-append. Archives (.jsonl.zst/.gz) are left out; they are not
+# byte-comparable with their plain namesakes.
+
+DEDUPE_CHUNK = 1 << 20
+DEDUPE_QUIET_S = 600
+
+
+def transcript_copies(prefix: str = "") -> tuple[dict[str, list[tuple[Path, os.stat_result]]], int]:
+    """Plain, non-empty <id>.jsonl transcripts under cli_jsonl_root() grouped
+    by file name, keeping only names found in two or more places (optionally
+    only ids starting with `prefix`); plus how many quiet-window files were
+    skipped."""
+    quiet = time.time() - DEDUPE_QUIET_S
+    by_name: dict[str, list[tuple[Path, os.stat_result]]] = {}
+    active = 0
+    try:
+        dirs = [e for e in os.scandir(cli_jsonl_root()) if e.is_dir()]
+    except OSError:
+        dirs = []
+    for d in dirs:
+        try:
+            entries = list(os.scandir(d.path))
+        except OSError:
+            continue
+        for e in entries:
+            if not e.name.endswith(".jsonl") or not e.name.startswith(prefix):
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            if not e.is_file() or not st.st_size:
+                continue
+            if st.st_mtime >= quiet:
+                active += 1
+                continue
+            by_name.setdefault(e.name, []).append((Path(e.path), st))
+    return {name: sorted(copies, key=lambda c: str(c[0]))
+            for name, copies in sorted(by_name.items()) if len(copies) > 1}, active
+
+
+def _hash_prefixes(path: Path, marks: Iterable[int] = ()) -> tuple[str, dict[int, str], int]:
+    """One chunked pass over `path`: (sha256 of the whole file, {m: sha256 of
+    its first m bytes} for each mark it reaches, bytes read)."""
+    import hashlib
+    h = hashlib.sha256()
+    at: dict[int, str] = {}
+    pos = 0
+    with open(path, "rb") as fh:
+        for stop in [*sorted(set(marks)), None]:
+            while stop is None or pos < stop:
+                chunk = fh.read(DEDUPE_CHUNK if stop is None
+                                else min(DEDUPE_CHUNK, stop - pos))
+                if not chunk:
+                    break
+                h.update(chunk)
+                pos += len(chunk)
+            if stop is not None and pos == stop:
+                at[stop] = h.hexdigest()
+    return h.hexdigest(), at, pos
+
+
+def find_duplicates(copies: dict[str, list[tuple[Path, os.stat_result]]],
+                    jobs: int = 1) -> tuple[list[dict], list[dict], int]:
+    """(exact groups, prefix pairs, bytes hashed) over transcript_copies().
+
+    Paths already sharing an inode count as one copy and are read once. An
+    exact group names its keeper — the inode with the most links, then the
+    first path — the `duplicates` to re-point at it, and `reclaimBytes`: the
+    size of every other inode whose links all live in the group. A prefix
+    pair names the shorter copy and the longest copy it is a prefix of.
+    """
+    work: dict[tuple[int, int], tuple[Path, list[int]]] = {}
+    for found in copies.values():
+        inodes = {(st.st_dev, st.st_ino): (p, st) for p, st in reversed(found)}
+        sizes = {st.st_size for _, st in inodes.values()}
+        for key, (p, st) in inodes.items():
+            work[key] = (p, [n for n in sizes if n < st.st_size])
+
+    from concurrent.futures import ThreadPoolExecutor  # hashlib drops the GIL
+
+    def one(item):
+        key, (path, marks) = item
+        try:
+            return key, _hash_prefixes(path, marks)
+        except OSError:
+            return key, None
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        digests = {key: r for key, r in pool.map(one, work.items()) if r}
+    hashed = sum(r[2] for r in digests.values())
+
+    exact, prefix = [], []
+    for name, found in copies.items():
+        # a copy whose size moved since the stat can't be judged — leave it out
+        live = [(p, st) for p, st in found
+                if (st.st_dev, st.st_ino) in digests
+                and digests[st.st_dev, st.st_ino][2] == st.st_size]
+        by_digest: dict[tuple[int, str], list[tuple[Path, os.stat_result]]] = {}
+        for p, st in live:
+            by_digest.setdefault((st.st_dev, digests[st.st_dev, st.st_ino][0]), []).append((p, st))
+        for (_, digest), group in by_digest.items():
+            links: dict[int, list[tuple[Path, os.stat_result]]] = {}
+            for p, st in group:
+                links.setdefault(st.st_ino, []).append((p, st))
+            if len(links) < 2:
+                continue
+            keep_ino = max(links, key=lambda ino: (links[ino][0][1].st_nlink,
+                                                   len(links[ino]), -group.index(links[ino][0])))
+            keeper = links[keep_ino][0]
+            size = keeper[1].st_size
+            exact.append({
+                "cliSessionId": name[:-len(".jsonl")], "kind": "exact",
+                "size": size, "sha256": digest, "keep": str(keeper[0]),
+                "duplicates": [str(p) for p, st in group if st.st_ino != keep_ino],
+                "alreadyLinked": len(links[keep_ino]) - 1,
+                "reclaimBytes": sum(size for ino, ps in links.items()
+                                    if ino != keep_ino and ps[0][1].st_nlink == len(ps)),
+            })
+        shorter_first = sorted(live, key=lambda c: (c[1].st_size, str(c[0])))
+        seen: set[tuple[int, int]] = set()
+        for i, (p, st) in enumerate(shorter_first):
+            key = (st.st_dev, st.st_ino)
+            if key in seen:
+                continue
+            seen.add(key)
+            full = digests[key][0]
+            longer = [(q, qt) for q, qt in shorter_first[i + 1:]
+                      if qt.st_size > st.st_size
+                      and digests[qt.st_dev, qt.st_ino][1].get(st.st_size) == full]
+            if longer:
+                q, qt = max(longer, key=lambda c: c[1].st_size)
+                prefix.append({
+                    "cliSessionId": name[:-len(".jsonl")], "kind": "prefix",
+                    "size": st.st_size, "shorter": str(p), "longer": str(q),
+                    "longerSize": qt.st_size, "extraBytes": qt.st_size - st.st_size,
+                })
+    return exact, prefix, hashed
+
+
+def _file_sig(st: os.stat_result) -> tuple[int, int, int, int]:
+    return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def collapse_duplicate(keep: Path, dup: Path, backup_root: Path,
+                       keep_st: os.stat_result, dup_st: os.stat_result) -> None:
+    """Replace `dup` with a hardlink to `keep` (identical bytes, same
+    filesystem). `keep_st` / `dup_st` are the stats taken when the two were
+    hashed (transcript_copies()). Backs dup up under backup_root first, swaps
+    atomically and verifies by inode; on a failed verify the backup is
+    restored. OSError with dup untouched when either file changed since it
+    was hashed — checked before the backup and again right before the swap —
+    or when the filesystem can't hardlink."""
+    def unchanged() -> bool:
+        try:
+            return (_file_sig(dup.stat()) == _file_sig(dup_st)
+                    and _file_sig(keep.stat()) == _file_sig(keep_st))
+        except OSError:
+            return False
+
+    if dup_st.st_size != keep_st.st_size or dup_st.st_dev != keep_st.st_dev or not unchanged():
+        raise OSError(f"{dup.name}: changed since hashing — left as is")
+    if dup_st.st_ino == keep_st.st_ino:
+        return
+
+    # 1. Backup outside the live store — the old inode itself where possible
+    backup_root.mkdir(parents=True, exist_ok=True)
+    backup = backup_root / f"projects__{dup.parent.name}__{dup.name}"
+    try:
+        os.link(dup, backup)
+    except OSError:
+        shutil.copy2(dup, backup)
+
+    # 2. Atomic swap
+    tmp = dup.with_name(dup.name + ".dedupe.tmp")
+    try:
+        os.link(keep, tmp)
+    except OSError as e:
+        raise OSError(f"{dup.name}: can't hardlink here ({e.strerror or e})") from None
+    if not unchanged():
+        tmp.unlink()
+        raise OSError(f"{dup.name}: changed since hashing — left as is")
+    os.replace(tmp, dup)
+
+    # 3. Verify by re-stat
+    try:
+        after = dup.stat()
+        ok = (after.st_dev, after.st_ino) == (keep_st.st_dev, keep_st.st_ino)
+    except OSError:
+        ok = False
+    if not ok:
+        shutil.copy2(backup, dup)  # restore from backup
+        raise OSError(f"{dup.name}: verify failed — restored from {backup}")
+
+
+def mode_dedupe(args, accounts: list[Account]) -> int:
+    """`summon dedupe [ID]` — report duplicate and prefix-duplicate transcript
+    copies; with --apply, hardlink the exact duplicates to one keeper."""
+    sep = Term.g("·", "|")
+    copies, active = transcript_copies(args.target or "")
+    exact, prefix, hashed = find_duplicates(copies, _jobs(args))
+    reclaim = sum(g["reclaimBytes"] for g in exact)
+    n_dups = sum(len(g["duplicates"]) for g in exact)
+
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    backup_root = Path.home() / ".claude" / "summon-backups" / stamp
+    linked, freeable, failed = 0, 0, []
+    if args.apply:
+        hashed_at = {str(p): st for found in copies.values() for p, st in found}
+        for g in exact:
+            g["linked"] = []
+            for dup in g["duplicates"]:
+                try:
+                    collapse_duplicate(Path(g["keep"]), Path(dup), backup_root,
+                                       hashed_at[g["keep"]], hashed_at[dup])
+                    g["linked"].append(dup)
+                except OSError as e:
+                    failed.append(str(e))
+            linked += len(g["linked"])
+            if len(g["linked"]) == len(g["duplicates"]):
+                freeable += g["reclaimBytes"]  # held by the backup until it is deleted
+
+    if args.json:
+        meta = {
+            "transcripts": sum(len(c) for c in copies.values()),
+            "skippedActive": active, "hashedBytes": hashed,
+            "exactGroups": len(exact), "duplicates": n_dups, "reclaimBytes": reclaim,
+            "prefixPairs": len(prefix),
+            "prefixBytes": sum(g["size"] for g in prefix),
+            "applied": bool(args.apply), "linked": linked,
+            "reclaimableAfterBackupDelete": freeable, "failed": failed,
+            "schema": "claude-mods.summon.dedupe/v1",
+        }
+        if args.apply and linked:
+            meta["backup"] = str(backup_root)
+        print(json.dumps({"data": exact + prefix, "meta": meta}, indent=2))
+        return 1 if failed else 0
+
+    echo(panel_open(f"summon {sep} dedupe", indicator="apply" if args.apply else "dry-run"))
+    echo(panel_blank())
+    if not exact and not prefix:
+        echo(section("no duplicate transcripts", color_token="ok"))
+        echo(panel_blank())
+        echo(panel_close())
+        return 0
+    if exact:
+        echo(section("exact copies", len(exact)))
+        for i, g in enumerate(exact):
+            copies_n = len(g["duplicates"]) + 1 + g["alreadyLinked"]
+            echo(leaf(0, g["cliSessionId"][:14],
+                      meta=f"{copies_n} copies {sep} {g['size'] / 1e6:.1f}MB",
+                      last=i == len(exact) - 1, depth=1))
+        echo(panel_blank())
+    if prefix:
+        echo(section("prefix copies", len(prefix)))
+        for i, g in enumerate(prefix):
+            echo(leaf(0, g["cliSessionId"][:14],
+                      meta=f"{Path(g['shorter']).parent.name[-24:]} {sep} "
+                           f"+{g['extraBytes'] / 1e6:.1f}MB in {Path(g['longer']).parent.name[-24:]}",
+                      last=i == len(prefix) - 1, depth=1))
+        echo(panel_blank())
+        echo(summary_line("prefix copies are a stale snapshot of a session that kept "
+                          "going elsewhere — reported only, never touched"))
+    mb = reclaim / 1e6
+    if not args.apply:
+        if exact:
+            echo(summary_line(f"would hardlink {n_dups} duplicate(s) {sep} {mb:.1f} MB "
+                              f"reclaimable once the backup is deleted — re-run with --apply"))
+        echo(panel_blank())
+        echo(panel_close(healths=[("meta", "dry run")]))
+        return 0
+    echo(summary_line(f"{linked} hardlinked {sep} {freeable / 1e6:.1f} MB reclaimable "
+                      f"once the backup is deleted"))
+    if linked:
+        echo(summary_line(f"backup: {backup_root} (holds the replaced copies)"))
+    for msg in failed:
+        echo(summary_line(Term.color("alarm", msg)))
+    echo(panel_blank())
+    echo(panel_close(healths=[("alarm", f"{len(failed)} failed")] if failed
+                     else [("ok", f"{linked} linked")]))
+    return 1 if failed else 0
+
+
+# ============================================================
+#  Serve (hot inventory daemon)
+# ============================================================
+#
+# Every widget render used to pay a full store scan: discover accounts, stat
+# every wrapper, resolve and stat every transcript. `summon serve` keeps that
+# inventory in memory and answers `pick --json` / `widget` over a Unix socket
+# under cache_root(); the CLI tries the socket first and falls back to doing
+# the work in-process when nothing is listening. Freshness comes from inotify
+# (bound through ctypes — no dependency) on the account/workspace dirs and
+# ~/.claude/projects: wrapper events drop the session list, transcript events
+# drop that transcript's metrics. Without inotify (or with --poll) a request
+# re-validates the session list when the last refresh is older than
+# --interval seconds, and each memoized metric against its transcript's
+# size + mtime. The daemon answers one request at a time
+# by running the ordinary mode function against the hot state, so its output
+# is byte-for-byte what the CLI would print.
+
+SERVE_POLL_S_DEFAULT = 2.0
+SERVE_TIMEOUT_S = 120
+
+_HOT: "_HotInventory | None" = None  # set only inside `summon serve`
+
+
+def serve_socket_path() -> Path:
+    return cache_root() / "serve.sock"
+
+
+class _Inotify:
+    """Minimal inotify(7) over ctypes: add_watch + a non-blocking event read."""
+
+    MODIFY, ATTRIB, CLOSE_WRITE = 0x2, 0x4, 0x8
+    MOVED_FROM, MOVED_TO, CREATE, DELETE = 0x40, 0x80, 0x100, 0x200
+    DELETE_SELF, Q_OVERFLOW, IGNORED, ISDIR = 0x400, 0x4000, 0x8000, 0x40000000
+    MASK = (MODIFY | ATTRIB | CLOSE_WRITE | MOVED_FROM | MOVED_TO | CREATE
+            | DELETE | DELETE_SELF)
+    STRUCTURAL = MOVED_FROM | MOVED_TO | CREATE | DELETE
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._libc, self._ctypes = libc, ctypes
+        self.fd = fd
+        self.watches: dict[int, tuple[str, Path]] = {}
+
+    def add(self, kind: str, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), self.MASK)
+        if wd < 0:
+            err = self._ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch {path}: {os.strerror(err)}")
+        self.watches[wd] = (kind, path)
+
+    def read(self) -> list[tuple[str | None, Path | None, int, str]]:
+        """Pending events as (watch kind, watched dir, mask, name)."""
+        import struct
+        try:
+            buf = os.read(self.fd, 256 * 1024)
+        except BlockingIOError:
+            return []
+        events, i = [], 0
+        while i + 16 <= len(buf):
+            wd, mask, _, length = struct.unpack_from("iIII", buf, i)
+            name = os.fsdecode(buf[i + 16:i + 16 + length].rstrip(b"\0"))
+            i += 16 + length
+            kind, path = self.watches.get(wd, (None, None))
+            if mask & self.IGNORED:
+                self.watches.pop(wd, None)
+            events.append((kind, path, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _HotInventory:
+    """The in-memory state `summon serve` answers from.
+
+    Holds the account list, every account's sessions (load order) and the
+    rich metrics per transcript. query_sessions() and _rich_metrics() consult
+    it while it is installed as _HOT; the watcher invalidates pieces of it.
+    """
+
+    def __init__(self, claude_dir: Path, watched: bool):
+        self.claude_dir = claude_dir
+        self.watched = watched
+        self._accounts: list[Account] | None = None
+        self._sessions: dict[str, list[Session]] = {}
+        self._metrics: dict[str, tuple[tuple[int, int], dict]] = {}
+        self._dirty: set[str] = set()
+
+    def invalidate_sessions(self) -> None:
+        self._accounts = None
+        self._sessions.clear()
+
+    def invalidate_transcript(self, path: Path) -> None:
+        self._dirty.add(str(path))
+
+    def refresh(self) -> None:
+        """Polling mode: re-derive the session list and transcript locations
+        (metrics re-validate themselves by stat)."""
+        self.invalidate_sessions()
+        _forget_transcript_locations()
+
+    def invalidate_all(self) -> None:
+        self.refresh()
+        self._metrics.clear()
+        self._dirty.clear()
+
+    def accounts(self) -> list[Account]:
+        if self._accounts is None:
+            self._accounts = discover_accounts(self.claude_dir)
+        return self._accounts
+
+    def sessions(self, accounts: list[Account]) -> list[Session]:
+        out: list[Session] = []
+        for acct in accounts:
+            if acct.uuid not in self._sessions:
+                indexed = _indexed_sessions([acct])
+                self._sessions[acct.uuid] = (indexed if indexed is not None
+                                             else _load_sessions_direct(acct))
+            out.extend(self._sessions[acct.uuid])
+        return out
+
+    def metrics(self, transcripts: list[Path | None], jobs: int) -> list[dict]:
+        """_rich_metrics with a memo: a cached result stands while the
+        watcher hasn't flagged its transcript (or, polling, while its size
+        and mtime are unchanged); the rest go through the normal scan."""
+        out: list[dict | None] = [None] * len(transcripts)
+        todo: list[int] = []
+        stamps: list[tuple[int, int] | None] = [None] * len(transcripts)
+        for i, t in enumerate(transcripts):
+            key = str(t) if t else ""
+            hit = self._metrics.get(key) if t else None
+            if hit and self.watched and key not in self._dirty:
+                out[i] = hit[1]
+                continue
+            try:
+                st = t.stat() if t else None
+                stamps[i] = (st.st_mtime_ns, st.st_size) if st else None
+            except OSError:
+                stamps[i] = None
+            if hit and stamps[i] == hit[0]:
+                out[i] = hit[1]
+            else:
+                todo.append(i)
+        fresh = list(_scan_rich_metrics([transcripts[i] for i in todo], jobs))
+        for i, m in zip(todo, fresh):
+            out[i] = m
+            if transcripts[i] and stamps[i]:
+                self._metrics[str(transcripts[i])] = (stamps[i], m)
+        for t in transcripts:
+            self._dirty.discard(str(t))
+        return out  # type: ignore[return-value]
+
+
+def _watch_store(ino: _Inotify, claude_dir: Path) -> None:
+    """Watch the wrapper tree (root, accounts, workspaces) and every project
+    dir — plus the parents of the two roots, so a root that appears after
+    start-up is picked up like any other new dir."""
+    ino.add("claude-dir", claude_dir)
+    projects = cli_jsonl_root()
+    if projects.parent.is_dir():
+        ino.add("claude-home", projects.parent)
+    root = claude_dir / "claude-code-sessions"
+    if root.is_dir():
+        _watch_dir(ino, "sessions-root", root)
+    if projects.is_dir():
+        _watch_dir(ino, "projects-root", projects)
+
+
+# the kind of watch a new subdirectory of each kind of watched dir gets
+_WATCH_CHILD = {"sessions-root": "account", "account": "workspace",
+                "projects-root": "project"}
+
+
+def _watch_dir(ino: _Inotify, kind: str, path: Path) -> None:
+    """Watch `path` and, recursively, the subdirectories it already holds —
+    a dir created after start-up may be filled before its watch lands."""
+    ino.add(kind, path)
+    child = _WATCH_CHILD.get(kind)
+    if child:
+        for d in (d for d in path.iterdir() if d.is_dir()):
+            _watch_dir(ino, child, d)
+
+
+def _apply_fs_events(ino: _Inotify, hot: _HotInventory) -> None:
+    """Fold pending inotify events into invalidations (and new watches)."""
+    for kind, path, mask, name in ino.read():
+        if mask & ino.Q_OVERFLOW or kind is None:
+            hot.invalidate_all()
+            continue
+        new_dir = bool(mask & ino.ISDIR and mask & (ino.CREATE | ino.MOVED_TO))
+        if kind in ("claude-dir", "claude-home"):
+            root = {"claude-dir": ("claude-code-sessions", "sessions-root"),
+                    "claude-home": (cli_jsonl_root().name, "projects-root")}[kind]
+            if not (new_dir and name == root[0]):
+                continue
+            try:
+                _watch_dir(ino, root[1], path / name)
+            except OSError:
+                pass
+            hot.invalidate_all()  # a whole new tree: nothing cached can stand
+            continue
+        try:
+            if new_dir and kind in _WATCH_CHILD:
+                _watch_dir(ino, _WATCH_CHILD[kind], path / name)
+        except OSError:
+            hot.invalidate_all()
+        if kind in ("sessions-root", "account", "workspace"):
+            hot.invalidate_sessions()
+        elif kind == "projects-root":
+            _forget_transcript_locations()
+        elif name.endswith((".jsonl",) + ARCHIVE_SUFFIXES):
+            if mask & ino.STRUCTURAL:
+                _forget_transcript_locations()
+            hot.invalidate_transcript(path / name)
+
+
+def _serve_one(conn, parser: argparse.ArgumentParser, hot: _HotInventory) -> None:
+    """Read one {"argv", "cwd"} request, run the mode in-process, reply with
+    {"rc", "stdout", "stderr"}."""
+    import contextlib
+    import io
+    conn.settimeout(5)
+    raw = b""
+    while not raw.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        raw += chunk
+    out = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    err = io.StringIO()
+    rc = 2
+    cwd = os.getcwd()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            req = json.loads(raw)
+            args = parser.parse_args(req["argv"])
+            os.chdir(req.get("cwd") or cwd)
+            if args.mode == "widget":
+                rc = mode_widget(args, hot.accounts())
+            elif args.mode == "pick" and (args.json or args.ndjson):
+                rc = mode_pick(args, hot.accounts())
+            else:
+                eecho("summon serve answers only `pick --json` / `--ndjson` and `widget`")
+        except SystemExit as e:  # argparse usage errors
+            rc = e.code if isinstance(e.code, int) else 2
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            eecho(f"summon serve: bad request ({e})")
+        except Exception as e:  # sqlite3.Error and the like: fail this request, not the daemon
+            rc = 1
+            eecho(f"summon serve: request failed ({type(e).__name__}: {e})")
+        finally:
+            os.chdir(cwd)
+    reply = {"rc": rc, "stdout": out.buffer.getvalue().decode("utf-8", "replace"),
+             "stderr": err.getvalue()}
+    conn.settimeout(SERVE_TIMEOUT_S)
+    conn.sendall(json.dumps(reply).encode("utf-8"))
+
+
+def ask_server(argv: list[str]) -> int | None:
+    """Client half: hand `argv` to a running `summon serve` and relay its
+    answer. None when no daemon is listening (or it failed mid-request) —
+    the caller then does the work in-process."""
+    path = serve_socket_path()
+    if os.environ.get("SUMMON_NO_SERVE") == "1" or not path.exists():
+        return None  # decided before `import socket`: no daemon, no import cost
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(str(path))
+            sock.settimeout(SERVE_TIMEOUT_S)
+            sock.sendall(json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8")
+                         + b"\n")
+            chunks = []
+            while chunk := sock.recv(1 << 20):
+                chunks.append(chunk)
+        reply = json.loads(b"".join(chunks))
+    except (OSError, ValueError) as e:
+        if not isinstance(e, (ConnectionRefusedError, FileNotFoundError)):
+            eecho(f"warning: summon serve did not answer ({e}) — running in-process")
+        return None
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(reply.get("stdout", "").encode("utf-8"))
+    sys.stdout.flush()
+    return int(reply.get("rc", 0))
+
+
+def mode_serve(args, claude_dir: Path, parser: argparse.ArgumentParser) -> int:
+    """`summon serve` — keep the inventory hot and answer over a Unix socket."""
+    global _HOT
+    import selectors
+    import signal
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        eecho("summon serve needs Unix domain sockets (not available on this platform)")
+        return 2
+    sock_path = Path(args.socket) if args.socket else serve_socket_path()
+    if sock_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(sock_path))
+            eecho(f"summon serve is already listening on {sock_path}")
+            return 2
+        except OSError:
+            sock_path.unlink()  # stale socket from a dead daemon
+        finally:
+            probe.close()
+
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+    ino = None
+    if sys.platform.startswith("linux") and not args.poll:
+        try:
+            ino = _Inotify()
+            _watch_store(ino, claude_dir)
+        except (OSError, AttributeError) as e:
+            eecho(f"warning: inotify unavailable ({e}) — polling every {args.interval}s")
+            if ino:
+                ino.close()
+            ino = None
+    hot = _HotInventory(claude_dir, watched=ino is not None)
+    _HOT = hot
+
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)  # the socket is created owner-only — no chmod window
+    try:
+        srv.bind(str(sock_path))
+    finally:
+        os.umask(umask)
+    srv.listen(16)
+    sel = selectors.DefaultSelector()
+    sel.register(srv, selectors.EVENT_READ, "client")
+    if ino:
+        sel.register(ino.fd, selectors.EVENT_READ, "fs")
+
+    def stop(*_):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    eecho(f"summon serve: listening on {sock_path} "
+          f"({'inotify' if ino else f'polling every {args.interval}s'}) — Ctrl-C to stop")
+    last_refresh = time.monotonic()
+    served = 0
+    try:
+        hot.sessions(hot.accounts())  # warm the inventory before the first request
+        while True:
+            for key, _ in sel.select():
+                if key.data == "fs":
+                    _apply_fs_events(ino, hot)
+                    continue
+                conn, _ = srv.accept()
+                with conn:
+                    if ino:
+                        _apply_fs_events(ino, hot)  # anything not yet folded in
+                    elif time.monotonic() - last_refresh >= args.interval:
+                        hot.refresh()
+                        last_refresh = time.monotonic()
+                    try:
+                        _serve_one(conn, parser, hot)
+                        served += 1
+                    except OSError as e:
+                        eecho(f"summon serve: client dropped ({e})")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sel.close()
+        srv.close()
+        if ino:
+            ino.close()
+        try:
+            sock_path.unlink()
+        except OSError:
+            pass
+        _HOT = None
+    eecho(f"summon serve: stopped after {served} request(s)")
+    return 0
+
+
 # ============================================================
 #  Main
 # ============================================================
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         description="Claude Desktop session toolbox — cross-account transfer, "
                     "recovery picker, cwd rebind, store doctor.",
@@ -2031,23 +5541,36 @@ def main():
                "  summon recover 6577b24c         distilled handover brief for one session\n"
                "  summon recover 6577b24c --no-distill   plain pointer prompt, no LLM call\n"
                "  summon recover 6577b24c --refresh      ignore cached brief, re-distill\n"
+               "  summon search \"fts5 tokenizer\"   full-text search -> distilled handover\n"
                "  summon rebind 6577b24c --cwd X:\\Maplab\\LCMap   fix cwd after folder move\n"
-               "  summon doctor                   scan for broken cwd bindings\n",
+               "  summon doctor                   scan for broken cwd bindings\n"
+               "  summon stats --by project,model   token / tool / active-time rollup\n"
+               "  summon timeline 6577b24c        tool latency p50/p95 + Chrome trace\n"
+               "  summon archive --older-than 60d --apply   compress cold transcripts\n"
+               "  summon dedupe --apply           hardlink duplicate transcript copies\n"
+               "  summon serve                    keep the inventory hot for pick --json/widget\n",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     p.add_argument("mode", nargs="?",
-                   choices=["rebind", "pick", "recover", "doctor", "widget"],
+                   choices=["rebind", "pick", "recover", "search", "doctor", "stats",
+                            "timeline", "archive", "dedupe", "widget", "serve"],
                    help="Toolbox mode; omit for cross-account transfer")
     p.add_argument("target", nargs="?",
-                   help="Session id for rebind/recover (sessionId or cliSessionId, prefix ok)")
+                   help="Session id for rebind/recover/timeline (sessionId or "
+                        "cliSessionId, prefix ok); query words for search (quote them); "
+                        "dedupe: only cliSessionIds starting with it")
     p.add_argument("--to", help="Destination account (UUID prefix or email substring)")
     p.add_argument("--from", dest="from_",
                    help="Restrict source to one account (default: all non-destination accounts)")
     # Time-window filter: --days N (custom) or one of the convenience aliases.
     # Transfer defaults to 3 days, pick to 30; --all disables.
     p.add_argument("--days", type=int, default=None,
-                   help="Time window in days (default: 3 for transfer, 30 for pick)")
-    p.add_argument("--all", action="store_true", help="Disable time filter (any age)")
+                   help="Time window in days (default: 3 for transfer, 30 for pick "
+                        "and stats)")
+    p.add_argument("--all", action="store_true",
+                   help="Disable time filter (any age). Recover with no id: "
+                        "batch-refresh the handover brief of every session in the "
+                        "window. Archive --restore: restore every archive")
     p.add_argument("--1d", dest="window_1d", action="store_true", help="Last 24h (alias)")
     p.add_argument("--3d", dest="window_3d", action="store_true", help="Last 3 days (alias)")
     p.add_argument("--7d", dest="window_7d", action="store_true", help="Last 7 days (alias)")
@@ -2059,6 +5582,11 @@ def main():
     p.add_argument("--pick", action="store_true", help=argparse.SUPPRESS)  # legacy flag — default behavior now
     p.add_argument("--move", action="store_true",
                    help="Move semantics — delete source after copying (lean cleanup)")
+    p.add_argument("--link", action="store_true",
+                   help="Rebind's transcript bridge: reflink (copy-on-write clone) "
+                        "when the filesystem supports it, else hardlink, else copy. "
+                        "Transfer: reflink the wrappers, else copy (never a hardlink). "
+                        "Reports which one was used")
     p.add_argument("--dry-run", action="store_true", help="Preview without touching files")
     p.add_argument("--list-accounts", action="store_true", help="List all accounts and exit")
     p.add_argument("--peek", metavar="ID", help="Preview a session's last messages and exit (id prefix or full)")
@@ -2068,6 +5596,11 @@ def main():
     p.add_argument("--yes", action="store_true",
                    help="Skip the final confirmation prompt only — selection is still "
                         "required (interactively, via piped stdin, or via --select)")
+    p.add_argument("--from-prefix", metavar="OLD", default="",
+                   help="Rebind (bulk): every session whose cwd is OLD or under it...")
+    p.add_argument("--to-prefix", metavar="NEW", default="",
+                   help="...moves to the same relative place under NEW (one store "
+                        "pass, one backup root, --jobs parallel rewrites)")
     p.add_argument("--no-transcript", action="store_true",
                    help="Rebind: skip copying the transcript into the new munged project dir")
     p.add_argument("--force", action="store_true",
@@ -2075,26 +5608,63 @@ def main():
     p.add_argument("--json", action="store_true",
                    help="Doctor: emit findings as a JSON envelope on stdout. "
                         "Pick: emit the session inventory as a JSON envelope "
-                        "(no picker; stdout is JSON only)")
+                        "(no picker; stdout is JSON only). Search: emit the "
+                        "ranked hits as a JSON envelope. Stats / timeline / archive / "
+                        "dedupe: emit the groups / the latency profile / the archived "
+                        "files / the duplicate groups as a JSON envelope")
+    p.add_argument("--ndjson", action="store_true",
+                   help="Pick: stream the inventory as newline-delimited JSON — one "
+                        "compact row per line as soon as it is built, then a closing "
+                        '{"meta": {...}} line (implies --json)')
     p.add_argument("--rich", action="store_true",
                    help="Pick --json: add transcript-derived display metrics per "
                         "session (context occupancy, activity density, tool/event "
                         "counts, size, duration, opening ask) — schema pick/v2. "
                         "One transcript read per session; powers the card picker")
+    p.add_argument("--jobs", type=int, default=None, metavar="N",
+                   help="Pick --json --rich / widget / stats: analyze transcripts in up to N "
+                        "worker processes (default: CPU count; 1 = serial). Output "
+                        "is identical either way. Recover --all: run up to N "
+                        f"distillations (`claude -p` calls) at once (default: "
+                        f"{DISTILL_JOBS_DEFAULT} — rate limits, not cores). Rebind "
+                        "--from-prefix: rewrite up to N wrappers at once. Doctor: up to N concurrent cwd "
+                        "stats (default: 16). Archive: compress N transcripts at once. "
+                        "Dedupe: hash N transcripts at once")
+    p.add_argument("--stat-timeout", type=float, default=None, metavar="SECONDS",
+                   help="Doctor: give up on a cwd stat after SECONDS (default: 3) "
+                        "and report it as unreachable instead of broken — for "
+                        "paths on stalled network drives or unmounted volumes")
     p.add_argument("--no-distill", action="store_true",
-                   help="Recover/pick: skip the LLM handover distillation and emit "
+                   help="Recover/pick/search: skip the LLM handover distillation and emit "
                         "the plain pointer prompt")
     p.add_argument("--refresh", action="store_true",
-                   help="Recover/pick: ignore a cached handover brief and re-distill")
+                   help="Recover/pick/search: ignore a cached handover brief and re-distill")
     p.add_argument("--model", default=DISTILL_MODEL_DEFAULT,
-                   help=f"Recover/pick: model for the distillation call "
+                   help=f"Recover/pick/search: model for the distillation call "
                         f"(default: {DISTILL_MODEL_DEFAULT})")
     p.add_argument("--budget", type=int, default=EXTRACT_BUDGET_DEFAULT,
-                   help=f"Recover/pick: char budget for the transcript extraction "
+                   help=f"Recover/pick/search: char budget for the transcript extraction "
                         f"fed to the distiller (default: {EXTRACT_BUDGET_DEFAULT})")
     p.add_argument("--limit", type=int, default=WIDGET_LIMIT_DEFAULT,
-                   help=f"Widget: cap to the N most-recently-active sessions "
+                   help=f"Widget: cap to the N most-recently-active sessions. "
+                        f"Search: show the N best hits. Stats: show the N top groups. "
+                        f"Timeline: list the N slowest calls and longest idle gaps "
                         f"(default: {WIDGET_LIMIT_DEFAULT})")
+    p.add_argument("--by", default="project", metavar="GROUPS",
+                   help="Stats: group by any of project, model, day — comma-separated "
+                        "for a cross-tab, e.g. project,model (default: project)")
+    p.add_argument("--sort", choices=sorted(STATS_SORTS), default="tokens",
+                   help="Stats: rank groups by this total (default: tokens)")
+    p.add_argument("--older-than", default=ARCHIVE_AGE_DEFAULT, metavar="AGE",
+                   help=f"Archive: transcripts not modified for AGE — 60d, 8w, 36h "
+                        f"(default: {ARCHIVE_AGE_DEFAULT})")
+    p.add_argument("--apply", action="store_true",
+                   help="Archive: compress for real (default: list what would be "
+                        "archived and exit). Dedupe: hardlink the exact duplicates "
+                        "(default: report only)")
+    p.add_argument("--restore", nargs="?", const="", default=None, metavar="ID",
+                   help="Archive: decompress session ID's transcript (or every "
+                        "archive, with --all) back to plain JSONL")
     p.add_argument("--include-stubs", action="store_true",
                    help="Widget: keep 0-turn, not-running sessions (dropped by default)")
     p.add_argument("--full-density", action="store_true",
@@ -2105,12 +5675,35 @@ def main():
                         f"spools or trips the Read cap (default: {WIDGET_BUDGET_KB_DEFAULT})")
     p.add_argument("--out", metavar="PATH",
                    help="Widget: also write the assembled HTML here "
-                        "(default: <temp>/claude/summon-widget.html)")
+                        "(default: <temp>/claude/summon-widget.html). Timeline: write "
+                        "the Chrome trace-event file here (default: "
+                        "<temp>/claude/summon-timeline-<id>.trace.json)")
+    p.add_argument("--socket", metavar="PATH",
+                   help="Serve: listen here instead of "
+                        "~/.claude/summon-cache/serve.sock (clients only look there)")
+    p.add_argument("--poll", action="store_true",
+                   help="Serve: poll instead of using inotify")
+    p.add_argument("--interval", type=float, default=SERVE_POLL_S_DEFAULT, metavar="S",
+                   help=f"Serve (polling): re-validate the session list at most every "
+                        f"S seconds (default: {SERVE_POLL_S_DEFAULT})")
+    return p
+
+
+def main():
+    p = build_parser()
     args = p.parse_args()
 
+    # A running `summon serve` answers the inventory modes from memory.
+    if args.mode == "widget" or (args.mode == "pick" and (args.json or args.ndjson)):
+        served = ask_server(sys.argv[1:])
+        if served is not None:
+            sys.exit(served)
+
     claude_dir = appdata_claude()
     if not claude_dir.is_dir():
         sys.exit(f"Claude dir not found: {claude_dir}")
+    if args.mode == "serve":
+        sys.exit(mode_serve(args, claude_dir, p))
 
     accounts = discover_accounts(claude_dir)
     if not accounts:
@@ -2124,10 +5717,20 @@ def main():
         sys.exit(mode_recover(args, accounts))
     if args.mode == "pick":
         sys.exit(mode_pick(args, accounts))
+    if args.mode == "search":
+        sys.exit(mode_search(args, accounts))
     if args.mode == "widget":
         sys.exit(mode_widget(args, accounts))
     if args.mode == "doctor":
         sys.exit(mode_doctor(args, accounts))
+    if args.mode == "stats":
+        sys.exit(mode_stats(args, accounts))
+    if args.mode == "timeline":
+        sys.exit(mode_timeline(args, accounts))
+    if args.mode == "archive":
+        sys.exit(mode_archive(args, accounts))
+    if args.mode == "dedupe":
+        sys.exit(mode_dedupe(args, accounts))
     if args.target:
         p.error("unexpected positional argument — transfer mode takes flags only")
 
@@ -2312,8 +5915,9 @@ def main():
     moved_files: list[Path] = []
     for i, s in enumerate(candidates):
         is_last = i == len(candidates) - 1
-        status = summon_session(s, dest_ws, move=args.move, dry_run=args.dry_run)
-        if status in success_states:
+        status = summon_session(s, dest_ws, move=args.move, dry_run=args.dry_run,
+                                link=args.link)
+        if status in success_states or status.startswith("copied ("):
             moved += 1
             color = "ok"
             target = dest_ws / s.path.name
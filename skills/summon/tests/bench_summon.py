@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""Benchmark harness for summon.py — hot-path timings over a synthetic store.
+
+test_summon.py checks behaviour; this checks speed. It generates a fake
+Claude Desktop store in a temp sandbox (HOME/USERPROFILE/APPDATA redirected,
+nothing real is read or written): N accounts, M wrappers spread over
+workspaces, one transcript per wrapper of a configurable size with realistic
+user/assistant turns, usage blocks, tool_use inputs and tool_result blobs.
+A slice of the sessions has a cwd that no longer exists (doctor findings)
+and a slice keeps its transcript under a munged dir that doesn't derive from
+the cwd (the scan fallback).
+
+Each scale times, in-process:
+  discover_accounts · load_sessions · session_rows(rich=True) · mode_doctor ·
+  extract_conversation (the largest transcripts) · _assemble_widget
+once cold (empty summon-cache) and then --repeat times warm (median).
+It also times start-up the way bin/summon launches it (a fresh interpreter
+importing the module): `summon --help` and `summon pick --json` wall time,
+plus a `python -X importtime` breakdown of the pick path (total and the
+heaviest top-level imports) — startup is what hooks and pickers feel.
+And it measures memory: the bytes the loaded session list keeps alive
+(tracemalloc, per session), next to what the parsed wrapper dicts alone
+would hold — --compare flags retained-bytes growth past --threshold too.
+
+The JSON report (schema claude-mods.summon.bench/v1) is meant to be kept and
+compared across commits:
+
+  python3 tests/bench_summon.py --out before.json
+  ... change summon.py ...
+  python3 tests/bench_summon.py --compare before.json --out after.json
+
+--compare prints per-op ratios and exits 1 when a warm timing regressed past
+--threshold (default 1.25x, ignoring ops under 5 ms).
+
+Scales: small (2 accounts x 60 wrappers x 32 KB), medium (3 x 400 x 128 KB),
+large (4 x 1500 x 256 KB) — or any ACCOUNTS:WRAPPERS:KB via --scale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+SCRIPT = HERE.parent / "scripts" / "summon.py"
+
+SCALES = {
+    "small": (2, 60, 32),
+    "medium": (3, 400, 128),
+    "large": (4, 1500, 256),
+}
+BROKEN_EVERY = 7        # every 7th session's cwd is gone (doctor finding)
+MISPLACED_EVERY = 11    # every 11th transcript lives under an unrelated dir
+EXTRACT_SAMPLE = 20     # extract_conversation over the N largest transcripts
+NOISE_FLOOR_MS = 5.0    # --compare ignores ops faster than this
+IMPORT_TOP = 10         # heaviest top-level imports kept in the report
+
+
+def _load_summon_module():
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("summon_under_bench", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod  # dataclass needs the module registered
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# ------------------------------------------------------------
+#  Synthetic store
+# ------------------------------------------------------------
+
+def _encode_cwd(cwd: str) -> str:
+    return cwd.replace(":", "-").replace("\\", "-").replace("/", "-").replace(".", "-")
+
+
+def _transcript(rng: random.Random, start_ms: int, target_bytes: int) -> str:
+    """User/assistant exchanges with usage blocks, tool calls and tool_result
+    blobs, roughly target_bytes long, one record per line — laid out the way
+    Claude Code writes them: compact separators, the envelope keys in its
+    order (assistant records lead with "message"), tool output echoed in a
+    trailing toolUseResult, and attachment / system records in between."""
+    lines: list[str] = []
+    size = 0
+    t = start_ms
+    ctx = 8_000
+    i = 0
+    parent = None
+
+    def envelope(kind: str, stamp: str, **body) -> dict:
+        """One record; "message" (assistant) and "attachment" precede "type",
+        toolUseResult follows the uuid/timestamp pair, the rest sit between."""
+        nonlocal parent
+        uid = f"{rng.getrandbits(128):032x}"
+        lead = {k: body.pop(k) for k in ("attachment",) if k in body}
+        if kind == "assistant":
+            lead["message"] = body.pop("message")
+        trail = {k: body.pop(k) for k in ("toolUseResult",) if k in body}
+        parent, prev = uid, parent
+        return {"parentUuid": prev, "isSidechain": False, **lead, "type": kind, **body,
+                "uuid": uid, "timestamp": stamp, **trail, "userType": "external",
+                "cwd": "/work/repo", "sessionId": "bench", "version": "2.1.0",
+                "gitBranch": "main"}
+
+    while size < target_bytes:
+        t += rng.randint(5, 240) * 1000
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t / 1000)) + f".{t % 1000:03d}Z"
+        ask = f"step {i}: " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 60)))
+        recs = [envelope("user", stamp, message={"role": "user", "content": ask})]
+        if i % 5 == 0:
+            recs.append(envelope("attachment", stamp, attachment={
+                "type": "edited_text_file", "filename": f"src/mod{i}.py",
+                "snippet": "\n".join(f"{j}: " + rng.choice(_WORDS) for j in range(40))}))
+        ctx += rng.randint(200, 4_000)
+        tool_id = f"toolu_{i:06d}"
+        recs.append(envelope("assistant", stamp, message={
+            "role": "assistant", "model": "claude-opus-4-1",
+            "content": [
+                {"type": "text", "text": " ".join(rng.choice(_WORDS)
+                                                  for _ in range(rng.randint(10, 120)))},
+                {"type": "tool_use", "id": tool_id, "name": rng.choice(_TOOLS),
+                 "input": {"command": "rg -n " + rng.choice(_WORDS) + " src/"}},
+            ],
+            "usage": {"input_tokens": rng.randint(1, 50), "output_tokens": rng.randint(20, 900),
+                      "cache_creation_input_tokens": rng.randint(0, 2_000),
+                      "cache_read_input_tokens": ctx}}))
+        output = "\n".join(f"src/mod{j}.py:{j * 7}: " + rng.choice(_WORDS)
+                           for j in range(rng.randint(5, 80)))
+        recs.append(envelope("user", stamp, message={"role": "user", "content": [
+            {"tool_use_id": tool_id, "type": "tool_result", "content": output}]},
+            toolUseResult={"stdout": output, "stderr": "", "interrupted": False}))
+        if i % 25 == 24:
+            recs.append(envelope("system", stamp, subtype="informational",
+                                 content="context checkpoint", level="info"))
+        for r in recs:
+            line = json.dumps(r, separators=(",", ":"))
+            lines.append(line)
+            size += len(line) + 1
+        i += 1
+    return "\n".join(lines) + "\n"
+
+
+_WORDS = ("index", "wrapper", "transcript", "budget", "widget", "refactor", "cache",
+          "session", "account", "bucket", "density", "latency", "checkpoint", "offset",
+          "parser", "rebind", "worktree", "summary", "handover", "doctor", "tokens")
+_TOOLS = ("Bash", "Read", "Edit", "Grep", "Write")
+
+
+def build_store(root: Path, accounts: int, wrappers: int, transcript_kb: int,
+                seed: int = 7) -> dict:
+    """Lay out a store under root/home; returns the env pointing at it."""
+    rng = random.Random(seed)
+    home = root / "home"
+    appdata = home / "AppData" / "Roaming"
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home), APPDATA=str(appdata))
+    env.pop("SUMMON_NO_CACHE", None)
+    if sys.platform == "win32":
+        cdir = appdata / "Claude"
+    elif sys.platform == "darwin":
+        cdir = home / "Library" / "Application Support" / "Claude"
+    else:
+        cdir = home / ".config" / "Claude"
+    projects = home / ".claude" / "projects"
+    now_ms = int(time.time() * 1000)
+    live_root = root / "work"
+
+    ws_dirs = []
+    for a in range(accounts):
+        acct = f"{a:08x}-0000-4000-8000-{a:012x}"
+        for w in range(3):
+            ws = cdir / "claude-code-sessions" / acct / f"{w:08x}-1111-4111-8111-{a:012x}"
+            ws.mkdir(parents=True)
+            ws_dirs.append(ws)
+
+    total = 0
+    for n in range(wrappers):
+        proj = f"proj{n % 25}"
+        cwd = live_root / proj
+        if n % 4 == 0:
+            cwd = cwd / ".claude" / "worktrees" / f"wt{n % 9}"
+        if n % BROKEN_EVERY:
+            cwd.mkdir(parents=True, exist_ok=True)
+        else:
+            cwd = root / "gone" / proj  # never created: a broken binding
+        cli = f"{n:08x}-aaaa-4aaa-8aaa-{n:012x}"
+        age_ms = rng.randint(0, 60 * 86_400_000)
+        (ws_dirs[n % len(ws_dirs)] / f"local_{n:08x}-bbbb-4bbb-8bbb-{n:012x}.json").write_text(
+            json.dumps({"sessionId": f"local_{n:08x}-bbbb-4bbb-8bbb-{n:012x}",
+                        "cliSessionId": cli, "title": f"session {n} " + rng.choice(_WORDS),
+                        "cwd": str(cwd), "lastActivityAt": now_ms - age_ms,
+                        "completedTurns": rng.randint(0, 80), "model": "claude-opus-4-1",
+                        "effort": "high", "branch": f"lane/{rng.choice(_WORDS)}",
+                        "createdAt": now_ms - age_ms - 3_600_000, "originCwd": str(live_root / proj),
+                        "worktreePath": str(cwd) if n % 4 == 0 else None,
+                        "permissionMode": "acceptEdits", "isArchived": n % 13 == 0}),
+            encoding="utf-8")
+        munged = ("X--unrelated-" + proj) if n % MISPLACED_EVERY == 0 else _encode_cwd(str(cwd))
+        tdir = projects / munged
+        tdir.mkdir(parents=True, exist_ok=True)
+        kb = max(1, int(transcript_kb * rng.uniform(0.25, 1.75)))
+        body = _transcript(rng, now_ms - age_ms - 3_600_000, kb * 1024)
+        (tdir / f"{cli}.jsonl").write_text(body, encoding="utf-8")
+        total += len(body)
+    # A settled store: summon distrusts directories modified in the last
+    # couple of seconds, which every freshly generated one would be.
+    settled = time.time() - 3600
+    for d in [*ws_dirs, *{ws.parent for ws in ws_dirs}]:
+        os.utime(d, (settled, settled))
+    return {"env": env, "home": home, "claude_dir": cdir, "store_bytes": total}
+
+
+# ------------------------------------------------------------
+#  Timing
+# ------------------------------------------------------------
+
+@contextlib.contextmanager
+def _sandbox(mod, env: dict):
+    saved = {k: os.environ.get(k) for k in ("HOME", "USERPROFILE", "APPDATA")}
+    os.environ.update({k: env[k] for k in saved})
+    try:
+        yield
+    finally:
+        _reset(mod)
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _reset(mod) -> None:
+    """Drop every per-process memo so the next call starts cold in-memory."""
+    if getattr(mod, "_INDEX_CONN", None):
+        mod._INDEX_CONN.close()
+    mod._INDEX_CONN = None
+    if hasattr(mod, "_TRANSCRIPT_DIRS"):
+        mod._TRANSCRIPT_DIRS = None
+
+
+def _timed(fn) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    out = fn()
+    return (time.perf_counter() - t0) * 1000, out
+
+
+def _retained(build) -> tuple[int, object]:
+    """Bytes still allocated (tracemalloc) after build() returns, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        out = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0], out
+    finally:
+        tracemalloc.stop()
+
+
+def bench_memory(mod, accts) -> dict:
+    """What a loaded inventory costs to keep: the Session list, against the
+    parsed wrapper dicts the same sessions would pin if they were kept."""
+    _reset(mod)
+    kept, sessions = _retained(lambda: [s for a in accts for s in mod.load_sessions(a)])
+    dicts, _ = _retained(lambda: [json.loads(s.path.read_text(encoding="utf-8"))
+                                  for s in sessions])
+    n = max(1, len(sessions))
+    return {"sessions": len(sessions), "retainedKB": round(kept / 1024, 1),
+            "bytesPerSession": round(kept / n), "wrapperDictsKB": round(dicts / 1024, 1),
+            "wrapperDictBytesPerSession": round(dicts / n)}
+
+
+def _launch_argv(argv: list[str], *flags: str) -> list[str]:
+    """The bin/summon launcher: import the module (bytecode cache applies)."""
+    return [sys.executable, *flags, "-c",
+            "import sys; sys.argv[0] = 'summon'; sys.path.insert(0, sys.argv.pop(1)); "
+            "from summon import main; main()", str(SCRIPT.parent), *argv]
+
+
+def parse_importtime(stderr: str) -> dict:
+    """`-X importtime` output -> total ms, the module's own share, and the
+    heaviest imports one level down (what summon itself pulls in)."""
+    roots, children = [], []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|", 2)
+        if not cum.strip().isdigit():
+            continue  # header row
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entry = (name.strip(), int(cum) / 1000)
+        if depth == 0:
+            roots.append(entry)
+        elif depth == 1:
+            children.append(entry)
+    children.sort(key=lambda t: -t[1])
+    return {"totalMs": round(sum(ms for _, ms in roots), 2),
+            "summonMs": round(sum(ms for n, ms in roots if n == "summon"), 2),
+            "top": [[n, round(ms, 2)] for n, ms in children[:IMPORT_TOP]]}
+
+
+def bench_startup(env: dict, repeat: int) -> tuple[dict, dict]:
+    """Fresh-process wall time for --help and pick --json (first run = cold
+    summon bytecode, the stdlib's already compiled), plus the import
+    breakdown of pick --json. Bytecode goes to a temp PYTHONPYCACHEPREFIX,
+    never into the source tree's __pycache__."""
+    import importlib.util
+    prefix = tempfile.mkdtemp(prefix="summon-bench-pycache-")
+    env = {**env, "SUMMON_NO_SERVE": "1", "PYTHONPYCACHEPREFIX": prefix}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    saved, sys.pycache_prefix = sys.pycache_prefix, prefix
+    try:
+        summon_pyc = Path(importlib.util.cache_from_source(str(SCRIPT))).parent
+    finally:
+        sys.pycache_prefix = saved
+    launches = (("startup_help", ["--help"]), ("startup_pick_json", ["pick", "--json"]))
+    ops = {}
+    try:
+        for _, argv in launches:  # compile the stdlib both paths import, once
+            subprocess.run(_launch_argv(argv), env=env, capture_output=True, timeout=120)
+        for op, argv in launches:
+            shutil.rmtree(summon_pyc, ignore_errors=True)  # each op starts cold
+            runs = []
+            for _ in range(repeat + 1):
+                ms, _ = _timed(lambda: subprocess.run(_launch_argv(argv), env=env,
+                                                      capture_output=True, timeout=120))
+                runs.append(ms)
+            ops[op] = {"coldMs": round(runs[0], 2),
+                       "warmMs": round(statistics.median(runs[1:]), 2),
+                       "runsMs": [round(x, 2) for x in runs]}
+        r = subprocess.run(_launch_argv(["pick", "--json"], "-X", "importtime"), env=env,
+                           capture_output=True, text=True, timeout=120)
+    finally:
+        shutil.rmtree(prefix, ignore_errors=True)
+    return ops, parse_importtime(r.stderr)
+
+
+def bench_scale(mod, name: str, accounts: int, wrappers: int, kb: int,
+                repeat: int, keep: Path | None) -> dict:
+    root = Path(tempfile.mkdtemp(prefix=f"summon-bench-{name}-", dir=keep))
+    try:
+        t0 = time.perf_counter()
+        store = build_store(root, accounts, wrappers, kb)
+        gen_s = time.perf_counter() - t0
+        runs: dict[str, list[float]] = {}
+        with _sandbox(mod, store["env"]):
+            cache = store["home"] / ".claude" / "summon-cache"
+            template = mod._asset_template().read_text(encoding="utf-8")
+            doctor_args = mod.build_parser().parse_args(["doctor", "--json"])
+            for rep in range(repeat + 1):  # rep 0 = cold
+                _reset(mod)
+                if rep == 0:
+                    shutil.rmtree(cache, ignore_errors=True)
+                now_ms = int(time.time() * 1000)
+                ms, accts = _timed(lambda: mod.discover_accounts(store["claude_dir"]))
+                runs.setdefault("discover_accounts", []).append(ms)
+                ms, _ = _timed(lambda: [mod.load_sessions(a) for a in accts])
+                runs.setdefault("load_sessions", []).append(ms)
+                cands = mod.query_sessions(accts, days=None)
+                ms, rows = _timed(lambda: mod.session_rows(cands, now_ms, rich=True, jobs=1))
+                runs.setdefault("session_rows_rich", []).append(ms)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    ms, _ = _timed(lambda: mod.mode_doctor(doctor_args, accts))
+                runs.setdefault("mode_doctor", []).append(ms)
+                paths = sorted((Path(r["transcriptPath"]) for r in rows if r["transcriptPath"]),
+                               key=lambda p: -p.stat().st_size)[:EXTRACT_SAMPLE]
+                ms, _ = _timed(lambda: [mod.extract_conversation(p) for p in paths])
+                runs.setdefault("extract_conversation", []).append(ms)
+                trimmed = [mod._trim_widget_row(r, full_density=False) for r in rows]
+                ms, _ = _timed(lambda: mod._assemble_widget(
+                    trimmed, 30, mod.WIDGET_LIMIT_DEFAULT,
+                    mod.WIDGET_BUDGET_KB_DEFAULT * 1024, template))
+                runs.setdefault("assemble_widget", []).append(ms)
+            memory = bench_memory(mod, accts)
+        startup, imports = bench_startup(store["env"], repeat)
+        ops = {}
+        for op, ms in runs.items():
+            warm = ms[1:] or ms
+            ops[op] = {"coldMs": round(ms[0], 2), "warmMs": round(statistics.median(warm), 2),
+                       "runsMs": [round(x, 2) for x in ms]}
+        ops.update(startup)
+        return {"name": name, "accounts": accounts, "wrappers": wrappers,
+                "transcriptKB": kb, "storeMB": round(store["store_bytes"] / 2**20, 1),
+                "generateS": round(gen_s, 2), "ops": ops, "imports": imports,
+                "memory": memory}
+    finally:
+        if keep is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def _git_rev() -> str:
+    try:
+        r = subprocess.run(["git", "-C", str(HERE), "rev-parse", "--short", "HEAD"],
+                           capture_output=True, text=True, timeout=10)
+        return r.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def compare(old: dict, new: dict, threshold: float) -> list[str]:
+    """Per-op warm ratios (and retained bytes per session), new/old; returns
+    the regressions past threshold."""
+    regressions = []
+    prev = {s["name"]: s for s in old.get("scales", [])}
+    for scale in new["scales"]:
+        base = prev.get(scale["name"])
+        if not base:
+            continue
+        for op, cur in scale["ops"].items():
+            was = base["ops"].get(op)
+            if not was:
+                continue
+            ratio = cur["warmMs"] / was["warmMs"] if was["warmMs"] else float("inf")
+            flag = ""
+            if ratio > threshold and max(cur["warmMs"], was["warmMs"]) >= NOISE_FLOOR_MS:
+                flag = "  REGRESSION"
+                regressions.append(f"{scale['name']}/{op}")
+            print(f"  {scale['name']:>8} {op:<22} {was['warmMs']:>10.2f} -> "
+                  f"{cur['warmMs']:>10.2f} ms  x{ratio:.2f}{flag}", file=sys.stderr)
+        was_b = base.get("memory", {}).get("bytesPerSession")
+        cur_b = scale.get("memory", {}).get("bytesPerSession")
+        if was_b and cur_b:
+            ratio = cur_b / was_b
+            flag = ""
+            if ratio > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{scale['name']}/memory")
+            print(f"  {scale['name']:>8} {'bytes/session':<22} {was_b:>10} -> "
+                  f"{cur_b:>10} B   x{ratio:.2f}{flag}", file=sys.stderr)
+    return regressions
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark summon.py hot paths on a synthetic store.")
+    p.add_argument("--scale", action="append", default=[],
+                   help="small|medium|large or ACCOUNTS:WRAPPERS:KB (repeatable; "
+                        "default: small,medium)")
+    p.add_argument("--repeat", type=int, default=3, help="warm runs per scale (default 3)")
+    p.add_argument("--out", help="write the JSON report here (default: stdout)")
+    p.add_argument("--compare", metavar="REPORT", help="baseline report to diff against")
+    p.add_argument("--threshold", type=float, default=1.25,
+                   help="warm-time ratio that counts as a regression (default 1.25)")
+    p.add_argument("--keep", metavar="DIR", help="generate stores under DIR and keep them")
+    args = p.parse_args()
+
+    mod = _load_summon_module()
+    keep = Path(args.keep) if args.keep else None
+    if keep:
+        keep.mkdir(parents=True, exist_ok=True)
+    scales = []
+    for spec in args.scale or ["small", "medium"]:
+        if spec in SCALES:
+            name, dims = spec, SCALES[spec]
+        else:
+            try:
+                dims = tuple(int(x) for x in spec.split(":"))
+                assert len(dims) == 3
+            except (ValueError, AssertionError):
+                p.error(f"bad --scale {spec!r}: want small|medium|large or A:W:KB")
+            name = spec
+        print(f"bench {name}: {dims[0]} account(s) x {dims[1]} wrapper(s) x ~{dims[2]} KB",
+              file=sys.stderr)
+        scales.append(bench_scale(mod, name, *dims, repeat=max(1, args.repeat), keep=keep))
+
+    report = {
+        "schema": "claude-mods.summon.bench/v1",
+        "meta": {"commit": _git_rev(), "python": platform.python_version(),
+                 "platform": sys.platform, "cpus": os.cpu_count(),
+                 "at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())},
+        "scales": scales,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(old, report, args.threshold)
+        if regressions:
+            print(f"regressed: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,10 +6,13 @@
 # read or written. Covers the selection/confirmation flow (--yes, --select,
 # piped stdin), the cp1252 UnicodeEncodeError regression, the toolbox modes
 # (rebind/recover/pick/doctor, incl. the worktree-repair hint), and the
-# distilled-handover flow (extraction skips tool blobs, cache hit/miss on
-# mtime, --no-distill, degrade paths via a PATH-shimmed fake `claude` —
+# distilled-handover flow (extraction skips tool blobs, content-hash cache
+# hit/miss, --no-distill, degrade paths via a PATH-shimmed fake `claude` —
 # no real LLM call is ever made by this suite), the pick --json inventory
-# envelope, and the in-chat picker asset (present + cited from SKILL.md).
+# envelope, the in-chat picker asset (present + cited from SKILL.md), and the
+# persistent session index (incremental re-read, parity with a direct read),
+# full-text search (ranked hits, append-only ingestion), batch distillation,
+# and the `summon serve` daemon (socket answers match in-process output).
 #
 # The behavioural checks live in test_summon.py — its pass/fail summary is the
 # primary signal. One shell-level check also runs after it (below): a
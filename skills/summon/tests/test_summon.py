@@ -34,9 +34,12 @@ Distilled handover (recover -> extract -> distill -> cache -> emit):
       tool_result blobs (fixture JSONL); respects the char budget with the
       verbatim tail winning
   18. recover distills via a PATH-shimmed fake `claude`, emits brief + pointer
-      clause, caches at <transcript>.handover.md
+      clause, caches under ~/.claude/summon-cache/handover/ (content-hash key)
+      with a mirror at <transcript>.handover.md
   19. cache hit: unchanged transcript reuses the cached brief (no re-distill);
-      --refresh forces re-distillation; a newer transcript mtime busts the cache
+      --refresh forces re-distillation; touching the transcript keeps the
+      cache, new conversation text busts it; an identical conversation under
+      another path/session reuses the brief; another --model misses
   20. degrade: `claude` absent from PATH -> plain pointer prompt, exit 0,
       stderr warning; failing `claude` (exit 1) -> same advisory fallback
 
@@ -58,17 +61,179 @@ Widget builder (summon widget -> finished card-picker HTML):
       keys, emits one session object per line, downsamples density 24->12
       (--full-density keeps 24), sets the window <select>, and holds the HTML
       under the byte budget (capping with a stderr note under a tight --max-kb)
+
+Session index (~/.claude/summon-cache/index.sqlite):
+  25. pick --json builds the index; an unchanged wrapper (same mtime + size) is
+      served from the index without a re-read; an edited wrapper is re-read; a
+      deleted wrapper drops out; SUMMON_NO_CACHE=1 yields the same inventory
+  26. analyze_transcript checkpoints: a re-run parses only the appended tail
+      (an in-place edit of the checkpointed prefix goes unseen), matches a
+      cold full scan after appends and with a half-written trailing line,
+      re-scans from zero on truncation or inode change, and replaces a stale
+      checkpoint even when the re-scan reads nothing (truncated to empty)
+  27. pick --json --rich --jobs N (process-pool rich pass, over the parallel
+      threshold) is byte-identical to the serial, uncached --jobs 1 output,
+      cold and warm
+
+Reverse tail reader:
+  28. iter_lines_reverse yields every line (offset + bytes) of a forward split,
+      newest first, across chunk sizes smaller than the lines; extraction
+      keeps head-then-tail order and the middle-elided marker over a 4 MB
+      tool_result blob; --peek shows the last six messages oldest-first
+
+Transcript location index:
+  29. resolve_transcript answers expected / scanned / missing from one sweep
+      of ~/.claude/projects; a warm run re-lists only dirs whose mtime moved
+      (a new transcript is found, an unchanged dir isn't re-scanned)
+
+Full-text search (summon search):
+  30. search --json ranks the sessions whose conversational text matches (tool
+      blobs are not indexed), a refresh ingests only the appended bytes, the
+      SUMMON_NO_CACHE=1 run agrees, and --select N --no-distill emits the
+      recovery prompt for the Nth hit; a transcript that leaves the tree
+      has its rows and checkpoint pruned on the next refresh; a query FTS5
+      can't parse raises ValueError (reported as such, exit 2), not "index
+      unavailable", and a NUL in the query separates words
+
+Batch distillation (summon recover --all):
+  31. recover --all --jobs 3 distills every transcript concurrently (three
+      1s shim calls finish well under 3s), counts a failing distillation,
+      and a re-run skips the still-valid caches without calling `claude`;
+      without --jobs the batch runs DISTILL_JOBS_DEFAULT (4) calls at once,
+      not one per core
+
+Hot inventory daemon (summon serve):
+  32. with `summon serve` listening (inotify, then --poll --interval 0),
+      pick --json --rich and widget answered over the socket are identical to
+      the in-process output, including after a transcript append, a new
+      wrapper, and a workspace + project dir created after start-up (and an
+      append inside it); the socket is created 0600; a request that raises
+      unexpectedly gets an rc 1 reply instead of killing the daemon; the
+      daemon counts the requests and removes its socket on exit
+
+Benchmark harness (tests/bench_summon.py):
+  33. a tiny-scale run emits a claude-mods.summon.bench/v1 report timing every
+      hot path cold + warm (start-up included, with its import breakdown),
+      records the session list's retained memory, and --compare against
+      itself finds no regression
+
+Timestamp + histogram fast paths (in-process):
+  34. the memoized fixed-layout _ts_ms agrees with datetime.fromisoformat on
+      fixture stamps and off-layout/invalid ones, and the bisect density
+      histogram matches the per-stamp float formula bucket for bucket
+
+Selective record decoding (in-process):
+  35. the byte-level type sniff reads a leading top-level "type" and refuses
+      one that follows a nested object; the member-by-member decode of big
+      lines returns the same fields as a full decode and rejects truncated
+      lines; analysis + extraction agree with and without orjson
+
+Link transfer (--link):
+  36. link_or_copy reports reflink / hardlink / copy and the method matches
+      the files on disk (a hardlink shares the inode, a reflink or copy
+      doesn't); transfer --link reflinks or copies the picked wrapper — never
+      a hardlink, so the two accounts' wrappers keep their own inodes — and
+      says how
+
+Bulk rebind (rebind --from-prefix/--to-prefix):
+  37. --dry-run touches nothing; the real run rewrites every wrapper under
+      the old root (not a same-prefix sibling dir), rebases originCwd /
+      worktreePath, backs them all up into one root, bridges each
+      transcript, and doctor then reports the store healthy; a root
+      --from-prefix (/, C:\\) is refused with exit 2 and touches nothing,
+      a wrapper whose rewrite fails gets no transcript bridge, and with
+      Windows path rules the index and the direct scan pick the same
+      sessions for a mixed-separator prefix (X:/Roam finds X:\\Roam\\pkg)
+
+Doctor scan (parallel, deduped cwd stats):
+  38. doctor --json stats each distinct cwd once (sessions sharing a cwd
+      cost one stat) and reports phase timings + stat counts in meta;
+      stat_paths gives up on a stalled path after the timeout (None, not
+      broken) without waiting for it, and keeps the other answers
+
+Usage rollup (summon stats):
+  39. stats sums input/output/cache tokens, tool calls and active time per
+      project root, model and UTC day (a streamed reply's repeated usage
+      counts once, idle gaps don't count, a day boundary splits the rollup);
+      a re-run analyzes nothing, an appended record re-analyzes one
+      transcript; a bad --by exits 2
+
+Cold transcript archive (summon archive):
+  40. without --apply nothing changes; --apply compresses only transcripts
+      older than --older-than (zstd or gzip), keeps their mtime, drops the
+      originals and writes a manifest; pick --rich metrics, search, --peek
+      and doctor read the archives transparently (a re-run reuses the cached
+      scan); --restore <id> brings back the byte-identical JSONL; recover
+      and rebind (single and --from-prefix) restore an archived transcript
+      before pointing at or bridging it, so the pointer and the bridged copy
+      are plain <id>.jsonl; a bad --older-than exits 2; a truncated
+      .jsonl.gz raises OSError naming it, so pick --rich, stats and search
+      carry on, --peek reports it and timeline exits 1 without a traceback
+
+Start-up budget (the bin/summon launch path):
+  41. `summon --help` and `summon pick --json` on an empty store finish under
+      the budget (best of three; SUMMON_STARTUP_BUDGET_MS overrides 1000 ms)
+      and never import dataclasses, uuid, tempfile, concurrent.futures,
+      subprocess or socket on the way
+
+Streaming inventory (pick --ndjson):
+  42. pick --ndjson --rich streams the same rows as pick --json --rich, one
+      compact ASCII line each, closed by a {"meta": ...} line carrying count
+      and schema; the rich scan hands back its first result after analyzing
+      only the first transcript; a reader that hangs up early (`| head -1`)
+      gets a clean exit, no traceback; closing a parallel scan early shuts
+      its pool down without waiting and cancels the queued transcripts
+
+Compact session records (in-process):
+  43. Session is slotted (no per-instance dict) and keeps the listing fields
+      only — a list of sessions pins a fraction of what their wrapper dicts
+      would; .data re-reads the wrapper from disk, so a rewrite keeps fields
+      summon doesn't model and sees edits made after load; an unreadable
+      wrapper is left untouched (no backup, False)
+
+Account discovery cache (in-process):
+  44. a warm discover_accounts answers from the cache (no wrapper listing,
+      no email hunt) and matches the cold result and SUMMON_NO_CACHE=1; a
+      new wrapper (its workspace dir's mtime moves) is counted on the next
+      run; an email that appears later is picked up without re-dating the
+      cached count (scanned_at unchanged); entries past
+      ACCOUNT_CACHE_MAX_AGE_S are re-derived
+
+Tool latency timeline (summon timeline):
+  45. timeline --json pairs every tool_use with its tool_result: per-tool
+      calls / errors / total / max are exact and p50 / p95 within 1% of the
+      exact nearest-rank values; the slowest --limit calls and the idle gaps
+      before human prompts match; unanswered calls and orphan results are
+      counted; the Chrome trace parses, holds one event per timed call and
+      gap, and no two calls overlap on a lane; in-flight state is capped
+      (TIMELINE_PENDING_MAX); no id exits 2, an unknown one exits 3, a
+      corrupt archived transcript exits 1 ("timeline failed") leaving no trace
+
+Duplicate transcript collapse (summon dedupe):
+  46. only copies sharing a <cli_id>.jsonl name are compared; an exact copy
+      is reported against the keeper (the inode already linked most) with
+      its reclaimable bytes, a copy another copy extends is reported as a
+      prefix pair, a copy modified inside DEDUPE_QUIET_S is skipped; without
+      --apply nothing changes; --apply backs the duplicate up and hardlinks
+      it to the keeper (bytes unchanged) — refusing, before any backup, a
+      keeper or duplicate edited since hashing even at the same size — and
+      reports the bytes as reclaimable
+      only once the backup is deleted, after which a re-run finds no exact
+      group; the chunked prefix digests match hashlib at every mark
 """
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
+import random
 import subprocess
 import sys
 import tempfile
 import time
 import shutil
+import tracemalloc
 from pathlib import Path
 
 HERE = Path(__file__).resolve().parent
@@ -512,15 +677,35 @@ def distill_tests() -> None:
         else:
             no("--refresh forces re-distillation", f"rc={rc} out-head={out[:200]!r}")
 
-        # 19c. newer transcript mtime busts the cache
+        # 19c. the cache is keyed by content: a touch keeps it, a copy of the
+        # same conversation elsewhere hits it, new text or a new model busts it
         brief_file.write_text("## Goal\nBRIEF-THREE\n", encoding="utf-8")
         newer = cache.stat().st_mtime + 10
         os.utime(transcript, (newer, newer))
-        rc, out, _ = run_mode(env_shim, ["recover", "bbbb-healthy"])
-        if rc == 0 and "BRIEF-THREE" in out:
-            ok("newer transcript mtime busts the cache")
+        _, touched, _ = run_mode(env_shim, ["recover", "bbbb-healthy"])
+        # cli-mismatch's transcript holds the identical one-turn conversation.
+        _, copy, _ = run_mode(env_shim, ["recover", "cccc-mismatch"])
+        _, other_model, _ = run_mode(env_shim, ["recover", "cccc-mismatch", "--model", "haiku"])
+        brief_file.write_text("## Goal\nBRIEF-FOUR\n", encoding="utf-8")
+        with transcript.open("a", encoding="utf-8") as fh:
+            fh.write('{"type":"assistant","message":{"content":"new text"}}\n')
+        rc, appended, _ = run_mode(env_shim, ["recover", "bbbb-healthy"])
+        checks = {
+            "touch-keeps": "BRIEF-TWO" in touched,
+            "copy-hits": "BRIEF-TWO" in copy,
+            "model-misses": "BRIEF-THREE" in other_model,
+            "append-busts": rc == 0 and "BRIEF-FOUR" in appended,
+            "shared-store": len(list((sb["home"] / ".claude" / "summon-cache"
+                                      / "handover").glob("*.md"))) == 3,
+        }
+        if all(checks.values()):
+            ok("content-hash cache: touch/copy hit, new text or model miss")
         else:
-            no("newer transcript mtime busts the cache", f"rc={rc} out-head={out[:200]!r}")
+            no("content-hash cache: touch/copy hit, new text or model miss",
+               f"failed={[k for k, v in checks.items() if not v]}")
+        mismatch = next(sb["projects"].glob("*/cli-mismatch.jsonl"))
+        with mismatch.open("a", encoding="utf-8") as fh:
+            fh.write('{"type":"user","message":{"content":"never distilled"}}\n')
 
         # 20a. degrade: claude absent from PATH -> pointer prompt, exit 0, warning
         emptybin = tmp / "emptybin"
@@ -813,10 +998,1532 @@ def widget_tests() -> None:
         else:
             no("widget honours --max-kb: caps to fit + notes the cap on stderr",
                f"rc={rc} n={len(arr) if arr else None} err-tail={err[-200:]!r}")
+
+        # F) the prefix-sum fit is tight: the kept rows fit, one more would not.
+        template = mod._asset_template().read_text(encoding="utf-8")
+        rows = [{"sessionId": f"s{i}", "title": "é" * (i * 37 % 300)} for i in range(60)]
+        tight = []
+        for budget in range(len(template.encode("utf-8")) + 200, 60_000, 997):
+            html, eff, _ = mod._assemble_widget(rows, 7, 60, budget, template)
+            over, _, _ = mod._assemble_widget(rows, 7, eff + 1, 10 ** 9, template)
+            tight.append(len(html.encode("utf-8")) <= budget
+                         and (eff == 60 or len(over.encode("utf-8")) > budget))
+        if all(tight):
+            ok("widget budget fit keeps the largest prefix that fits")
+        else:
+            no("widget budget fit keeps the largest prefix that fits",
+               f"{tight.count(False)} budget(s) mis-fitted")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def index_tests() -> None:
+    """25. The persistent session index: incremental re-read, parity with the
+    direct store read."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-index-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, ws = sb["env"], sb["ws"]
+        db = sb["home"] / ".claude" / "summon-cache" / "index.sqlite"
+
+        def inventory(e: dict) -> dict:
+            rc, out, _ = run_mode(e, ["pick", "--json", "--all"])
+            try:
+                return {r["sessionId"]: r["title"] for r in json.loads(out)["data"]}
+            except (json.JSONDecodeError, KeyError):
+                return {"rc": rc}
+
+        first = inventory(env)
+        no_cache = dict(env, SUMMON_NO_CACHE="1")
+        if db.is_file() and first == inventory(no_cache) and len(first) == 3:
+            ok("index built on first run; inventory matches SUMMON_NO_CACHE=1")
+        else:
+            no("index built on first run; inventory matches SUMMON_NO_CACHE=1",
+               f"db={db.is_file()} first={first}")
+
+        # Same-length edit with the original mtime restored: (mtime, size)
+        # unchanged, so the index must NOT re-read it — the old title survives.
+        wrapper_b = ws / "local_bbbb-healthy.json"
+        st = wrapper_b.stat()
+        raw = wrapper_b.read_text(encoding="utf-8")
+        wrapper_b.write_text(raw.replace("healthy session", "HEALTHY SESSION"),
+                             encoding="utf-8")
+        os.utime(wrapper_b, ns=(st.st_atime_ns, st.st_mtime_ns))
+        cached = inventory(env)
+        # Now a real edit (new mtime): re-read.
+        os.utime(wrapper_b, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        edited = inventory(env)
+        (ws / "local_cccc-mismatch.json").unlink()
+        pruned = inventory(env)
+        checks = {
+            "unchanged-not-reread": cached.get("local_bbbb-healthy") == "healthy session",
+            "changed-reread": edited.get("local_bbbb-healthy") == "HEALTHY SESSION",
+            "deleted-dropped": "local_cccc-mismatch" not in pruned and len(pruned) == 2,
+            "parity": pruned == inventory(no_cache),
+        }
+        if all(checks.values()):
+            ok("index re-reads only changed wrappers; deletions drop out")
+        else:
+            no("index re-reads only changed wrappers; deletions drop out",
+               f"failed={[k for k, v in checks.items() if not v]}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+class sandbox_home:
+    """Point Path.home() (and so summon's cache_root()) at a sandbox for
+    in-process calls, resetting the module's per-process index connection."""
+
+    def __init__(self, mod, home: Path):
+        self.mod, self.home, self.saved = mod, home, {}
+
+    def __enter__(self):
+        for k in ("HOME", "USERPROFILE"):
+            self.saved[k] = os.environ.get(k)
+            os.environ[k] = str(self.home)
+        self.mod._INDEX_CONN = None
+        self.mod._TRANSCRIPT_DIRS = None
+        return self
+
+    def __exit__(self, *exc):
+        if self.mod._INDEX_CONN:
+            self.mod._INDEX_CONN.close()
+        self.mod._INDEX_CONN = None
+        self.mod._TRANSCRIPT_DIRS = None
+        for k, v in self.saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _transcript_lines(start: int, n: int) -> str:
+    """n user/assistant exchanges with usage blocks, tool calls and stamps."""
+    out = []
+    for i in range(start, start + n):
+        out.append(json.dumps({
+            "type": "user", "timestamp": f"2026-07-01T{i // 60:02d}:{i % 60:02d}:00.250Z",
+            "message": {"content": f"ask number {i}"}}))
+        out.append(json.dumps({
+            "type": "assistant", "timestamp": f"2026-07-01T{i // 60:02d}:{i % 60:02d}:30Z",
+            "message": {"content": [{"type": "text", "text": f"answer {i}"},
+                                    {"type": "tool_use", "name": "Bash", "input": {}}],
+                        "usage": {"input_tokens": 1000 + i, "output_tokens": 10,
+                                  "cache_read_input_tokens": 5 * i}}}))
+    return "\n".join(out) + "\n"
+
+
+def analysis_cache_tests() -> None:
+    """26. Incremental analyze_transcript: byte-offset checkpoints."""
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-analysis-"))
+    try:
+        with sandbox_home(mod, tmp / "home"):
+            tr = tmp / "t.jsonl"
+            tr.write_text(_transcript_lines(0, 20), encoding="utf-8")
+
+            def cold() -> dict:
+                return mod._analyze(tr, 24, None)[0]
+
+            first = mod.analyze_transcript(tr)
+            cp = mod._load_checkpoint("analysis", tr)
+            checks = {"cold-parity": first == cold(),
+                      "checkpoint-at-eof": cp is not None and cp[2] == tr.stat().st_size}
+
+            # Same-length edit inside the checkpointed prefix, mtime kept: the
+            # resumed scan must not re-read it (firstAsk stays "ask number 0").
+            st = tr.stat()
+            raw = tr.read_bytes()
+            tr.write_bytes(raw.replace(b"ask number 0", b"ASK NUMBER 0", 1))
+            os.utime(tr, ns=(st.st_atime_ns, st.st_mtime_ns))
+            checks["prefix-not-reread"] = mod.analyze_transcript(tr)["firstAsk"] == "ask number 0"
+            tr.write_bytes(raw)
+
+            with tr.open("a", encoding="utf-8") as fh:
+                fh.write(_transcript_lines(20, 15))
+            checks["append-parity"] = mod.analyze_transcript(tr) == cold()
+
+            # Half-written trailing line: counted now, re-read once completed.
+            tail = _transcript_lines(35, 1)
+            with tr.open("a", encoding="utf-8") as fh:
+                fh.write(tail[:40])
+            checks["partial-parity"] = mod.analyze_transcript(tr) == cold()
+            checks["partial-not-checkpointed"] = (
+                mod._load_checkpoint("analysis", tr)[2] == tr.stat().st_size - 40)
+            with tr.open("a", encoding="utf-8") as fh:
+                fh.write(tail[40:])
+            checks["completed-parity"] = mod.analyze_transcript(tr) == cold()
+
+            # Truncation (a shorter rewrite) and replacement (new inode).
+            tr.write_text(_transcript_lines(100, 3), encoding="utf-8")
+            checks["truncate-rescan"] = mod.analyze_transcript(tr) == cold()
+            repl = tmp / "t.new"
+            repl.write_text(_transcript_lines(200, 3), encoding="utf-8")
+            os.replace(repl, tr)
+            got = mod.analyze_transcript(tr)
+            checks["inode-rescan"] = got == cold() and got["firstAsk"] == "ask number 200"
+
+            # Truncated to empty: the stale checkpoint is replaced, so the
+            # next run matches it instead of re-scanning every time.
+            cp = mod._load_checkpoint("analysis", tr)
+            tr.write_bytes(b"")
+            _, fresh = mod._analyze(tr, 24, cp)
+            checks["empty-recheckpointed"] = (fresh is not None and fresh[2] == 0
+                                              and mod._analyze(tr, 24, fresh)[1] is None)
+        if all(checks.values()):
+            ok("analyze_transcript resumes from byte-offset checkpoints; invalidates on truncate/replace")
+        else:
+            no("analyze_transcript resumes from byte-offset checkpoints; invalidates on truncate/replace",
+               f"failed={[k for k, v in checks.items() if not v]}")
     finally:
         shutil.rmtree(tmp, ignore_errors=True)
 
 
+def parallel_rich_tests() -> None:
+    """27. --jobs fans the rich pass out without changing a byte of output."""
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-jobs-"))
+    try:
+        sb = build_widget_sandbox(tmp)
+        env = sb["env"]
+        # Grow the transcripts past the pool threshold so --jobs really fans out.
+        enc_dir = sb["projects"] / encode_cwd(str(sb["proj"]))
+        per_file = mod.RICH_PARALLEL_MIN_BYTES // 3 + 1
+        for i, tr in enumerate(sorted(enc_dir.glob("*.jsonl"))):
+            chunk = _transcript_lines(i * 7, 40)
+            tr.write_text(chunk * (per_file // len(chunk) + 1), encoding="utf-8")
+
+        argv = ["pick", "--json", "--rich", "--all"]
+        rc1, serial, _ = run_mode(dict(env, SUMMON_NO_CACHE="1"), argv + ["--jobs", "1"])
+        rc2, cold, err = run_mode(env, argv + ["--jobs", "3"])
+        rc3, warm, _ = run_mode(env, argv + ["--jobs", "3"])
+        checks = {
+            "rc": rc1 == rc2 == rc3 == 0,
+            "has-rows": '"events"' in serial,
+            "cold-identical": cold == serial,
+            "warm-identical": warm == serial,
+            "no-fallback-warning": "analyzing serially" not in err,
+        }
+        if all(checks.values()):
+            ok("pick --json --rich --jobs 3 is byte-identical to the serial pass")
+        else:
+            no("pick --json --rich --jobs 3 is byte-identical to the serial pass",
+               f"failed={[k for k, v in checks.items() if not v]} err-tail={err[-200:]!r}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def reverse_reader_tests() -> None:
+    """28. Reverse-chunked reads agree with a forward read."""
+    import io
+    mod = _load_summon_module()
+    samples = [b"", b"\n", b"a", b"a\nbb\n", b"a\nbb\nccc", b"\n\nx\n\n",
+               b"\n".join(b"L%d-" % i + b"z" * (i * 37 % 300) for i in range(60))]
+    bad = []
+    for data in samples:
+        expect, off = [], 0
+        for line in data.split(b"\n"):
+            expect.append((off, line))
+            off += len(line) + 1
+        expect.reverse()
+        for chunk in (1, 3, 64, 1 << 16):
+            if list(mod.iter_lines_reverse(io.BytesIO(data), chunk)) != expect:
+                bad.append((data[:20], chunk))
+    if not bad:
+        ok("iter_lines_reverse matches a forward split, newest first")
+    else:
+        no("iter_lines_reverse matches a forward split, newest first", f"bad={bad[:3]}")
+
+    tmp = Path(tempfile.mkdtemp(prefix="summon-reverse-"))
+    try:
+        blob = {"type": "user", "message": {"content": [
+            {"type": "tool_result", "tool_use_id": "t1", "content": "B" * (4 << 20)}]}}
+        turns = [{"type": "user" if i % 2 == 0 else "assistant",
+                  "message": {"content": f"turn-{i} " + "x" * 400}} for i in range(60)]
+        tr = tmp / "long.jsonl"
+        tr.write_text("\n".join(json.dumps(r) for r in turns[:30] + [blob] + turns[30:])
+                      + "\n", encoding="utf-8")
+        out = mod.extract_conversation(tr, 12_000)
+        order = [out.find(f"turn-{i} ") for i in (0, 1, 59)]
+        checks = {
+            "budget": len(out) <= 12_000,
+            "head-first": -1 < order[0] < order[1] < order[2],
+            "elided": "middle of session elided" in out,
+            "tail-verbatim": all(f"turn-{i} " in out for i in range(45, 60)),
+            "no-blob": "BBBB" not in out,
+        }
+        if all(checks.values()):
+            ok("extraction walks the tail backwards, head forwards, in order")
+        else:
+            no("extraction walks the tail backwards, head forwards, in order",
+               f"failed={[k for k, v in checks.items() if not v]}")
+
+        sb = build_widget_sandbox(tmp)
+        enc_dir = sb["projects"] / encode_cwd(str(sb["proj"]))
+        (enc_dir / "cli-w0.jsonl").write_text(
+            "\n".join(json.dumps(r) for r in turns[:30] + [blob] + turns[30:]) + "\n",
+            encoding="utf-8")
+        rc, out, _ = run_mode(sb["env"], ["--peek", "local_w0"])
+        pos = [out.find(f"turn-{i}") for i in range(54, 60)]
+        if rc == 0 and -1 < pos[0] and pos == sorted(pos) and "turn-53" not in out:
+            ok("--peek shows the last six messages oldest-first")
+        else:
+            no("--peek shows the last six messages oldest-first",
+               f"rc={rc} pos={pos} out-tail={out[-300:]!r}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def transcript_location_tests() -> None:
+    """29. One-sweep transcript location index behind resolve_transcript."""
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-locate-"))
+    try:
+        home = tmp / "home"
+        projects = home / ".claude" / "projects"
+        cwd = str(tmp / "proj")
+        for d, ids in ((encode_cwd(cwd), ["cli-home"]), ("other-a", ["cli-moved", "cli-x"]),
+                       ("other-b", ["cli-moved"])):
+            (projects / d).mkdir(parents=True)
+            for cli in ids:
+                (projects / d / f"{cli}.jsonl").write_text("{}\n", encoding="utf-8")
+        (projects / "other-a" / "cli-x.jsonl.handover.md").write_text("x", encoding="utf-8")
+        old = time.time() - 3600
+        for d in projects.iterdir():
+            os.utime(d, (old, old))
+        acct = mod.Account(uuid=SRC_UUID, sessions_dir=tmp)
+
+        def resolve(cli: str):
+            s = mod.Session(path=tmp / "w.json", data={"cliSessionId": cli, "cwd": cwd},
+                            account=acct)
+            p, how = mod.resolve_transcript(s)
+            return (p.relative_to(projects).as_posix() if p else None), how
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path="."):
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        with sandbox_home(mod, home):
+            cold = [resolve(c) for c in ("cli-home", "cli-moved", "cli-gone")]
+            mod._TRANSCRIPT_DIRS = None
+            (projects / "other-b" / "cli-new.jsonl").write_text("{}\n", encoding="utf-8")
+            os.utime(projects / "other-b", (old + 60, old + 60))
+            mod.os.scandir = counting_scandir
+            try:
+                warm = resolve("cli-new")
+            finally:
+                mod.os.scandir = real_scandir
+        checks = {
+            "expected": cold[0] == (f"{encode_cwd(cwd)}/cli-home.jsonl", "expected"),
+            "scanned-first-dir": cold[1] == ("other-a/cli-moved.jsonl", "scanned"),
+            "missing": cold[2] == (None, ""),
+            "new-file-found": warm == ("other-b/cli-new.jsonl", "scanned"),
+            "only-changed-dir-relisted": sorted(listed) == ["other-b", "projects"],
+        }
+        if all(checks.values()):
+            ok("transcript location index: one sweep, only changed dirs re-listed")
+        else:
+            no("transcript location index: one sweep, only changed dirs re-listed",
+               f"failed={[k for k, v in checks.items() if not v]} listed={listed}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def search_tests() -> None:
+    """30. summon search: FTS index over transcript text -> recovery prompt."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-search-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, projects = sb["env"], sb["projects"]
+        healthy = next(projects.glob("*/cli-healthy.jsonl"))
+        mismatch = next(projects.glob("*/cli-mismatch.jsonl"))
+
+        def turn(role: str, content) -> str:
+            return json.dumps({"type": role, "message": {"content": content}}) + "\n"
+
+        with healthy.open("a", encoding="utf-8") as fh:
+            fh.write(turn("user", "why is the zeppelin-tokenizer cache cold?"))
+            fh.write(turn("assistant", [{"type": "text", "text": "the zeppelin-tokenizer "
+                                         "cache is rebuilt per run"}]))
+        with mismatch.open("a", encoding="utf-8") as fh:
+            fh.write(turn("assistant", "mentioned the zeppelin-tokenizer once"))
+            fh.write(turn("user", [{"type": "tool_result", "tool_use_id": "t",
+                                    "content": "quokka quokka quokka"}]))
+
+        def search(e: dict, query: str) -> tuple[int, dict]:
+            rc, out, _ = run_mode(e, ["search", query, "--json"])
+            try:
+                return rc, json.loads(out)
+            except json.JSONDecodeError:
+                return rc, {}
+
+        rc, first = search(env, "zeppelin-tokenizer")
+        ids = [r["sessionId"] for r in first.get("data", [])]
+        rc_blob, blob = search(env, "quokka")
+        extra = turn("user", "now about the narwhal migration")
+        with healthy.open("a", encoding="utf-8") as fh:
+            fh.write(extra)
+        _, appended = search(env, "narwhal")
+        _, uncached = search(dict(env, SUMMON_NO_CACHE="1"), "zeppelin-tokenizer")
+        rc_pick, prompt, _ = run_mode(env, ["search", "zeppelin-tokenizer",
+                                            "--select", "1", "--no-distill"])
+        checks = {
+            "rc": rc == 0 and rc_pick == 0,
+            "ranked": ids == ["local_bbbb-healthy", "local_cccc-mismatch"],
+            "hits": [r["hits"] for r in first["data"]] == [2, 1] if ids else False,
+            "snippet": "zeppelin-tokenizer" in (first["data"][0]["snippet"] if ids else ""),
+            "no-tool-blobs": blob.get("data") == [],
+            "append-only-ingest": appended.get("meta", {}).get("ingestedBytes") == len(extra)
+                                  and [r["sessionId"] for r in appended["data"]]
+                                  == ["local_bbbb-healthy"],
+            "no-cache-parity": [r["sessionId"] for r in uncached.get("data", [])] == ids,
+            "recover-prompt": "Transcript:" in prompt and str(healthy) in prompt,
+        }
+
+        # a transcript that leaves the tree takes its rows with it
+        import sqlite3
+        mismatch.unlink()
+        _, gone = search(env, "zeppelin-tokenizer")
+        _, again = search(env, "zeppelin-tokenizer")
+        db = sqlite3.connect(Path(env["HOME"]) / ".claude" / "summon-cache" / "index.sqlite")
+        try:
+            left = db.execute("SELECT count(*) FROM search_turns WHERE path = ?",
+                              (str(mismatch),)).fetchone()[0]
+            left += db.execute("SELECT count(*) FROM checkpoints WHERE path = ?",
+                               (str(mismatch),)).fetchone()[0]
+        finally:
+            db.close()
+        checks["prune"] = (gone.get("meta", {}).get("pruned") == 1
+                           and again.get("meta", {}).get("pruned") == 0 and left == 0
+                           and [r["sessionId"] for r in gone["data"]] == ["local_bbbb-healthy"])
+
+        # a query FTS5 can't parse is the query's fault, not the index's
+        mod = _load_summon_module()
+        mem = sqlite3.connect(":memory:")
+        if mod._search_table(mem):
+            mem.execute("INSERT INTO search_turns VALUES ('foo bar', 'p', 'user')")
+            checks["nul-query"] = set(mod.search_hits(mem, "foo\0bar", True)) == {"p"}
+            mod._fts_query = lambda q: '"unterminated'
+            try:
+                mod.search_hits(mem, "x", True)
+                checks["malformed"] = False
+            except ValueError as e:
+                checks["malformed"] = "malformed search query" in str(e)
+        if all(checks.values()):
+            ok("search ranks text hits, ingests appended bytes only, feeds recover")
+        else:
+            no("search ranks text hits, ingests appended bytes only, feeds recover",
+               f"failed={[k for k, v in checks.items() if not v]} first={first}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def batch_recover_tests() -> None:
+    """31. recover --all: bounded concurrent distillation + cache skips."""
+    if sys.platform == "win32":
+        ok("recover --all batch (POSIX shim; skipped on Windows)")
+        return
+    tmp = Path(tempfile.mkdtemp(prefix="summon-batch-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        shim = tmp / "shim"
+        shim.mkdir()
+        calls = tmp / "calls"
+        # Slow shim: 1s per call, fails for the "mismatch session" title.
+        (shim / "claude").write_text(
+            "#!/bin/sh\ninput=$(cat)\necho x >> \"%s\"\n"
+            "case \"$input\" in *'Title: mismatch session'*) exit 1;; esac\n"
+            "sleep 1\necho '## Goal'\necho BATCH-BRIEF\n" % calls, encoding="ascii")
+        (shim / "claude").chmod(0o755)
+        env = dict(sb["env"], PATH=str(shim) + os.pathsep + sb["env"].get("PATH", ""))
+        # Distinct conversations, so no two transcripts share a handover key.
+        for tr in sb["projects"].glob("*/*.jsonl"):
+            with tr.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps({"type": "user", "message": {"content": tr.stem}}) + "\n")
+
+        argv = ["recover", "--all", "--jobs", "3", "--json"]
+        rc1, out1, _ = run_mode(env, argv)
+        first = json.loads(out1) if rc1 == 0 else {}
+        caches = list(sb["projects"].glob("*/*.handover.md"))
+        calls_first = len(calls.read_text().split()) if calls.exists() else 0
+        rc2, out2, _ = run_mode(env, argv)
+        second = json.loads(out2) if rc2 == 0 else {}
+        calls_second = len(calls.read_text().split()) if calls.exists() else 0
+        m1, m2 = first.get("meta", {}), second.get("meta", {})
+        checks = {
+            "rc": rc1 == rc2 == 0,
+            "counts": (m1.get("distilled"), m1.get("failed"), m1.get("cached")) == (2, 1, 0)
+                      and m1.get("distillCalls") == 3,
+            "concurrent": m1.get("elapsedS", 99) < 2.5 and m1.get("jobs") == 3,
+            "caches-written": len(caches) == 2
+                              and all("BATCH-BRIEF" in c.read_text() for c in caches),
+            "rerun-skips-cached": (m2.get("cached"), m2.get("distilled")) == (2, 0),
+            "rerun-retries-failed-only": calls_second - calls_first == 1,
+        }
+        import argparse
+        mod = _load_summon_module()
+        checks["llm-default"] = (mod._jobs(argparse.Namespace(jobs=None),
+                                           mod.DISTILL_JOBS_DEFAULT) == 4
+                                 and mod._jobs(argparse.Namespace(jobs=9), 4) == 9
+                                 and mod._jobs(argparse.Namespace(jobs=None))
+                                 == (os.cpu_count() or 1))
+        if all(checks.values()):
+            ok("recover --all distills concurrently, counts failures, skips valid caches")
+        else:
+            no("recover --all distills concurrently, counts failures, skips valid caches",
+               f"failed={[k for k, v in checks.items() if not v]} meta={m1} rerun={m2}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def serve_tests() -> None:
+    """32. summon serve answers pick --json / widget from its hot inventory."""
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        ok("summon serve (needs AF_UNIX; skipped on this platform)")
+        return
+    tmp = Path(tempfile.mkdtemp(prefix="summon-serve-"))
+    try:
+        sb = build_widget_sandbox(tmp)
+        env = sb["env"]
+        local = dict(env, SUMMON_NO_SERVE="1")
+        sock = Path(env["HOME"]) / ".claude" / "summon-cache" / "serve.sock"
+        tr = sb["projects"] / encode_cwd(str(sb["proj"])) / "cli-w0.jsonl"
+        checks: dict[str, bool] = {}
+        for label, extra in (("inotify", []), ("poll", ["--poll", "--interval", "0"])):
+            daemon = subprocess.Popen([sys.executable, str(SCRIPT), "serve", *extra],
+                                      env=env, stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.PIPE, text=True)
+            try:
+                for _ in range(200):
+                    if sock.exists():
+                        break
+                    time.sleep(0.05)
+
+                def same(argv: list[str]) -> bool:
+                    rc1, served, _ = run_mode(env, argv)
+                    rc2, direct, _ = run_mode(local, argv)
+                    return rc1 == rc2 == 0 and served == direct
+
+                argv = ["pick", "--json", "--rich", "--all"]
+                checks[f"{label}-pick"] = same(argv)
+                with tr.open("a", encoding="utf-8") as fh:
+                    fh.write(_transcript_lines(len(label), 3))
+                time.sleep(0.2)
+                checks[f"{label}-append"] = same(argv)
+                w = json.loads((sb["ws"] / "local_w1.json").read_text(encoding="utf-8"))
+                w.update(sessionId=f"local_{label}", title=f"new {label} session",
+                         lastActivityAt=int(time.time() * 1000))
+                (sb["ws"] / f"local_{label}.json").write_text(json.dumps(w), encoding="utf-8")
+                time.sleep(0.2)
+                _, out, _ = run_mode(env, argv)
+                checks[f"{label}-new-wrapper"] = (f"new {label} session" in out
+                                                   and same(argv))
+                # a workspace and a project dir created after start-up are watched
+                later = tmp / f"later-{label}"
+                later.mkdir()
+                pdir = sb["projects"] / encode_cwd(str(later))
+                pdir.mkdir()
+                t2 = pdir / f"cli-later-{label}.jsonl"
+                t2.write_text(_transcript_lines(0, 3), encoding="utf-8")
+                ws2 = sb["ws"].parent / f"ws-later-{label}"
+                ws2.mkdir()
+                w.update(sessionId=f"local_later-{label}", cliSessionId=f"cli-later-{label}",
+                         cwd=str(later), title=f"later {label} session")
+                (ws2 / f"local_later-{label}.json").write_text(json.dumps(w), encoding="utf-8")
+                time.sleep(0.2)
+                checks[f"{label}-new-dirs"] = same(argv)
+                with t2.open("a", encoding="utf-8") as fh:
+                    fh.write(_transcript_lines(9, 4))
+                time.sleep(0.2)
+                _, out, _ = run_mode(env, argv)
+                checks[f"{label}-new-dirs-append"] = (f"later {label} session" in out
+                                                      and same(argv))
+                mode = sock.stat().st_mode & 0o777 if sock.exists() else None
+                checks[f"{label}-socket-private"] = mode == 0o600
+                checks[f"{label}-widget"] = same(["widget", "--out", str(tmp / "w.html")])
+            finally:
+                daemon.terminate()
+                _, err = daemon.communicate(timeout=10)
+            checks[f"{label}-served"] = "stopped after 8 request(s)" in err
+            checks[f"{label}-socket-removed"] = not sock.exists()
+        # a request that blows up in an unexpected way fails alone
+        mod = _load_summon_module()
+
+        class Broken:
+            def parse_args(self, argv):
+                raise RuntimeError("index went away")
+
+        a, b = socket.socketpair()
+        with a, b:
+            a.sendall(b'{"argv": ["pick", "--json"]}\n')
+            mod._serve_one(b, Broken(), None)
+            b.shutdown(socket.SHUT_WR)
+            reply = json.loads(a.makefile("rb").read())
+        checks["unexpected-error"] = (reply["rc"] == 1
+                                      and "RuntimeError: index went away" in reply["stderr"])
+        if all(checks.values()):
+            ok("summon serve answers pick --json/widget identically, stays fresh")
+        else:
+            no("summon serve answers pick --json/widget identically, stays fresh",
+               f"failed={[k for k, v in checks.items() if not v]}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_tests() -> None:
+    """33. The benchmark harness runs and reports (smoke, not a timing gate)."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-bench-smoke-"))
+    try:
+        bench = HERE / "bench_summon.py"
+        report = tmp / "r.json"
+        argv = [sys.executable, str(bench), "--scale", "1:6:4", "--repeat", "1"]
+        r1 = subprocess.run(argv + ["--out", str(report)], capture_output=True,
+                            text=True, timeout=300)
+        r2 = subprocess.run(argv + ["--out", str(tmp / "r2.json"), "--compare", str(report),
+                                    "--threshold", "1000"],
+                            capture_output=True, text=True, timeout=300)
+        try:
+            data = json.loads(report.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        ops = (data.get("scales") or [{}])[0].get("ops", {})
+        want = {"discover_accounts", "load_sessions", "session_rows_rich", "mode_doctor",
+                "extract_conversation", "assemble_widget",
+                "startup_help", "startup_pick_json"}
+        imports = (data.get("scales") or [{}])[0].get("imports", {})
+        checks = {
+            "rc": r1.returncode == 0 and r2.returncode == 0,
+            "schema": data.get("schema") == "claude-mods.summon.bench/v1",
+            "ops": want <= set(ops)
+                   and all(len(v["runsMs"]) == 2 for v in ops.values()),
+            "imports": imports.get("summonMs", 0) > 0 and bool(imports.get("top")),
+            "memory": 0 < (data.get("scales") or [{}])[0].get("memory", {})
+                      .get("bytesPerSession", 0),
+        }
+        if all(checks.values()):
+            ok("bench harness emits a comparable JSON report")
+        else:
+            no("bench harness emits a comparable JSON report",
+               f"failed={[k for k, v in checks.items() if not v]} err={r1.stderr[-300:]!r}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def timestamp_tests() -> None:
+    """34. _ts_ms fast path and _density_buckets against the reference math."""
+    import random
+    mod = _load_summon_module()
+    stamps = [json.loads(ln)["timestamp"]
+              for ln in _transcript_lines(0, 400).splitlines()]
+    stamps += [
+        "2026-07-01T00:00:00.999Z", "2026-07-01T00:00:01.000Z",   # second roll
+        "2026-07-01T00:59:59.999Z", "2026-12-31T23:59:59.001Z",   # minute/year roll
+        "1969-12-31T23:59:59.500Z", "2024-02-29T12:00:00.000Z",   # pre-epoch, leap day
+        "2026-07-01T00:00:00.123456Z", "2026-07-01T00:00:00+05:30",
+        "2026-07-01 00:00:00.250Z", "2026-07-01T00:00:00.12Z",
+        "2026-02-30T00:00:00.000Z", "2026-13-01T00:00:00.000Z",   # invalid dates
+        "2026-07-01T24:00:00.000Z", "2026-07-01T00:00:60.000Z",
+        "2026-07-01T0a:00:00.000Z", "２026-07-01T00:00:00.000Z", "", "garbage",
+    ]
+    ts_ok = [mod._ts_ms(v) == mod._ts_ms_slow(v) for v in stamps]
+
+    def reference(ms_list: list[int], buckets: int) -> list[int]:
+        lo, hi = min(ms_list), max(ms_list)
+        span, counts = hi - lo, [0] * buckets
+        for ms in ms_list:
+            counts[0 if span <= 0 else min(buckets - 1, int((ms - lo) / span * buckets))] += 1
+        return counts
+
+    rng = random.Random(12)
+    samples = [[ms for ms in map(mod._ts_ms, stamps) if ms]]
+    for _ in range(300):
+        base, spread = rng.randint(0, 2 ** 41), rng.choice([0, 1, 23, 24, 25, 10 ** 4, 10 ** 9])
+        samples.append([base + rng.randint(0, spread) for _ in range(rng.randint(1, 80))])
+    hist_ok = [mod._density_buckets(xs, min(xs), max(xs) - min(xs), b) == reference(xs, b)
+               for xs in samples for b in (1, 12, 24)]
+    if all(ts_ok) and all(hist_ok):
+        ok("fast timestamp parse + bisect histogram match the reference output")
+    else:
+        no("fast timestamp parse + bisect histogram match the reference output",
+           f"ts-mismatch={[v for v, good in zip(stamps, ts_ok) if not good][:5]} "
+           f"hist-mismatch={hist_ok.count(False)}")
+
+
+def record_decode_tests() -> None:
+    """35. _record_type / _record_fields against full json.loads."""
+    mod = _load_summon_module()
+    blob = "line of tool output with \"quotes\" and {braces}\n" * 2000  # > 32 KB
+    user = {"parentUuid": None, "type": "user",
+            "message": {"role": "user", "content": [
+                {"tool_use_id": "t1", "type": "tool_result", "content": blob}]},
+            "uuid": "u1", "timestamp": "2026-07-01T00:00:00.000Z",
+            "toolUseResult": {"stdout": blob}}
+    assistant = {"parentUuid": "u1", "message": {"content": [{"type": "text", "text": "hi"}]},
+                 "type": "assistant", "timestamp": "2026-07-01T00:00:01.000Z"}
+    attachment = {"attachment": {"type": "environment"}, "type": "attachment"}
+    compact = lambda rec: json.dumps(rec, separators=(",", ":")).encode("utf-8")
+    checks = {
+        "sniff-leading": mod._record_type(compact(user)) == "user",
+        "sniff-spaced": mod._record_type(json.dumps(user).encode("utf-8")) == "user",
+        "sniff-after-nested": mod._record_type(compact(assistant)) is None,
+        "sniff-nested-first": mod._record_type(compact(attachment)) is None,
+        "sniff-escaped": mod._record_type(b'{"type":"us\\u0065r"}') is None,
+        "sniff-not-object": mod._record_type(b'[{"type":"user"}]') is None,
+    }
+    mod._ORJSON[:] = [None]  # stdlib member-by-member path
+    raw = compact(user) + b"\n"
+    want = ("type", "message", "timestamp")
+    checks["fields-parity"] = mod._record_fields(raw, want) == {k: user[k] for k in want}
+    checks["fields-missing"] = mod._record_fields(raw, ("type", "nope")) == {"type": "user"}
+    checks["fields-truncated"] = mod._record_fields(raw[:len(raw) // 2], want) == {}
+    checks["fields-trailing-junk"] = mod._record_fields(raw.rstrip() + b"}", ("nope",)) == {}
+
+    tmp = Path(tempfile.mkdtemp(prefix="summon-records-"))
+    try:
+        tr = tmp / "t.jsonl"
+        extra = [compact(user).decode(), compact(assistant).decode(), compact(attachment).decode(),
+                 '{"type":"last-prompt","lastPrompt":"x"}', "[1, 2]", "{not json"]
+        tr.write_text(_transcript_lines(0, 40) + "\n".join(extra) + "\n", encoding="utf-8")
+        stdlib = (mod._analyze(tr, 24, None)[0], mod.extract_conversation(tr))
+        mod._ORJSON[:] = []  # re-resolve: orjson when installed
+        fast = (mod._analyze(tr, 24, None)[0], mod.extract_conversation(tr))
+        checks["consumer-parity"] = stdlib == fast and stdlib[0]["events"] == 86
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok("selective record decoding matches full json.loads")
+    else:
+        no("selective record decoding matches full json.loads",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
+def link_tests() -> None:
+    """36. --link: reflink -> hardlink -> copy, and transfer reports it."""
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-link-"))
+    try:
+        src = tmp / "src.jsonl"
+        src.write_bytes(b'{"type":"user"}\n' * 5000)
+        linked, copied = tmp / "linked.jsonl", tmp / "copied.jsonl"
+        how = mod.link_or_copy(src, linked, link=True)
+        plain = mod.link_or_copy(src, copied, link=False)
+        same_inode = os.stat(src).st_ino == os.stat(linked).st_ino
+        checks = {
+            "method": how in ("reflink", "hardlink", "copy") and plain == "copy",
+            "content": linked.read_bytes() == src.read_bytes() == copied.read_bytes(),
+            "inode-matches-method": same_inode == (how == "hardlink"),
+            "copy-independent": os.stat(src).st_ino != os.stat(copied).st_ino,
+        }
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    tmp, env, src_ws, dest_ws = with_sandbox()
+    try:
+        rc, out = run_summon(env, ["--select", "1", "--yes", "--link"])
+        target = dest_ws / "local_src-sess-0.json"
+        used = next((h for h in ("reflink", "hardlink") if f"copied ({h})" in out),
+                    "copy" if "copied" in out else None)
+        checks["transfer"] = rc == 0 and copied_titles(dest_ws) == {"alpha"} \
+            and used in ("reflink", "copy")
+        checks["wrapper-own-inode"] = (os.stat(target).st_ino
+                                       != os.stat(src_ws / "local_src-sess-0.json").st_ino)
+        nowrap = tmp / "nohard.json"
+        checks["no-hardlink-fallback"] = (
+            mod.link_or_copy(target, nowrap, link=True, hardlink=False) in ("reflink", "copy")
+            and os.stat(nowrap).st_ino != os.stat(target).st_ino)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok(f"--link clones/links/copies and reports the method (here: {how})")
+    else:
+        no("--link clones/links/copies and reports the method",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
+def bulk_rebind_tests() -> None:
+    """37. rebind --from-prefix OLD --to-prefix NEW over a moved tree."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-bulk-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, ws, projects = sb["env"], sb["ws"], sb["projects"]
+        old_root, new_root = sb["old_root"], sb["new_root"]
+        (new_root / "pkg").mkdir()
+        sibling = tmp / "proj-old-sibling"  # shares the string prefix, not the dir
+        sibling.mkdir()
+        for sid, cwd in (("dddd-pkg", old_root / "pkg"), ("eeee-sib", sibling)):
+            (ws / f"local_{sid}.json").write_text(json.dumps({
+                "sessionId": f"local_{sid}", "cliSessionId": f"cli-{sid}",
+                "title": sid, "cwd": str(cwd), "completedTurns": 2,
+                "lastActivityAt": int(time.time() * 1000)}), encoding="utf-8")
+            d = projects / encode_cwd(str(cwd))
+            d.mkdir(parents=True, exist_ok=True)
+            (d / f"cli-{sid}.jsonl").write_text('{"type":"user"}\n', encoding="utf-8")
+
+        def wrapper(sid: str) -> dict:
+            return json.loads((ws / f"local_{sid}.json").read_text(encoding="utf-8"))
+
+        argv = ["rebind", "--from-prefix", str(old_root), "--to-prefix", str(new_root)]
+        before = {f.name: f.read_bytes() for f in ws.glob("*.json")}
+        rc_dry, out_dry, _ = run_mode(env, argv + ["--dry-run"])
+        checks = {"dry-run": rc_dry == 0 and "would rebind" in out_dry
+                  and before == {f.name: f.read_bytes() for f in ws.glob("*.json")}}
+
+        rc, out, err = run_mode(env, argv + ["--jobs", "2"])
+        moved, pkg, sib = wrapper("aaaa-moved"), wrapper("dddd-pkg"), wrapper("eeee-sib")
+        new_wt = new_root / ".claude" / "worktrees" / "wt1"
+        backups = list((sb["home"] / ".claude" / "summon-backups").glob("*/*.json"))
+        checks.update({
+            "rc": rc == 0,
+            "rewritten": moved["cwd"] == str(new_wt) and pkg["cwd"] == str(new_root / "pkg"),
+            "rebased": moved.get("originCwd") == str(new_root)
+                       and moved.get("worktreePath") == str(new_wt),
+            "sibling-untouched": sib["cwd"] == str(sibling),
+            "one-backup-root": len(backups) == 2 and len({b.parent for b in backups}) == 1,
+            "bridged": all((projects / encode_cwd(c) / f"{cli}.jsonl").exists()
+                           for c, cli in ((str(new_wt), "cli-moved"),
+                                          (str(new_root / "pkg"), "cli-dddd-pkg"))),
+            "reported": "2 copied" in out,
+        })
+        rc_doc, _, _ = run_mode(env, ["doctor", "--json"])
+        checks["doctor-healthy"] = rc_doc == 0
+
+        # a root prefix is everything's prefix: refused, nothing touched
+        before = {f.name: f.read_bytes() for f in ws.glob("*.json")}
+        rc_root, _, err_root = run_mode(env, ["rebind", "--from-prefix", "/",
+                                              "--to-prefix", str(new_root)])
+        mod = _load_summon_module()
+        checks["root-refused"] = (rc_root == 2 and "filesystem root" in err_root
+                                  and before == {f.name: f.read_bytes() for f in ws.glob("*.json")}
+                                  and not mod._under_prefix("/a/b", "/")
+                                  and not mod._under_prefix("C:\\x", "C:\\")
+                                  and not mod._under_prefix("/a", ""))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    # a wrapper whose rewrite fails gets no transcript bridge
+    import contextlib
+    import io
+    tmp = Path(tempfile.mkdtemp(prefix="summon-bulk-fail-"))
+    keys = ("HOME", "USERPROFILE", "APPDATA", "SUMMON_NO_CACHE")
+    saved = {k: os.environ.get(k) for k in keys}
+    mod = _load_summon_module()
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        os.environ.update({k: sb["env"][k] for k in keys[:3]}, SUMMON_NO_CACHE="1")
+        old_root, new_root = sb["old_root"], sb["new_root"]
+        (new_root / "pkg").mkdir()
+        (sb["ws"] / "local_dddd-pkg.json").write_text(json.dumps({
+            "sessionId": "local_dddd-pkg", "cliSessionId": "cli-dddd-pkg", "title": "pkg",
+            "cwd": str(old_root / "pkg"), "completedTurns": 2,
+            "lastActivityAt": int(time.time() * 1000)}), encoding="utf-8")
+        d = sb["projects"] / encode_cwd(str(old_root / "pkg"))
+        d.mkdir(parents=True)
+        (d / "cli-dddd-pkg.jsonl").write_text('{"type":"user"}\n', encoding="utf-8")
+        real = mod._rewrite_wrapper
+        mod._rewrite_wrapper = lambda s, *a: s.cli_id != "cli-dddd-pkg" and real(s, *a)
+        args = mod.build_parser().parse_args(
+            ["rebind", "--from-prefix", str(old_root), "--to-prefix", str(new_root)])
+        with contextlib.redirect_stdout(io.StringIO()) as buf:
+            rc = mod.mode_rebind_prefix(args, mod.discover_accounts(claude_dir(sb["env"])))
+        new_wt = new_root / ".claude" / "worktrees" / "wt1"
+        checks["failed-rewrite-no-bridge"] = (
+            rc == 1 and "1 skipped (rewrite failed)" in buf.getvalue()
+            and not (sb["projects"] / encode_cwd(str(new_root / "pkg"))).exists()
+            and (sb["projects"] / encode_cwd(str(new_wt)) / "cli-moved.jsonl").exists())
+
+        # Windows paths take either separator: the index pre-filter and the
+        # direct scan must pick the same sessions for a mixed-separator prefix
+        import ntpath
+        for cli, cwd in (("cli-win-back", "X:\\Roam\\pkg"), ("cli-win-fwd", "X:/Roam/lib"),
+                         ("cli-win-sib", "X:\\Roam2\\pkg")):
+            (sb["ws"] / f"local_{cli}.json").write_text(json.dumps({
+                "sessionId": f"local_{cli}", "cliSessionId": cli, "title": cli, "cwd": cwd,
+                "lastActivityAt": int(time.time() * 1000)}), encoding="utf-8")
+        real_normcase = os.path.normcase
+        os.path.normcase = ntpath.normcase
+        try:
+            os.environ.pop("SUMMON_NO_CACHE")
+            picked = {}
+            for how, conn in (("index", None), ("direct", False)):
+                if mod._INDEX_CONN:
+                    mod._INDEX_CONN.close()
+                mod._INDEX_CONN = conn
+                accts = mod.discover_accounts(claude_dir(sb["env"]))
+                picked[how] = {prefix: sorted(s.cli_id for s in mod.sessions_under_prefix(
+                    prefix, accts) if s.cli_id.startswith("cli-win")) for prefix in
+                    ("X:/Roam", "x:\\roam\\")}
+        finally:
+            os.path.normcase = real_normcase
+        want = sorted(["cli-win-back", "cli-win-fwd"])
+        checks["mixed-separators"] = (picked["index"] == picked["direct"]
+                                      and all(v == want for v in picked["index"].values()))
+    finally:
+        if mod._INDEX_CONN:
+            mod._INDEX_CONN.close()
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok("rebind --from-prefix rebinds a moved tree in one pass")
+    else:
+        no("rebind --from-prefix rebinds a moved tree in one pass",
+           f"failed={[k for k, v in checks.items() if not v]} "
+           f"out-tail={out[-300:]!r} err-tail={err[-200:]!r}")
+
+
+def doctor_scan_tests() -> None:
+    """38. doctor: deduped cwd stats on a pool, per-path timeout, phase timings."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-doctor-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, ws = sb["env"], sb["ws"]
+        for i in range(4):  # four sessions, one shared cwd
+            (ws / f"local_shared-{i}.json").write_text(json.dumps({
+                "sessionId": f"local_shared-{i}", "cliSessionId": f"cli-shared-{i}",
+                "title": f"shared {i}", "cwd": str(sb["new_root"]), "completedTurns": 1,
+                "lastActivityAt": int(time.time() * 1000)}), encoding="utf-8")
+        rc, out, _ = run_mode(env, ["doctor", "--json", "--jobs", "3"])
+        meta = json.loads(out)["meta"]
+        stats, timings = meta.get("stats", {}), meta.get("timingsMs", {})
+        checks = {
+            "rc": rc == 10 and meta["count"] >= 1,
+            "deduped": 0 < stats.get("cwdDistinct", 0) <= meta["checked"] - 3,
+            "no-timeouts": stats.get("cwdTimedOut") == 0 and meta.get("cwdUnreachable") == [],
+            "wrappers": stats.get("wrappers") == meta["checked"] + meta["remoteSkipped"],
+            "timings": set(timings) == {"inventory", "cwd", "transcripts", "total"}
+                       and timings["total"] >= timings["cwd"] >= 0,
+            "dir-stats": stats.get("transcriptDirs", 0) >= 1,
+        }
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    mod = _load_summon_module()
+
+    def check(path: str) -> bool:
+        if path == "/stalled":
+            time.sleep(3)
+        return path == "/here"
+
+    t0 = time.monotonic()
+    got = mod.stat_paths(["/here", "/gone", "/stalled", "/here"], jobs=2, timeout=0.3,
+                         check=check)
+    checks["timeout"] = (got == {"/here": True, "/gone": False, "/stalled": None}
+                         and time.monotonic() - t0 < 2)
+    if all(checks.values()):
+        ok("doctor stats each distinct cwd once, times out stalled paths, reports timings")
+    else:
+        no("doctor stats each distinct cwd once, times out stalled paths, reports timings",
+           f"failed={[k for k, v in checks.items() if not v]} meta={meta!r}")
+
+
+def stats_tests() -> None:
+    """39. summon stats: per-project/model/day usage rollup, incremental."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-stats-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, projects = sb["env"], sb["projects"]
+        good = tmp / "proj-good"
+
+        def rec(ts, typ, mid="", model="", usage=None, tools=0):
+            msg = {"role": typ, "content": [{"type": "tool_use", "name": "Bash"}] * tools}
+            if typ == "assistant":
+                msg.update(id=mid, model=model, usage=dict(zip(
+                    ("input_tokens", "output_tokens", "cache_creation_input_tokens",
+                     "cache_read_input_tokens"), usage)))
+            return json.dumps({"type": typ, "timestamp": ts, "message": msg}) + "\n"
+
+        healthy = projects / encode_cwd(str(good)) / "cli-healthy.jsonl"
+        healthy.write_text("".join([
+            rec("2026-01-01T23:59:00.000Z", "user"),
+            rec("2026-01-01T23:59:10.000Z", "assistant", "m1", "model-a", (100, 10, 1000, 5000), 1),
+            rec("2026-01-01T23:59:12.000Z", "assistant", "m1", "model-a", (100, 50, 1000, 5000), 1),
+            rec("2026-01-01T23:59:20.000Z", "user"),
+            rec("2026-01-02T00:00:10.000Z", "assistant", "m2", "model-b", (7, 3, 0, 200)),
+            rec("2026-01-02T02:00:10.000Z", "user"),                     # 2h idle
+            rec("2026-01-02T02:01:10.000Z", "assistant", "m3", "model-b", (1, 1, 0, 0)),
+        ]), encoding="utf-8")
+        moved = projects / encode_cwd(str(sb["old_wt"])) / "cli-moved.jsonl"
+        moved.write_text("".join([
+            rec("2026-01-01T10:00:00.000Z", "user"),
+            rec("2026-01-01T10:00:05.000Z", "assistant", "x1", "model-a", (90000, 10, 0, 0), 3),
+        ]), encoding="utf-8")
+
+        def stats(*extra):
+            rc, out, err = run_mode(env, ["stats", "--all", "--json", *extra])
+            return rc, (json.loads(out) if rc == 0 else {"data": [], "meta": {}}), err
+
+        rc, env_md, _ = stats("--by", "model,day", "--sort", "output")
+        got = {(g["model"], g["day"]): g for g in env_md["data"]}
+        a, b = got.get(("model-a", "2026-01-01"), {}), got.get(("model-b", "2026-01-02"), {})
+        checks = {
+            "rc": rc == 0 and env_md["meta"].get("schema") == "claude-mods.summon.stats/v1",
+            "groups": set(got) == {("model-a", "2026-01-01"), ("model-b", "2026-01-02")},
+            "dedupe": (a.get("inputTokens"), a.get("outputTokens"), a.get("cacheWriteTokens"),
+                       a.get("cacheReadTokens")) == (90100, 60, 1000, 5000),
+            "tools": a.get("toolCalls") == 5 and b.get("toolCalls") == 0,
+            "active": b.get("activeMin") == round(110 / 60, 1)
+                      and a.get("activeMin") == round(25 / 60, 1),
+            "sessions": a.get("sessions") == 2 and b.get("sessions") == 1,
+            "sorted": [g["outputTokens"] for g in env_md["data"]] == [60, 4],
+            "first-run-analyzed": env_md["meta"].get("analyzed") == 3,
+        }
+        rc, env_pr, _ = stats()
+        by_project = {g["project"]: g["totalTokens"] for g in env_pr["data"]}
+        checks["project"] = (by_project == {str(sb["old_root"]): 90010,
+                                            str(good): 6150 + 212}
+                             and list(by_project)[0] == str(sb["old_root"]))
+        checks["rerun-cached"] = env_pr["meta"].get("analyzed") == 0
+        with healthy.open("a", encoding="utf-8") as fh:
+            fh.write(rec("2026-01-02T02:01:30.000Z", "assistant", "m4", "model-b", (5, 5, 0, 0)))
+        rc, env_ap, _ = stats()
+        by_project = {g["project"]: g["totalTokens"] for g in env_ap["data"]}
+        checks["append"] = (env_ap["meta"].get("analyzed") == 1
+                            and by_project.get(str(good)) == 6150 + 212 + 10)
+        rc_bad, _, _ = run_mode(env, ["stats", "--by", "repo"])
+        checks["bad-by"] = rc_bad == 2
+        rc_tty, out_tty, _ = run_mode(env, ["stats", "--all", "--by", "model"])
+        checks["tty"] = rc_tty == 0 and "model-a" in out_tty and "tools" in out_tty
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok("stats rolls tokens/tools/active time up per project, model and day, incrementally")
+    else:
+        no("stats rolls tokens/tools/active time up per project, model and day, incrementally",
+           f"failed={[k for k, v in checks.items() if not v]} data={env_md['data']!r}")
+
+
+def archive_tests() -> None:
+    """40. summon archive: compress cold transcripts, read them transparently."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-archive-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, projects = sb["env"], sb["projects"]
+        healthy = next(projects.glob("*/cli-healthy.jsonl"))
+        mismatch = next(projects.glob("*/cli-mismatch.jsonl"))
+        moved = next(projects.glob("*/cli-moved.jsonl"))
+        with healthy.open("a", encoding="utf-8") as fh:
+            for i in range(40):
+                fh.write(json.dumps({"type": "assistant", "message": {"content": [
+                    {"type": "text", "text": f"step {i} of the quasar-lattice migration"}]}})
+                         + "\n")
+        original = healthy.read_bytes()
+        old = time.time() - 90 * 86400
+        for p in (healthy, mismatch):
+            os.utime(p, (old, old))
+        old_ns = healthy.stat().st_mtime_ns
+
+        def rich() -> dict:
+            rc, out, _ = run_mode(env, ["pick", "--json", "--rich", "--all"])
+            return {r["cliSessionId"]: r for r in json.loads(out)["data"]} if rc == 0 else {}
+
+        before = rich()
+        rc_dry, out_dry, _ = run_mode(env, ["archive", "--older-than", "60d"])
+        checks = {"dry-run": rc_dry == 0 and "would archive 2" in out_dry
+                  and healthy.exists() and mismatch.exists()}
+
+        rc, out, _ = run_mode(env, ["archive", "--older-than", "60d", "--apply", "--json"])
+        meta = json.loads(out)["meta"] if rc == 0 else {}
+        archived = [p for p in projects.glob("*/*") if p.name.endswith((".zst", ".gz"))]
+        manifest = sb["home"] / ".claude" / "summon-archive" / "manifest.jsonl"
+        checks.update({
+            "applied": rc == 0 and meta.get("count") == 2
+                       and meta.get("codec") in ("zstd", "gzip"),
+            "cold-only": len(archived) == 2 and not healthy.exists()
+                         and not mismatch.exists() and moved.exists(),
+            "mtime-kept": any(p.stat().st_mtime_ns == old_ns for p in archived),
+            "manifest": manifest.exists() and len(manifest.read_text().splitlines()) == 2,
+        })
+        after, again = rich(), rich()
+        keys = ("events", "toolCalls", "densityBuckets", "durationMin", "firstAsk")
+        checks["rich-same"] = (before and after == again and all(
+            {k: before[c][k] for k in keys} == {k: after[c][k] for k in keys}
+            for c in ("cli-healthy", "cli-mismatch")))
+        checks["path"] = after.get("cli-healthy", {}).get("transcriptPath", "").endswith(
+            (".jsonl.zst", ".jsonl.gz"))
+        rc_s, out_s, _ = run_mode(env, ["search", "quasar-lattice", "--json"])
+        checks["search"] = rc_s == 0 and [h["cliSessionId"] for h in json.loads(out_s)["data"]] \
+            == ["cli-healthy"]
+        rc_p, out_p, _ = run_mode(env, ["--peek", "bbbb"])
+        checks["peek"] = rc_p == 0 and "step 39 of the quasar-lattice" in out_p
+        rc_d, out_d, _ = run_mode(env, ["doctor", "--json"])
+        checks["doctor"] = json.loads(out_d)["meta"]["transcriptMissing"] == 0
+
+        rc_r, _, _ = run_mode(env, ["archive", "--restore", "bbbb"])
+        checks["restore"] = (rc_r == 0 and healthy.exists() and healthy.read_bytes() == original
+                             and healthy.stat().st_mtime_ns == old_ns
+                             and not any(p.exists() for p in archived
+                                         if p.name.startswith("cli-healthy")))
+
+        # handed back to a model or to Claude Code, an archive is restored first
+        rc_rec, out_rec, _ = run_mode(env, ["recover", "cccc-mismatch", "--no-distill"])
+        checks["recover-restores"] = (rc_rec == 0 and f"Transcript: {mismatch}\n" in out_rec
+                                      and mismatch.is_file())
+        run_mode(env, ["archive", "--older-than", "60d", "--apply"])  # both cold again
+        new_wt = sb["new_wt"].resolve()
+        rc_rb, _, _ = run_mode(env, ["rebind", "bbbb", "--cwd", str(new_wt)])
+        bridged = projects / encode_cwd(str(new_wt)) / "cli-healthy.jsonl"
+        checks["rebind-restores"] = (rc_rb == 0 and bridged.is_file()
+                                     and bridged.read_bytes() == original and healthy.is_file()
+                                     and not list(bridged.parent.glob("*.jsonl.*")))
+        moved_good = (tmp / "proj-good-moved")
+        moved_good.mkdir()
+        rc_px, _, _ = run_mode(env, ["rebind", "--from-prefix", str(tmp / "proj-good"),
+                                     "--to-prefix", str(moved_good)])
+        px = projects / encode_cwd(str(moved_good.resolve())) / "cli-mismatch.jsonl"
+        checks["prefix-rebind-restores"] = (rc_px == 0 and px.is_file() and mismatch.is_file()
+                                            and not list(px.parent.glob("*.jsonl.*")))
+        rc_bad, _, _ = run_mode(env, ["archive", "--older-than", "soon"])
+        checks["bad-age"] = rc_bad == 2
+
+        # a truncated archive is an unreadable transcript, not a traceback
+        import gzip
+        blob = gzip.compress("".join(json.dumps({"type": "user", "message": {
+            "content": f"line {i} " + "x" * 200}}) + "\n" for i in range(400)).encode())
+        damaged = moved.with_name(moved.name + ".gz")
+        damaged.write_bytes(blob[: len(blob) // 2])
+        moved.unlink()
+        mod = _load_summon_module()
+        try:
+            with mod.open_transcript(damaged) as fh:
+                sum(1 for _ in fh)
+            raised = None
+        except Exception as e:  # noqa: BLE001 — the type is the check
+            raised = e
+        rc_rich, out_rich, err_rich = run_mode(env, ["pick", "--json", "--rich", "--all"])
+        rc_st, _, err_st = run_mode(env, ["stats", "--json"])
+        rc_se, _, err_se = run_mode(env, ["search", "quasar-lattice", "--json"])
+        rc_pk, out_pk, _ = run_mode(env, ["--peek", "aaaa"])
+        rc_tl, _, err_tl = run_mode(env, ["timeline", "aaaa"])
+        checks["damaged-archive"] = (
+            isinstance(raised, OSError) and damaged.name in str(raised)
+            and rc_rich == 0 and rc_st == 0 and rc_se == 0
+            and "Traceback" not in err_rich + err_st + err_se + err_tl
+            and rc_pk == 2 and "damaged archive" in out_pk
+            and rc_tl == 1 and "timeline failed" in err_tl
+            and "cli-moved" in out_rich)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok(f"archive compresses cold transcripts ({meta.get('codec')}), readers see through it")
+    else:
+        no("archive compresses cold transcripts, readers see through it",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
+STARTUP_LAZY = ("dataclasses", "uuid", "tempfile", "concurrent.futures", "subprocess",
+                "socket")
+
+
+def startup_tests() -> None:
+    """41. Start-up budget: --help and pick --json stay fast and import-lean."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-startup-"))
+    budget = float(os.environ.get("SUMMON_STARTUP_BUDGET_MS", "1000"))
+    try:
+        home = tmp / "home"
+        env = dict(os.environ, HOME=str(home), USERPROFILE=str(home),
+                   APPDATA=str(home / "AppData" / "Roaming"), SUMMON_NO_SERVE="1")
+        env.pop("PYTHONDONTWRITEBYTECODE", None)  # measure the cached-bytecode launch
+        ws = claude_dir(env) / "claude-code-sessions" / SRC_UUID / "11111111-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
+        ws.mkdir(parents=True)
+        (ws / "local_idle.json").write_text(json.dumps({
+            "sessionId": "local_idle", "cliSessionId": "cli-idle", "title": "idle",
+            "cwd": "", "lastActivityAt": 0}), encoding="utf-8")
+
+        def launch(argv: list[str], *flags: str) -> subprocess.CompletedProcess:
+            # the bin/summon launcher: import the module, don't run it as a script
+            return subprocess.run(
+                [sys.executable, *flags, "-c",
+                 "import sys; sys.argv[0] = 'summon'; sys.path.insert(0, sys.argv.pop(1)); "
+                 "from summon import main; main()", str(SCRIPT.parent), *argv],
+                env=env, capture_output=True, text=True, timeout=60)
+
+        def imported(r: subprocess.CompletedProcess) -> set[str]:
+            return {ln.rsplit("|", 1)[1].strip() for ln in r.stderr.splitlines()
+                    if ln.startswith("import time:")}
+
+        bare = imported(subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                                       env=env, capture_output=True, text=True, timeout=60))
+        checks, best = {}, {}
+        for name, argv in (("help", ["--help"]), ("pick", ["pick", "--json"])):
+            launch(argv)  # warm the bytecode cache
+            runs = []
+            for _ in range(3):
+                t0 = time.perf_counter()
+                r = launch(argv)
+                runs.append((time.perf_counter() - t0) * 1000)
+            best[name] = round(min(runs))
+            checks[f"{name}-rc"] = r.returncode == 0
+            checks[f"{name}-budget"] = best[name] <= budget
+            eager = (imported(launch(argv, "-X", "importtime")) - bare) & set(STARTUP_LAZY)
+            checks[f"{name}-lazy"] = not eager
+            if eager:
+                best[f"{name}-eager"] = sorted(eager)
+        checks["pick-empty"] = json.loads(launch(["pick", "--json"]).stdout)["data"] == []
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok(f"start-up under {budget:.0f} ms (--help {best['help']} ms, pick --json "
+           f"{best['pick']} ms) without the lazy imports")
+    else:
+        no("start-up stays under budget without the lazy imports",
+           f"failed={[k for k, v in checks.items() if not v]} {best}")
+
+
+def ndjson_tests() -> None:
+    """42. pick --ndjson: row-per-line streaming with a trailing meta record."""
+    tmp = Path(tempfile.mkdtemp(prefix="summon-ndjson-"))
+    checks = {}
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, ws = dict(sb["env"], SUMMON_NO_SERVE="1"), sb["ws"]
+        now_ms = int(time.time() * 1000)
+        for i in range(60):
+            (ws / f"local_bulk-{i:02d}.json").write_text(json.dumps({
+                "sessionId": f"local_bulk-{i:02d}", "cliSessionId": f"cli-bulk-{i:02d}",
+                "title": f"bulk {i}", "cwd": str(sb["new_root"]), "completedTurns": 1,
+                "lastActivityAt": now_ms - (i + 10) * 60_000}), encoding="utf-8")
+        rc_j, out_j, _ = run_mode(env, ["pick", "--json", "--rich", "--all"])
+        rc_n, out_n, err_n = run_mode(env, ["pick", "--ndjson", "--rich", "--all"])
+        lines = out_n.splitlines()
+        records = [json.loads(ln) for ln in lines]
+        want = json.loads(out_j)["data"] if rc_j == 0 else None
+        checks.update({
+            "rc": rc_j == 0 and rc_n == 0 and not err_n,
+            "rows": records[:-1] == want and len(want) == 63,
+            "meta": records[-1] == {"meta": {"count": 63, "format": "ndjson",
+                                             "schema": "claude-mods.summon.pick/v2"}},
+            "compact": all(ln.isascii() and ln.startswith("{") for ln in lines),
+        })
+        proc = subprocess.Popen([sys.executable, str(SCRIPT), "pick", "--ndjson", "--rich",
+                                 "--all"], env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        first = proc.stdout.readline()
+        proc.stdout.close()
+        err = proc.stderr.read().decode("utf-8", "replace")
+        checks["hang-up"] = (proc.wait(timeout=60) == 0 and json.loads(first)["id"]
+                             and "Traceback" not in err)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-ndjson-scan-"))
+    saved = os.environ.get("SUMMON_NO_CACHE")
+    os.environ["SUMMON_NO_CACHE"] = "1"
+    try:
+        paths = []
+        for i in range(3):
+            p = tmp / f"t{i}.jsonl"
+            p.write_text(json.dumps({"type": "user", "message": {"content": f"ask {i}"},
+                                     "timestamp": "2026-07-01T00:00:00.000Z"}) + "\n",
+                         encoding="utf-8")
+            paths.append(p)
+        calls = []
+        real = mod._analyze
+        mod._analyze = lambda *a: calls.append(a[0]) or real(*a)
+        stream = mod._scan_rich_metrics(paths, 1)
+        head = next(stream)
+        checks["lazy"] = len(calls) == 1
+        mod._analyze = real
+        checks["same"] = [head, *stream] == mod._rich_metrics(paths, 1)
+
+        # an abandoned parallel scan cancels the queued work, no drain
+        import concurrent.futures as cf
+        shutdowns = []
+
+        class Pool(cf.ProcessPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        real_pool, real_min = cf.ProcessPoolExecutor, mod.RICH_PARALLEL_MIN_BYTES
+        cf.ProcessPoolExecutor, mod.RICH_PARALLEL_MIN_BYTES = Pool, 0
+        try:
+            stream = mod._scan_rich_metrics(paths, 2)
+            next(stream)
+            stream.close()
+        finally:
+            cf.ProcessPoolExecutor, mod.RICH_PARALLEL_MIN_BYTES = real_pool, real_min
+        checks["close-cancels"] = shutdowns[:1] == [(False, True)]
+    finally:
+        if saved is None:
+            os.environ.pop("SUMMON_NO_CACHE", None)
+        else:
+            os.environ["SUMMON_NO_CACHE"] = saved
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok("pick --ndjson streams rows as they are built, meta record last")
+    else:
+        no("pick --ndjson streams rows as they are built, meta record last",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
+def session_record_tests() -> None:
+    """43. Slotted Session: listing fields kept, the wrapper dict re-read on demand."""
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-slots-"))
+    acct = mod.Account(uuid=SRC_UUID, sessions_dir=tmp)
+    try:
+        wrapper = {"sessionId": "local_slot", "cliSessionId": "cli-slot", "title": "slotted",
+                   "cwd": str(tmp / "old"), "lastActivityAt": 1_700_000_000_000,
+                   "completedTurns": "12", "branch": "main", "model": "opus", "isArchived": 1,
+                   "originCwd": str(tmp / "old"), "mcpServers": {"x": {"cmd": "y" * 2048}}}
+        f = tmp / "local_slot.json"
+        f.write_text(json.dumps(wrapper), encoding="utf-8")
+        s = mod.Session(path=f, data=json.loads(f.read_text(encoding="utf-8")), account=acct)
+        checks = {
+            "slotted": not hasattr(s, "__dict__"),
+            "fields": (s.sid, s.cli_id, s.title, s.turns, s.last_activity_ms, s.branch,
+                       s.model, s.effort, s.archived)
+                      == ("local_slot", "cli-slot", "slotted", 12, 1_700_000_000_000,
+                          "main", "opus", "", True),
+            "data": s.data == wrapper,
+        }
+
+        def kept(build) -> int:
+            tracemalloc.start()
+            try:
+                out = build()  # noqa: F841 — alive while measured
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        raw = f.read_text(encoding="utf-8")
+        dicts = kept(lambda: [json.loads(raw) for _ in range(200)])
+        sessions = kept(lambda: [mod.Session(path=f, data=json.loads(raw), account=acct)
+                                 for _ in range(200)])
+        checks["compact"] = sessions * 4 < dicts
+
+        wrapper["permissionMode"] = "plan"  # edited after the session was loaded
+        f.write_text(json.dumps(wrapper), encoding="utf-8")
+        backups = tmp / "backups"
+        new_cwd = str(tmp / "new")
+        rewrote = mod._rewrite_wrapper(s, new_cwd, backups)
+        on_disk = json.loads(f.read_text(encoding="utf-8"))
+        checks["rewrite"] = (rewrote and on_disk["cwd"] == new_cwd
+                             and on_disk["originCwd"] == new_cwd
+                             and on_disk["permissionMode"] == "plan"
+                             and on_disk["mcpServers"] == wrapper["mcpServers"])
+        f.write_text("{half a wrapp", encoding="utf-8")
+        shutil.rmtree(backups)
+        checks["unreadable"] = (mod._rewrite_wrapper(s, new_cwd, backups) is False
+                                and not backups.exists())
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok(f"Session is slotted and compact ({sessions // 200} vs {dicts // 200} B per "
+           "wrapper), .data re-read on demand")
+    else:
+        no("Session is slotted and compact, .data re-read on demand",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
+def account_cache_tests() -> None:
+    """44. discover_accounts: cached per account, validated by dir mtimes."""
+    mod = _load_summon_module()
+    tmp = Path(tempfile.mkdtemp(prefix="summon-accounts-"))
+    keys = ("HOME", "USERPROFILE", "APPDATA", "SUMMON_NO_CACHE")
+    saved = {k: os.environ.get(k) for k in keys}
+    checks = {}
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        os.environ.update({k: sb["env"][k] for k in keys[:3]})
+        os.environ.pop("SUMMON_NO_CACHE", None)
+        cdir = claude_dir(sb["env"])
+        agent_ws = cdir / "local-agent-mode-sessions" / SRC_UUID / "agent-ws"
+        agent_ws.mkdir(parents=True)
+        stamps = itertools.count(int(time.time()) - 3600, 10)
+
+        def age(*dirs: Path) -> None:  # dirs touched "just now" aren't trusted
+            when = next(stamps)
+            for d in dirs or (sb["ws"], sb["ws"].parent, agent_ws, agent_ws.parent):
+                os.utime(d, (when, when))
+
+        scans = []
+        real_iter, real_email = mod._iter_session_files, mod._find_account_email
+        mod._iter_session_files = lambda d: scans.append("list") or real_iter(d)
+        mod._find_account_email = lambda r, u: scans.append("email") or real_email(r, u)
+
+        def discover() -> list:
+            scans.clear()
+            mod._INDEX_CONN = None
+            return mod.discover_accounts(cdir)
+
+        age()
+        cold = discover()
+        warm = discover()
+        checks["warm-hit"] = warm == cold and scans == [] and cold[0].session_count == 3
+        os.environ["SUMMON_NO_CACHE"] = "1"
+        checks["no-cache"] = discover() == cold
+        os.environ.pop("SUMMON_NO_CACHE")
+
+        (sb["ws"] / "local_dddd-new.json").write_text(json.dumps({
+            "sessionId": "local_dddd-new", "cliSessionId": "cli-new", "title": "new",
+            "cwd": "", "lastActivityAt": 1}), encoding="utf-8")
+        age()
+        grown = discover()
+        checks["new-wrapper"] = grown[0].session_count == 4 and "list" in scans
+        checks["rehit"] = discover() == grown and scans == []
+
+        def scanned_at() -> float:
+            return mod._index_db().execute(
+                "SELECT scanned_at FROM accounts WHERE uuid = ?", (SRC_UUID,)).fetchone()[0]
+
+        counted_at = scanned_at()
+        (agent_ws / "local_agent.json").write_text(json.dumps(
+            {"emailAddress": "dev@example.com"}), encoding="utf-8")
+        age(agent_ws)
+        time.sleep(0.01)
+        found = discover()
+        checks["email"] = found[0].email == "dev@example.com" and scans == ["email"]
+        # a late email doesn't re-date the cached count
+        checks["email-keeps-age"] = scanned_at() == counted_at
+        checks["email-kept"] = discover()[0].email == "dev@example.com" and scans == []
+
+        max_age = mod.ACCOUNT_CACHE_MAX_AGE_S
+        mod.ACCOUNT_CACHE_MAX_AGE_S = 0
+        checks["max-age"] = discover() == found and "list" in scans
+        mod.ACCOUNT_CACHE_MAX_AGE_S = max_age
+        mod._iter_session_files, mod._find_account_email = real_iter, real_email
+    finally:
+        if mod._INDEX_CONN:
+            mod._INDEX_CONN.close()
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok("discover_accounts answers warm starts from the account cache")
+    else:
+        no("discover_accounts answers warm starts from the account cache",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
+def timeline_tests() -> None:
+    """45. summon timeline: tool latency distributions, idle gaps, Chrome trace."""
+    rng = random.Random(45)
+    tmp = Path(tempfile.mkdtemp(prefix="summon-timeline-"))
+    checks = {}
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env = dict(sb["env"], SUMMON_NO_SERVE="1")
+        transcript = next(sb["projects"].glob("*/cli-healthy.jsonl"))
+        t0 = 1_782_900_000_000
+        stamp = lambda ms: time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ms // 1000)) \
+            + f".{ms % 1000:03d}Z"
+        lines, want, idle, now = [], {}, [], t0
+
+        def record(typ: str, ms: int, content) -> None:
+            lines.append(json.dumps({"type": typ, "timestamp": stamp(ms),
+                                     "message": {"role": typ, "content": content}}))
+
+        record("user", now, "start the quasar audit")
+        for turn in range(60):
+            now += 1500
+            batch = [(f"tu{turn}-{k}", rng.choice(["Bash", "Read", "Grep"]),
+                      rng.randint(5, 40_000)) for k in range(rng.choice([1, 1, 2, 3]))]
+            record("assistant", now, [{"type": "tool_use", "id": i, "name": n, "input": {}}
+                                      for i, n, _ in batch])
+            start = now
+            for i, n, took in sorted(batch, key=lambda b: b[2]):
+                failed = took % 7 == 0
+                record("user", start + took, [{"type": "tool_result", "tool_use_id": i,
+                                               "content": "x" * 50, "is_error": failed}])
+                want.setdefault(n, []).append((took, failed))
+            now = start + max(b[2] for b in batch) + 800
+            record("assistant", now, [{"type": "text", "text": "done"}])
+            if turn % 6 == 5:
+                gap = rng.randint(10_000, 900_000)
+                now += gap
+                idle.append(gap)
+                record("user", now, f"next step {turn}")
+        record("assistant", now + 10, [{"type": "tool_use", "id": "never", "name": "Bash",
+                                        "input": {}}])
+        record("user", now + 20, [{"type": "tool_result", "tool_use_id": "ghost",
+                                   "content": ""}])
+        transcript.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        trace = tmp / "t.trace.json"
+        rc, out, err = run_mode(env, ["timeline", "bbbb", "--json", "--limit", "3",
+                                      "--out", str(trace)])
+        env_t = json.loads(out) if rc == 0 else {"data": {}, "meta": {}}
+        data, meta = env_t["data"], env_t["meta"]
+
+        def nearest(vals: list[int], q: float) -> int:
+            vals = sorted(vals)
+            return vals[max(1, -(-int(q * len(vals) * 1000) // 1000)) - 1]
+
+        got = {t["tool"]: t for t in data.get("tools", [])}
+        close = lambda a, b: abs(a - b) <= max(1, b * 0.01)
+        checks["tools"] = set(got) == set(want) and all(
+            got[n]["calls"] == len(v) and got[n]["errors"] == sum(f for _, f in v)
+            and got[n]["totalMs"] == sum(t for t, _ in v)
+            and got[n]["maxMs"] == max(t for t, _ in v)
+            and close(got[n]["p50Ms"], nearest([t for t, _ in v], 0.5))
+            and close(got[n]["p95Ms"], nearest([t for t, _ in v], 0.95))
+            for n, v in want.items())
+        every = sorted((t for v in want.values() for t, _ in v), reverse=True)
+        checks["slowest"] = [c["ms"] for c in data.get("slowest", [])] == every[:3]
+        gaps = data.get("idle", {})
+        checks["idle"] = (gaps.get("gaps") == len(idle) and gaps.get("totalMs") == sum(idle)
+                          and gaps.get("maxMs") == max(idle)
+                          and [g["ms"] for g in gaps.get("longest", [])]
+                          == sorted(idle, reverse=True)[:3])
+        calls = sum(len(v) for v in want.values())
+        checks["meta"] = (rc == 0 and meta.get("schema") == "claude-mods.summon.timeline/v1"
+                          and meta.get("toolCalls") == calls + 1
+                          and meta.get("answered") == calls and meta.get("unanswered") == 1
+                          and meta.get("orphanResults") == 1 and meta.get("trace") == str(trace))
+        events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+        slices = [e for e in events if e["ph"] == "X"]
+        lanes: dict[int, list] = {}
+        for e in slices:
+            lanes.setdefault(e["tid"], []).append((e["ts"], e["ts"] + e["dur"]))
+        checks["trace"] = (len(slices) == calls + len(idle) and all(
+            a[1] <= b[0] for spans in lanes.values()
+            for a, b in zip(sorted(spans), sorted(spans)[1:])))
+
+        mod = _load_summon_module()
+        mod.TIMELINE_PENDING_MAX = 4
+        flood = tmp / "flood.jsonl"
+        flood.write_text("\n".join(json.dumps({
+            "type": "assistant", "timestamp": stamp(t0 + i),
+            "message": {"content": [{"type": "tool_use", "id": f"u{i}", "name": "Bash"}]}})
+            for i in range(10)) + "\n", encoding="utf-8")
+        capped = mod.tool_timeline(flood)["counts"]
+        checks["capped"] = capped["unanswered"] == 10 and capped["lanes"] <= 5
+        checks["usage"] = run_mode(env, ["timeline"])[0] == 2
+        checks["unknown"] = run_mode(env, ["timeline", "zzzz-nope"])[0] == 3
+
+        # a corrupt archive fails the run cleanly and leaves no half trace
+        import gzip
+        blob = bytearray(gzip.compress(transcript.read_bytes()))
+        mid = len(blob) // 2
+        blob[mid:mid + 64] = bytes(64)
+        transcript.with_name(transcript.name + ".gz").write_bytes(bytes(blob))
+        transcript.unlink()
+        broken = tmp / "broken.trace.json"
+        rc_c, _, err_c = run_mode(env, ["timeline", "bbbb", "--out", str(broken)])
+        checks["corrupt-archive"] = (rc_c == 1 and "timeline failed" in err_c
+                                     and "Traceback" not in err_c
+                                     and not list(tmp.glob("broken.trace.json*")))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if all(checks.values()):
+        ok("timeline pairs tool calls, reports latency percentiles, idle gaps and a trace")
+    else:
+        no("timeline pairs tool calls, reports latency percentiles, idle gaps and a trace",
+           f"failed={[k for k, v in checks.items() if not v]}")
+
+
 def asset_tests() -> None:
     """In-chat picker asset: present, injectable, and cited from SKILL.md.
 
@@ -842,6 +2549,124 @@ def asset_tests() -> None:
         no(name, f"failed={[k for k, v in checks.items() if not v]}")
 
 
+def dedupe_tests() -> None:
+    """46. summon dedupe: find duplicate transcript copies, hardlink exact ones."""
+    import hashlib
+    tmp = Path(tempfile.mkdtemp(prefix="summon-dedupe-"))
+    try:
+        sb = build_toolbox_sandbox(tmp)
+        env, projects = sb["env"], sb["projects"]
+        a = next(projects.glob("*/cli-healthy.jsonl"))
+        with a.open("a", encoding="utf-8") as fh:
+            for i in range(200):
+                fh.write(json.dumps({"type": "user", "message": {"content": f"turn {i}"}}) + "\n")
+        original = a.read_bytes()
+        dirs = {}
+        for name in ("B-copy", "C-link", "D-longer", "E-other", "F-live"):
+            dirs[name] = projects / f"X--{name}"
+            dirs[name].mkdir()
+        b = dirs["B-copy"] / a.name
+        shutil.copy2(a, b)
+        c = dirs["C-link"] / a.name
+        os.link(b, c)
+        d = dirs["D-longer"] / a.name
+        d.write_bytes(original + b'{"type": "user", "message": {"content": "later"}}\n')
+        other = dirs["E-other"] / "cli-other.jsonl"   # same bytes, another session
+        other.write_bytes(original)
+        old = time.time() - 86400
+        for p in projects.glob("*/*.jsonl"):
+            os.utime(p, (old, old))
+        mismatch = next(projects.glob("*/cli-mismatch.jsonl"))
+        live = dirs["F-live"] / mismatch.name          # fresh: inside the quiet window
+        shutil.copyfile(mismatch, live)
+        a_ino = a.stat().st_ino
+
+        def dedupe(*extra) -> tuple[int, dict]:
+            rc, out, _ = run_mode(env, ["dedupe", *extra, "--json"])
+            return rc, json.loads(out) if rc == 0 else {"data": [], "meta": {}}
+
+        rc, dry = dedupe()
+        meta = dry["meta"]
+        exact = [g for g in dry["data"] if g["kind"] == "exact"]
+        pairs = [g for g in dry["data"] if g["kind"] == "prefix"]
+        checks = {
+            "dry-exact": rc == 0 and len(exact) == 1 and exact[0]["keep"] in (str(b), str(c))
+                         and exact[0]["duplicates"] == [str(a)]
+                         and exact[0]["alreadyLinked"] == 1
+                         and exact[0]["sha256"] == hashlib.sha256(original).hexdigest(),
+            "dry-reclaim": meta.get("reclaimBytes") == len(original),
+            "prefix": len(pairs) == 2 and all(g["longer"] == str(d)
+                                              and g["extraBytes"] == d.stat().st_size - len(original)
+                                              for g in pairs)
+                      and {g["shorter"] for g in pairs} <= {str(a), str(b), str(c)},
+            "same-name-only": str(other) not in json.dumps(dry["data"]),
+            "quiet-window": meta.get("skippedActive", 0) >= 1
+                            and str(live) not in json.dumps(dry["data"]),
+            "dry-untouched": a.stat().st_ino == a_ino and meta.get("applied") is False,
+        }
+        rc_t, out_t, _ = run_mode(env, ["dedupe"])
+        checks["dry-panel"] = rc_t == 0 and "would hardlink 1" in out_t
+
+        rc, applied = dedupe("--apply")
+        meta = applied["meta"]
+        backup = Path(meta.get("backup", tmp / "none"))
+        saved = list(backup.glob("*cli-healthy.jsonl"))
+        checks.update({
+            "applied": rc == 0 and meta.get("linked") == 1 and not meta.get("failed"),
+            # the backup still holds the replaced inode: nothing is freed yet
+            "freeable-after-backup": meta.get("reclaimableAfterBackupDelete") == len(original)
+                                     and "reclaimedBytes" not in meta,
+            "linked": a.stat().st_ino == b.stat().st_ino and a.read_bytes() == original,
+            "backup": len(saved) == 1 and saved[0].read_bytes() == original,
+            "others-untouched": d.stat().st_ino != b.stat().st_ino
+                                and other.stat().st_ino != b.stat().st_ino,
+        })
+        rc, again = dedupe()
+        checks["rerun"] = (rc == 0 and again["meta"].get("exactGroups") == 0
+                           and again["meta"].get("reclaimBytes") == 0
+                           and again["meta"].get("prefixPairs") == 1)
+        rc, scoped = dedupe("cli-mis")
+        checks["id-filter"] = rc == 0 and scoped["data"] == []
+
+        mod = _load_summon_module()
+        # an edit after hashing that keeps the size is still caught, on
+        # either side, before anything is backed up or swapped
+        guard = tmp / "guard"
+        for side in ("dup", "keep"):
+            (guard / "k").mkdir(parents=True, exist_ok=True)
+            (guard / "d").mkdir(exist_ok=True)
+            k, dp = guard / "k" / "cli-g.jsonl", guard / "d" / "cli-g.jsonl"
+            for f in (k, dp):
+                f.write_bytes(original)
+            k_st, d_st = k.stat(), dp.stat()
+            edited = dp if side == "dup" else k
+            edited.write_bytes(original.replace(b"h", b"H", 1))
+            os.utime(edited, ns=(d_st.st_atime_ns, d_st.st_mtime_ns + 1_000_000))
+            try:
+                mod.collapse_duplicate(k, dp, guard / "backup", k_st, d_st)
+                caught = False
+            except OSError as e:
+                caught = "changed since hashing" in str(e)
+            checks[f"edited-{side}"] = (caught and dp.stat().st_ino != k.stat().st_ino
+                                        and not (guard / "backup").exists())
+            shutil.rmtree(guard)
+
+        mod.DEDUPE_CHUNK = 7
+        marks = [1, 6, 7, 8, 500, len(original)]
+        whole, at, n = mod._hash_prefixes(a, marks + [len(original) + 9])
+        checks["chunked"] = (whole == hashlib.sha256(original).hexdigest()
+                             and n == len(original) and set(at) == set(marks)
+                             and all(at[m] == hashlib.sha256(original[:m]).hexdigest()
+                                     for m in marks))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    name = "dedupe finds exact/prefix transcript copies, --apply hardlinks the exact ones"
+    if all(checks.values()):
+        ok(name)
+    else:
+        no(name, f"failed={[k for k, v in checks.items() if not v]}")
+
+
 def main() -> int:
     # 1. Piped selection honoured even with --yes (the original bug: --yes
     #    used to select ALL candidates, ignoring the piped picks).
@@ -953,6 +2778,72 @@ def main() -> int:
     # 24. summon widget: one-shot finished card-picker HTML builder
     widget_tests()
 
+    # 25. Persistent session index
+    index_tests()
+
+    # 26. Incremental transcript analysis checkpoints
+    analysis_cache_tests()
+
+    # 27. Parallel rich pass (--jobs)
+    parallel_rich_tests()
+
+    # 28. Reverse-chunked tail reader (peek + extraction)
+    reverse_reader_tests()
+
+    # 29. Transcript location index (resolve_transcript)
+    transcript_location_tests()
+
+    # 30. Full-text search mode
+    search_tests()
+
+    # 31. Batch distillation (recover --all)
+    batch_recover_tests()
+
+    # 32. Hot inventory daemon (summon serve)
+    serve_tests()
+
+    # 33. Benchmark harness smoke run
+    bench_tests()
+
+    # 34. Timestamp + density histogram fast paths
+    timestamp_tests()
+
+    # 35. Selective JSONL record decoding (type sniff, partial decode, orjson)
+    record_decode_tests()
+
+    # 36. --link transfer (reflink -> hardlink -> copy)
+    link_tests()
+
+    # 37. Bulk rebind by path prefix
+    bulk_rebind_tests()
+
+    # 38. Doctor: parallel deduped cwd stats, timeouts, phase timings
+    doctor_scan_tests()
+
+    # 39. Stats: usage rollup per project / model / day
+    stats_tests()
+
+    # 40. Archive: compress cold transcripts, transparent reads, restore
+    archive_tests()
+
+    # 41. Start-up: --help / pick --json under budget, lazy imports stay lazy
+    startup_tests()
+
+    # 42. pick --ndjson: streamed rows, trailing meta record
+    ndjson_tests()
+
+    # 43. Slotted Session records, lazy wrapper payloads
+    session_record_tests()
+
+    # 44. Account discovery cache validated by directory mtimes
+    account_cache_tests()
+
+    # 45. Timeline: tool latency profile + Chrome trace
+    timeline_tests()
+
+    # 46. Dedupe: exact / prefix duplicate transcripts, hardlink collapse
+    dedupe_tests()
+
     print(f"\nsummon tests: {PASS} passed, {FAIL} failed")
     return 1 if FAIL else 0
 